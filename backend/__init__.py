@@ -1,5 +1,20 @@
-from .data_generator import UniversalDataGenerator
-from .database_handler import DatabaseHandler
-from .validation import DataValidator
+import importlib
 
-__all__ = ['UniversalDataGenerator', 'DatabaseHandler', 'DataValidator']
\ No newline at end of file
+_EXPORTS = {
+    'UniversalDataGenerator': '.data_generator',
+    'DatabaseHandler': '.database_handler',
+    'DataValidator': '.validation',
+    'Reporter': '.reporting',
+    'ConsoleReporter': '.reporting',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Resolve exports on first use so the CLI doesn't pay for pandas/scipy/pymysql up front
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -0,0 +1,176 @@
+import os
+import sqlite3
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from pymysql import IntegrityError, MySQLError
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from .reporting import Reporter
+
+
+DEFAULT_BATCH_ROWS = 5_000
+DEFAULT_COMMIT_ROWS = 100_000
+DB_ERRORS = (MySQLError, sqlite3.Error)
+
+
+def is_sqlite(connection) -> bool:
+    return isinstance(connection, sqlite3.Connection)
+
+
+def quote_identifier(name: str) -> str:
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def iter_dataframes(data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> Iterator[pd.DataFrame]:
+    if isinstance(data, pd.DataFrame):
+        yield data
+    else:
+        yield from data
+
+
+def to_python_rows(chunk: pd.DataFrame) -> List[tuple]:
+    # DB drivers only escape builtin types, so NumPy scalars and NaN/NaT are converted up front
+    columns = []
+    for col in chunk.columns:
+        series = chunk[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # pandas Timestamps are not a type drivers know how to bind; datetime.datetime is
+            values = np.array(series.dt.to_pydatetime(), dtype=object)
+        else:
+            values = series.to_numpy(dtype=object, copy=True)
+        values[series.isna().to_numpy()] = None
+        columns.append(values.tolist())
+    return list(zip(*columns))
+
+
+def to_load_data_text(chunk: pd.DataFrame) -> str:
+    # Tab-separated with backslash escapes and \N for NULL, matching LOAD DATA's defaults
+    fields = []
+    for col in chunk.columns:
+        series = chunk[col]
+        nulls = series.isna()
+        if pd.api.types.is_bool_dtype(series):
+            # Nullable booleans hold NA, which has no int8 form; the mask below turns it into \N
+            text = series.astype('Int8').astype(str)
+        else:
+            text = series.astype(str)
+            if not pd.api.types.is_numeric_dtype(series):
+                text = (text.str.replace('\\', '\\\\', regex=False)
+                            .str.replace('\t', '\\t', regex=False)
+                            .str.replace('\n', '\\n', regex=False)
+                            .str.replace('\r', '\\r', regex=False))
+        fields.append(text.mask(nulls, '\\N'))
+
+    if not fields:
+        return ''
+    lines = fields[0].str.cat(fields[1:], sep='\t') if len(fields) > 1 else fields[0]
+    return '\n'.join(lines.tolist()) + '\n'
+
+
+class BulkLoader:
+    # LOAD DATA LOCAL always skips rows that hit a duplicate key (the server treats LOCAL as
+    # IGNORE). With ignore=False a chunk that loses rows is rolled back and raised as an
+    # IntegrityError instead, as a plain INSERT would.
+    def __init__(self, connection, reporter: Reporter = None, batch_rows: int = DEFAULT_BATCH_ROWS,
+                 commit_rows: int = DEFAULT_COMMIT_ROWS, ignore: bool = True):
+        self.connection = connection
+        self.reporter = reporter if reporter is not None else Reporter()
+        self.batch_rows = batch_rows
+        self.commit_rows = commit_rows
+        self.ignore = ignore
+        # Rows inserted since the last commit; kept across chunks so that streams of small
+        # chunks still commit every commit_rows
+        self._uncommitted = 0
+
+    def load(self, table_name: str, data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+             method: str = 'auto') -> Dict[str, Any]:
+        if method not in ('auto', 'load_data', 'batched'):
+            raise ValueError(f"Unknown bulk load method: {method}")
+        if is_sqlite(self.connection):
+            method = 'batched'
+
+        self._uncommitted = 0
+        started = time.perf_counter()
+        rows = 0
+        affected = 0
+        for chunk in iter_dataframes(data):
+            if len(chunk) == 0:
+                continue
+            if method in ('auto', 'load_data'):
+                try:
+                    affected += self._load_data_chunk(table_name, chunk)
+                    method = 'load_data'
+                except MySQLError as err:
+                    if method == 'load_data' or isinstance(err, IntegrityError):
+                        raise
+                    # LOCAL INFILE is often disabled server- or client-side; batched inserts always work
+                    self.connection.rollback()
+                    self.reporter.info(f"LOAD DATA LOCAL INFILE unavailable ({err}), using batched inserts")
+                    method = 'batched'
+            if method == 'batched':
+                affected += self._insert_chunk(table_name, chunk)
+            rows += len(chunk)
+            self.reporter.status(f"Loaded {rows} rows into {table_name}...")
+
+        self.connection.commit()
+        elapsed = time.perf_counter() - started
+        return {
+            'table': table_name,
+            'method': method if method != 'auto' else 'batched',
+            'rows': rows,
+            'inserted': affected,
+            'seconds': elapsed,
+            'rows_per_sec': rows / elapsed if elapsed > 0 else float('inf'),
+        }
+
+    def _load_data_chunk(self, table_name: str, chunk: pd.DataFrame) -> int:
+        columns = ', '.join(quote_identifier(col) for col in chunk.columns)
+        fd, path = tempfile.mkstemp(suffix='.tsv')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(to_load_data_text(chunk))
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE {quote_identifier(table_name)} "
+                    f"CHARACTER SET utf8mb4 ({columns})",
+                    (path,)
+                )
+                affected = cursor.rowcount
+            if not self.ignore and affected < len(chunk):
+                self.connection.rollback()
+                raise IntegrityError(
+                    f"LOAD DATA skipped {len(chunk) - affected} of {len(chunk)} rows for {table_name} "
+                    f"(duplicate keys or invalid values)"
+                )
+            self.connection.commit()
+            return affected
+        finally:
+            os.remove(path)
+
+    def _insert_chunk(self, table_name: str, chunk: pd.DataFrame) -> int:
+        sqlite = is_sqlite(self.connection)
+        columns = ', '.join(quote_identifier(col) for col in chunk.columns)
+        placeholders = ', '.join(['?' if sqlite else '%s'] * len(chunk.columns))
+        if self.ignore:
+            verb = "INSERT OR IGNORE" if sqlite else "INSERT IGNORE"
+        else:
+            verb = "INSERT"
+        query = f"{verb} INTO {quote_identifier(table_name)} ({columns}) VALUES ({placeholders})"
+
+        affected = 0
+        cursor = self.connection.cursor()
+        try:
+            for start in range(0, len(chunk), self.batch_rows):
+                batch = to_python_rows(chunk.iloc[start:start + self.batch_rows])
+                # pymysql rewrites executemany of INSERT ... VALUES into multi-row statements
+                cursor.executemany(query, batch)
+                affected += max(cursor.rowcount, 0)
+                self._uncommitted += len(batch)
+                if self._uncommitted >= self.commit_rows:
+                    self.connection.commit()
+                    self._uncommitted = 0
+        finally:
+            cursor.close()
+        return affected
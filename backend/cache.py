@@ -0,0 +1,110 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sdf", "profiles")
+DEFAULT_MAX_BYTES = 1024 ** 3
+CACHE_VERSION = 6
+_HASH_BLOCK = 4 * 1024 * 1024
+
+
+def make_key(*parts) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"v{CACHE_VERSION}".encode())
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(repr(part).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def file_content_hash(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ProfileCache:
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self._discard(path)
+            return None
+
+        # Access time is tracked through mtime, which drives LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._discard(tmp_path)
+            raise
+        self.evict()
+
+    def file_fingerprint(self, path: str, hasher: Callable[[str], str] = None) -> str:
+        # Re-hashing a large unchanged file is avoided by memoizing on (path, size, mtime)
+        hasher = hasher if hasher is not None else file_content_hash
+        stat = os.stat(path)
+        stat_key = make_key('stat', os.path.abspath(path), stat.st_size, stat.st_mtime_ns, hasher.__name__)
+        content_hash = self.get(stat_key)
+        if content_hash is None:
+            content_hash = hasher(path)
+            self.put(stat_key, content_hash)
+        return content_hash
+
+    def evict(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.pkl'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._discard(path)
+            total -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                self._discard(os.path.join(self.directory, name))
+
+    def _discard(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
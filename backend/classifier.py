@@ -0,0 +1,164 @@
+import re
+from typing import Dict, FrozenSet, List, Tuple
+
+
+# (provider, patterns) in priority order: when several rules match a column name, the earliest
+# wins. Patterns are regex fragments matched against whole snake_case tokens of the normalized
+# name, so 'id' matches 'customer_id' but not 'paid', and 'age' does not match 'page'.
+COLUMN_RULES: List[Tuple[str, List[str]]] = [
+    # Multi-word names come before their generic parts ('date_of_birth' before 'date')
+    ('date_of_birth', [r'date_?of_?birth', r'birth_?date', r'birthday', r'dob']),
+    ('first_name', [r'first_?name', r'given_?name', r'fname']),
+    ('last_name', [r'last_?name', r'surname', r'family_?name', r'lname']),
+    ('username', [r'user_?name', r'login']),
+    ('user_agent', [r'user_?agent']),
+    ('job', [r'job_?title', r'job', r'occupation', r'profession']),
+    ('credit_card', [r'credit_?card', r'card_?number']),
+    ('email', [r'e_?mail']),
+    ('phone', [r'phone(?:_?(?:number|no))?', r'telephone']),
+    ('mobile', [r'mobile', r'cell_?phone']),
+    ('password', [r'password', r'passwd']),
+    ('ip', [r'ip', r'ipv4', r'ip_?address']),
+    ('zip', [r'zip(?:_?code)?']),
+    ('postal', [r'postal(?:_?code)?', r'post_?code']),
+    # A trailing 'id' names an identifier whatever it identifies ('car_id' is not a car)
+    ('id', [r'[a-z0-9_]*_id$']),
+
+    # Location
+    ('address', [r'address']),
+    ('street', [r'street', r'road', r'avenue']),
+    ('city', [r'city', r'town']),
+    ('state', [r'state', r'province', r'region']),
+    ('country', [r'country']),
+    ('location', [r'location']),
+
+    # Named entities outrank a bare 'name' ('company_name' is a company)
+    ('company', [r'company', r'employer', r'organi[sz]ation']),
+    ('industry', [r'industry']),
+    ('brand', [r'brand']),
+    ('product', [r'product']),
+    ('school', [r'school']),
+    ('university', [r'university', r'college']),
+    ('hospital', [r'hospital']),
+    ('doctor', [r'doctor', r'physician']),
+    ('disease', [r'disease', r'diagnosis']),
+    ('car', [r'car', r'vehicle']),
+    ('license', [r'license(?:_?plate)?', r'licence']),
+    ('ssn', [r'ssn']),
+    ('passport', [r'passport']),
+    ('iban', [r'iban']),
+    ('currency', [r'currency']),
+    ('url', [r'url', r'website', r'homepage']),
+    ('domain', [r'domain']),
+    ('color', [r'colou?r']),
+    ('name', [r'name', r'full_?name']),
+
+    # Dates and times
+    ('year', [r'year']),
+    ('month', [r'month']),
+    ('time', [r'time(?:stamp)?']),
+    ('date', [r'date']),
+
+    # Identifiers and measures
+    ('id', [r'id', r'identifier']),
+    ('age', [r'age']),
+    ('salary', [r'salary', r'wage', r'income']),
+    ('price', [r'price']),
+    ('quantity', [r'quantity', r'qty']),
+    ('score', [r'score']),
+    ('rating', [r'rating']),
+    ('serial', [r'serial(?:_?number)?', r'serial_?no']),
+    ('is_', [r'is', r'has']),
+    ('active', [r'active', r'enabled']),
+    ('status', [r'status']),
+    ('gender', [r'gender', r'sex']),
+    ('grade', [r'grade']),
+
+    # Broad fallbacks
+    ('first', [r'first', r'given']),
+    ('last', [r'last', r'family']),
+    ('number', [r'number', r'num', r'count', r'total', r'amount']),
+    ('percent', [r'percent(?:age)?', r'pct', r'rate', r'ratio']),
+]
+
+DEFAULT_PROVIDER = 'word'
+
+# Words run together without a separator ('userid', 'isactive') are split at these affixes,
+# but only when the rest is a known word too, so 'paid', 'valid' and 'island' stay whole
+COMPOUND_SUFFIXES = ('id', 'name', 'email', 'price', 'date', 'time', 'address', 'number', 'no', 'code')
+COMPOUND_PREFIXES = ('is', 'has', 'email', 'phone')
+# Words seen in front of (or after) the affixes besides the rules' own words
+COMPOUND_WORDS = frozenset({
+    'user', 'customer', 'client', 'order', 'employee', 'student', 'account', 'item', 'invoice',
+    'transaction', 'session', 'patient', 'member', 'vendor', 'supplier', 'store', 'category',
+    'payment', 'create', 'created', 'update', 'updated', 'modified', 'start', 'end', 'due',
+    'unit', 'full', 'email', 'phone', 'deleted', 'verified', 'valid', 'admin', 'paid',
+})
+
+_CAMEL_LOWER_UPPER = re.compile(r'([a-z0-9])([A-Z])')
+_CAMEL_ACRONYM = re.compile(r'([A-Z]+)([A-Z][a-z])')
+_SEPARATORS = re.compile(r'[^a-z0-9]+')
+
+
+def _known_words(rules: List[Tuple[str, List[str]]]) -> FrozenSet[str]:
+    plain = {pattern for _, patterns in rules for pattern in patterns if pattern.isalpha()}
+    return frozenset(plain) | COMPOUND_WORDS
+
+
+_KNOWN_WORDS = _known_words(COLUMN_RULES)
+
+
+def _split_compound(token: str) -> str:
+    for suffix in COMPOUND_SUFFIXES:
+        stem = token[:-len(suffix)]
+        if token.endswith(suffix) and stem in _KNOWN_WORDS:
+            return f"{stem}_{suffix}"
+    for prefix in COMPOUND_PREFIXES:
+        rest = token[len(prefix):]
+        if token.startswith(prefix) and rest in _KNOWN_WORDS:
+            return f"{prefix}_{rest}"
+    return token
+
+
+def normalize_column_name(column_name: str) -> str:
+    # 'customerID', 'Customer ID', 'customer-id' and 'customerid' all become 'customer_id'
+    name = _CAMEL_ACRONYM.sub(r'\1_\2', _CAMEL_LOWER_UPPER.sub(r'\1_\2', str(column_name)))
+    tokens = _SEPARATORS.sub('_', name.lower()).strip('_').split('_')
+    return '_'.join(_split_compound(token) for token in tokens)
+
+
+class ColumnClassifier:
+    def __init__(self, rules: List[Tuple[str, List[str]]] = None, default: str = DEFAULT_PROVIDER):
+        self.rules = list(COLUMN_RULES if rules is None else rules)
+        self.default = default
+        self._cache: Dict[str, str] = {}
+
+        # One alternation per rule, tried in priority order at every token start. The lookahead
+        # keeps matches zero-width so overlapping candidates are all seen in a single scan.
+        alternatives = '|'.join(
+            f"(?P<r{i}>{'|'.join(patterns)})" for i, (_, patterns) in enumerate(self.rules)
+        )
+        self._pattern = re.compile(f"(?<![a-z0-9])(?=(?:{alternatives})(?![a-z0-9]))")
+
+    def classify(self, column_name: str) -> str:
+        provider = self._cache.get(column_name)
+        if provider is None:
+            provider = self._classify(normalize_column_name(column_name))
+            self._cache[column_name] = provider
+        return provider
+
+    def _classify(self, name: str) -> str:
+        best = len(self.rules)
+        for match in self._pattern.finditer(name):
+            best = min(best, int(match.lastgroup[1:]))
+        return self.rules[best][0] if best < len(self.rules) else self.default
+
+    def tokens(self, column_name: str) -> FrozenSet[str]:
+        return frozenset(normalize_column_name(column_name).split('_'))
+
+
+DEFAULT_CLASSIFIER = ColumnClassifier()
+
+
+def classify_column(column_name: str) -> str:
+    return DEFAULT_CLASSIFIER.classify(column_name)
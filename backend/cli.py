@@ -0,0 +1,189 @@
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+
+DEFAULT_ROWS = 200
+
+
+def _row_count(value: str) -> int:
+    try:
+        rows = int(float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid row count: {value!r}")
+    if rows < 1:
+        raise argparse.ArgumentTypeError("row count must be at least 1")
+    return rows
+
+
+def _column_list(value: str) -> List[str]:
+    return [col.strip() for col in value.split(',') if col.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='sdf', description="Synthetic Data Factory command line interface")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help="generate a synthetic dataset")
+    source = generate.add_mutually_exclusive_group(required=True)
+    source.add_argument('--from-csv', metavar='PATH', help="extend an existing CSV (optionally compressed), "
+                                                           "Parquet or Arrow/Feather file")
+    source.add_argument('--columns', type=_column_list, metavar='NAMES',
+                        help="comma-separated column names to generate from scratch")
+    source.add_argument('--spec', metavar='PATH', help="generate from a YAML/JSON dataset spec")
+    generate.add_argument('--rows', type=_row_count, help="number of rows to generate (e.g. 5e6; default: the "
+                                                          "spec's rows, otherwise 200)")
+    generate.add_argument('--out', required=True, help="output path (.csv, .csv.gz or .parquet)")
+    generate.add_argument('--chunk-size', type=_row_count, help="rows per output block (default: the spec's "
+                                                                "chunk_size, otherwise 100000)")
+    generate.add_argument('--workers', type=int, default=1, help="worker processes for parallel generation")
+    generate.add_argument('--seed', type=int, help="base seed for reproducible output")
+    generate.add_argument('--streaming', action='store_true', help="profile the source CSV in chunks")
+    generate.add_argument('--select', type=_column_list, metavar='NAMES',
+                          help="comma-separated source columns to model; only these are read from the file")
+    generate.add_argument('--cache-dir', help="directory for cached column profiles (default: ~/.cache/sdf/profiles)")
+    generate.add_argument('--no-cache', action='store_true', help="always re-profile the source")
+    generate.add_argument('--validate', action='store_true', help="validate the output against the source CSV")
+    generate.add_argument('--validation-method', choices=('auto', 'exact', 'sample', 'sketch'), default='auto',
+                          help="exact KS, stratified subsample or quantile sketches (auto: exact for small data)")
+    generate.add_argument('--min-quality', type=float, metavar='SCORE',
+                          help="stop generating once the running quality score drops below SCORE (implies --validate)")
+    generate.add_argument('--profile', action='store_true',
+                          help="print a per-stage timing and memory breakdown (slowest first)")
+    generate.add_argument('--metrics-out', metavar='PATH', help="write per-stage metrics in OpenMetrics text format")
+    generate.add_argument('-q', '--quiet', action='store_true', help="only print errors and the final summary")
+
+    return parser
+
+
+def run_generate(args) -> int:
+    from .cache import DEFAULT_CACHE_DIR, ProfileCache
+    from .data_generator import UniversalDataGenerator
+    from .metrics import Metrics
+    from .reporting import ConsoleReporter
+    from .writers import DEFAULT_CHUNK_ROWS, write_chunks
+
+    reporter = ConsoleReporter(verbose=not args.quiet)
+    cache = None if args.no_cache else ProfileCache(args.cache_dir or DEFAULT_CACHE_DIR)
+    metrics = Metrics()
+    generator = UniversalDataGenerator(reporter=reporter, seed=args.seed, cache=cache, metrics=metrics)
+    started = time.perf_counter()
+
+    original_df = None
+    if args.spec:
+        from .spec import DatasetSpec, compile_spec
+
+        spec = DatasetSpec.load(args.spec)
+        if args.seed is not None:
+            spec.seed = args.seed
+        plan = compile_spec(spec, generator)
+        args.rows = args.rows or spec.rows
+        if args.workers > 1:
+            reporter.warning("--workers is ignored with --spec; compiled plans run in one process")
+        chunks = plan.iter_chunks(args.rows, args.chunk_size or spec.chunk_size)
+    else:
+        args.rows = args.rows or DEFAULT_ROWS
+        chunk_size = args.chunk_size or DEFAULT_CHUNK_ROWS
+        if args.from_csv:
+            reporter.status(f"Profiling {args.from_csv}...")
+            profiler, original_df = generator.profile_csv(args.from_csv, args.streaming, columns=args.select)
+            source = profiler.profiles
+        else:
+            source = args.columns
+
+        if args.workers > 1:
+            from .parallel import ParallelGenerator
+            engine = ParallelGenerator(args.workers, seed=args.seed, generator=generator)
+        else:
+            engine = generator
+
+        if args.from_csv:
+            chunks = engine.iter_profile_chunks(source, args.rows, chunk_size, copula=profiler.copula,
+                                                missingness=profiler.missingness)
+        else:
+            chunks = engine.iter_column_chunks(source, args.rows, chunk_size)
+
+    # Sketch validation runs on the chunks as they stream past; exact and sampled
+    # validation need the finished output and re-read it afterwards
+    validate = args.validate or args.min_quality is not None
+    monitor = None
+    if validate and (args.validation_method in ('auto', 'sketch') or args.min_quality is not None):
+        from .validation import StreamingValidator
+        monitor = StreamingValidator(profiler.sketches(), min_quality=args.min_quality, reporter=reporter,
+                                     metrics=metrics)
+        chunks = monitor.observe_chunks(chunks)
+
+    reporter.status(f"Writing {args.rows} rows to {args.out}...")
+    # Chunks are produced lazily, so this stage includes generation; its own columns are broken out
+    with metrics.stage('generate_and_write') as run:
+        rows = write_chunks(chunks, args.out)
+        run.rows = rows
+    elapsed = time.perf_counter() - started
+    reporter.success(f"Wrote {rows} rows to {args.out} in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+
+    if monitor is not None:
+        _report_quality(monitor.validator, monitor.results(), reporter)
+    elif validate:
+        with metrics.stage('validation', method=args.validation_method):
+            _report_validation(original_df, args.out, reporter, args.validation_method)
+
+    if args.profile:
+        _report_profile(metrics)
+    if args.metrics_out:
+        with open(args.metrics_out, 'w') as f:
+            f.write(metrics.to_openmetrics())
+
+    return 0
+
+
+def _report_profile(metrics, limit: int = 25):
+    import pandas as pd
+
+    summary = metrics.summary()
+    if len(summary) == 0:
+        return
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(summary.head(limit).to_string(index=False, float_format=lambda value: f"{value:,.3f}"),
+              file=sys.stderr)
+
+
+def _report_validation(original_df, out_path: str, reporter, method: str = 'auto'):
+    import pandas as pd
+    from .validation import DataValidator
+
+    if out_path.lower().endswith('.parquet'):
+        synthetic_df = pd.read_parquet(out_path)
+    else:
+        synthetic_df = pd.read_csv(out_path)
+
+    validator = DataValidator(method)
+    _report_quality(validator, validator.validate_synthetic_data(original_df, synthetic_df), reporter)
+
+
+def _report_quality(validator, validation_df, reporter):
+    if len(validation_df) == 0:
+        reporter.warning("No numeric columns available for validation.")
+        return
+
+    quality_score = validator.calculate_quality_score(validation_df)
+    level, message = validator.quality_rating(quality_score)
+    reporter.success(f"Quality Score: {quality_score:.1f}/100 - {message}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'generate' and not args.from_csv and (args.validate or args.min_quality is not None):
+        parser.error("--validate and --min-quality need --from-csv: they compare the output with its source")
+    try:
+        if args.command == 'generate':
+            return run_generate(args)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"sdf: error: {e}", file=sys.stderr)
+        return 1
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
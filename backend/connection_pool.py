@@ -0,0 +1,169 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+import pymysql
+from pymysql import MySQLError
+
+
+DEFAULT_MAX_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_CHECKOUT_TIMEOUT = 30.0
+
+
+class PoolTimeoutError(MySQLError):
+    pass
+
+
+def mysql_connector(host: str, user: str, password: str, database: str, local_infile: bool = True,
+                    **connect_kwargs) -> Callable[[], pymysql.connections.Connection]:
+    def connect():
+        return pymysql.connect(
+            host=host,
+            user=user,
+            password=password,
+            database=database,
+            charset='utf8mb4',
+            local_infile=local_infile,
+            cursorclass=pymysql.cursors.DictCursor,
+            **connect_kwargs
+        )
+    return connect
+
+
+class ConnectionPool:
+    # At most max_size connections exist at once; idle ones are reused most-recent first, pinged
+    # (and reconnected) on checkout, and closed once they sit unused for idle_timeout seconds.
+    def __init__(self, connect: Callable[[], object], max_size: int = DEFAULT_MAX_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT, checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self._idle: List[Tuple[object, float]] = []
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Condition()
+
+    @classmethod
+    def for_mysql(cls, host: str, user: str, password: str, database: str, max_size: int = DEFAULT_MAX_SIZE,
+                  idle_timeout: float = DEFAULT_IDLE_TIMEOUT, **connect_kwargs) -> 'ConnectionPool':
+        return cls(mysql_connector(host, user, password, database, **connect_kwargs), max_size, idle_timeout)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def acquire(self, timeout: float = None):
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise MySQLError("Connection pool is closed")
+                self._evict_idle()
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    # Reserve the slot before connecting outside the lock
+                    self._size += 1
+                    connection = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(f"No connection available within {timeout:g}s "
+                                           f"({self.max_size} in use)")
+                self._lock.wait(remaining)
+
+        try:
+            if connection is None:
+                return self._connect()
+            # Reconnects a connection the server dropped while it sat idle (sqlite3 has no ping)
+            ping = getattr(connection, 'ping', None)
+            if ping is not None:
+                ping(reconnect=True)
+            return connection
+        except Exception:
+            self._discard(connection)
+            raise
+
+    def release(self, connection, broken: bool = False):
+        if not broken:
+            try:
+                # Leave no open transaction behind for the next borrower
+                connection.rollback()
+            except Exception:
+                broken = True
+        if broken:
+            self._discard(connection)
+            return
+        with self._lock:
+            if self._closed:
+                self._size -= 1
+                _close_quietly(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self, timeout: float = None) -> Iterator[object]:
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        except (MySQLError, OSError):
+            self.release(connection, broken=not _is_open(connection))
+            raise
+        except BaseException:
+            self.release(connection)
+            raise
+        else:
+            self.release(connection)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._lock.notify_all()
+        for connection, _ in idle:
+            _close_quietly(connection)
+
+    def _evict_idle(self):
+        # Called with the lock held; the oldest idle connections sit at the front
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < cutoff:
+            connection, _ = self._idle.pop(0)
+            self._size -= 1
+            _close_quietly(connection)
+
+    def _discard(self, connection):
+        if connection is not None:
+            _close_quietly(connection)
+        with self._lock:
+            self._size -= 1
+            self._lock.notify()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _is_open(connection) -> bool:
+    return bool(getattr(connection, 'open', True))
+
+
+def _close_quietly(connection):
+    try:
+        connection.close()
+    except Exception:
+        pass
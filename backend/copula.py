@@ -0,0 +1,67 @@
+import numpy as np
+from scipy.special import ndtr, ndtri
+from scipy.stats import rankdata
+from typing import Dict, List, Optional
+
+from .marginals import QuantileTable
+
+
+MIN_EIGENVALUE = 1e-6
+
+
+def normal_scores(sample: np.ndarray) -> np.ndarray:
+    # Rank-transform each column to standard normal scores; missing values score 0 (the mean)
+    scores = np.zeros(sample.shape)
+    for j in range(sample.shape[1]):
+        present = ~np.isnan(sample[:, j])
+        n = int(present.sum())
+        if n > 1:
+            scores[present, j] = ndtri(rankdata(sample[present, j]) / (n + 1))
+    return scores
+
+
+def correlation_matrix(scores: np.ndarray) -> np.ndarray:
+    centered = scores - scores.mean(axis=0)
+    norms = np.sqrt((centered ** 2).sum(axis=0))
+    constant = norms == 0
+    norms[constant] = 1.0
+    corr = (centered.T @ centered) / np.outer(norms, norms)
+    corr[constant, :] = 0.0
+    corr[:, constant] = 0.0
+    np.fill_diagonal(corr, 1.0)
+    return nearest_correlation(corr)
+
+
+def nearest_correlation(corr: np.ndarray) -> np.ndarray:
+    # Pairwise-missing data can leave the estimate slightly indefinite; clip the spectrum and rescale
+    eigenvalues, eigenvectors = np.linalg.eigh(corr)
+    if eigenvalues.min() >= MIN_EIGENVALUE:
+        return corr
+    repaired = (eigenvectors * np.maximum(eigenvalues, MIN_EIGENVALUE)) @ eigenvectors.T
+    scale = np.sqrt(np.diag(repaired))
+    return repaired / np.outer(scale, scale)
+
+
+class GaussianCopula:
+    # Rank correlation and empirical marginals of a set of numeric columns, fitted once from a
+    # row-aligned sample; sampling is one matrix multiply plus a table lookup per column
+    def __init__(self, columns: List[str], sample: np.ndarray, integer_columns: List[str] = ()):
+        self.columns = list(columns)
+        self.integer_columns = set(integer_columns)
+        self.correlation = correlation_matrix(normal_scores(sample))
+        self.cholesky = np.linalg.cholesky(self.correlation)
+        self.marginals = [
+            QuantileTable.from_values(sample[:, j], col in self.integer_columns)
+            for j, col in enumerate(self.columns)
+        ]
+
+    @classmethod
+    def fit(cls, columns: List[str], sample: np.ndarray, integer_columns: List[str] = ()) -> Optional['GaussianCopula']:
+        keep = [j for j in range(len(columns)) if np.count_nonzero(~np.isnan(sample[:, j])) > 1]
+        if len(keep) < 2:
+            return None
+        return cls([columns[j] for j in keep], sample[:, keep], integer_columns)
+
+    def sample(self, num_rows: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        uniforms = ndtr(rng.standard_normal((num_rows, len(self.columns))) @ self.cholesky.T)
+        return {col: self.marginals[j].sample(uniforms[:, j]) for j, col in enumerate(self.columns)}
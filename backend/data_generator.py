@@ -1,289 +1,329 @@
 import pandas as pd
 import numpy as np
 from faker import Faker
-import random
-from typing import List
-import streamlit as st
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+from .providers import ValuePoolEngine
+from .cache import ProfileCache, make_key
+from .copula import GaussianCopula
+from .dtypes import categorical, code_dtype, downcast_integers, string_array, with_nulls
+from .metrics import Metrics
+from .missingness import MissingnessProfile
+from .relationships import DEFAULT_RULES, RelationshipRule, apply_relationships
+from .reporting import Reporter
+from .seeding import SeedLike, as_seed_sequence, derive_rng, derive_seed, faker_seed
+from .unique import UNIQUE_PROVIDERS
+from .writers import DEFAULT_CHUNK_ROWS
+from .readers import content_hasher, read_source
+from .profiling import DEFAULT_CHUNKSIZE, NumericProfile, StreamingProfiler, TextProfile, profile_frame
 
 
 class UniversalDataGenerator:
-    def __init__(self):
+    def __init__(self, pool_size: int = 2000, reporter: Reporter = None, seed: Optional[int] = None,
+                 cache: ProfileCache = None, metrics: Metrics = None, unique_keys: bool = True):
         self.fake = Faker()
+        self.cache = cache
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.rng = np.random.default_rng()
+        self.seed_seq = None
+        self.engine = ValuePoolEngine(self.fake, self.rng, pool_size)
+        self.reporter = reporter if reporter is not None else Reporter()
+        self.relationship_rules: List[RelationshipRule] = list(DEFAULT_RULES)
+        # Identifier-like columns (UNIQUE_PROVIDERS) are drawn without repeats
+        self.unique_keys = unique_keys
+        if seed is not None:
+            self.reseed(seed)
+
+    def reseed(self, seed: SeedLike = None):
+        self.seed_seq = as_seed_sequence(seed)
+        self.rng = np.random.default_rng(derive_seed(self.seed_seq, 'generator'))
+        self.fake.seed_instance(faker_seed(self.seed_seq, 'faker'))
+        self.engine = ValuePoolEngine(self.fake, self.rng, self.engine.pool_size, self.seed_seq)
+
+    def seed_key(self) -> Optional[tuple]:
+        # The seed as a cache key part; None when unseeded
+        if self.seed_seq is None:
+            return None
+        return tuple(self.seed_seq.spawn_key) + (self.seed_seq.entropy,)
+
+    def column_rng(self, column_name: str, row_offset: int = 0) -> np.random.Generator:
+        # Each column/row block draws from its own stream, so adding a column or
+        # changing chunking elsewhere never shifts the values of another column
+        return derive_rng(self.seed_seq, self.rng, 'column', column_name, row_offset)
     
-    def generate_from_csv(self, csv_file: str, num_rows: int = 200, validate: bool = True):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+    def generate_from_csv(self, csv_file: str, num_rows: int = 200, validate: bool = True,
+                          streaming: bool = False, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = 1,
+                          seed: SeedLike = None, columns: Optional[List[str]] = None):
+        if seed is not None:
+            self.reseed(seed)
+        reporter = self.reporter
+        reporter.begin()
         
-        status_text.text("Uploading CSV file...")
+        reporter.status("Uploading CSV file...")
         
         try:
-            original_df = pd.read_csv(csv_file)
-            progress_bar.progress(25)
-            
-            status_text.text("Analyzing data structure...")
+            profiler, original_df = self.profile_csv(csv_file, streaming, chunksize, columns)
+            profiles = profiler.profiles
+            reporter.progress(25)
             
-            with st.expander("Original Data Preview", expanded=True):
-                st.write(f"**Dataset Info:** {len(original_df)} rows, {len(original_df.columns)} columns")
-                st.dataframe(original_df.head(), use_container_width=True)
+            reporter.status("Analyzing data structure...")
+            reporter.preview("Original Data Preview", profiler.head,
+                             f"{profiler.row_count} rows, {len(profiles)} columns")
             
-            synthetic = {}
-            total_columns = len(original_df.columns)
-            
-            for i, col in enumerate(original_df.columns):
-                status_text.text(f"Generating column: {col} ({i+1}/{total_columns})")
-                progress_bar.progress(25 + int(25 * i / total_columns))
+            if workers > 1:
+                reporter.status(f"Generating {len(profiles)} columns on {workers} workers...")
+                synthetic_df = self._parallel(workers).generate_from_profiles(profiles, num_rows, profiler.copula,
+                                                                              profiler.missingness)
+            else:
+                synthetic_df = self.generate_from_profiles(profiles, num_rows, report_progress=True,
+                                                           copula=profiler.copula,
+                                                           missingness=profiler.missingness)
                 
-                if pd.api.types.is_numeric_dtype(original_df[col]):
-                    synthetic[col] = self._generate_numeric_data(original_df[col], num_rows)
-                elif pd.api.types.is_string_dtype(original_df[col]) or pd.api.types.is_object_dtype(original_df[col]):
-                    synthetic[col] = self._generate_text_data(col, original_df[col], num_rows)
-                else:
-                    synthetic[col] = [f"Data_{i}" for i in range(num_rows)]
-            
-            synthetic_df = pd.DataFrame(synthetic)
-            
-            status_text.text("Processing relationships between columns...")
-            progress_bar.progress(75)
-            
-            synthetic_df = self._handle_age_dob_relationship(synthetic_df)
+                reporter.status("Processing relationships between columns...")
+                reporter.progress(75)
+                
+                synthetic_df = self._apply_relationships(synthetic_df)
             
-            progress_bar.progress(100)
+            reporter.progress(100)
             
-            status_text.text("Generation complete!")
-
-            with st.expander("Synthetic Data Preview", expanded=True):
-                st.dataframe(synthetic_df.head(10), use_container_width=True)
+            reporter.status("Generation complete!")
+            reporter.preview("Synthetic Data Preview", synthetic_df.head(10))
             
             return synthetic_df, original_df
         
         except Exception as e:
-            st.error(f"Error reading CSV file: {e}")
+            reporter.error(f"Error reading CSV file: {e}")
             return None, None
 
-    def generate_from_columns(self, columns: List[str], num_rows: int = 200):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+    def profile_csv(self, csv_file: str, streaming: bool = False, chunksize: int = DEFAULT_CHUNKSIZE,
+                    columns: Optional[List[str]] = None):
+        # csv_file may also be compressed CSV, Parquet or Arrow IPC/Feather (see readers.py);
+        # `columns` projects the read down to the columns being modelled
+        cache_key = None
+        if self.cache is not None:
+            # Reservoirs and quantile-sketch compaction both draw from the profiling rng, so a
+            # profile depends on the seed (and, when streaming, on the chunk boundaries)
+            seed_part = self.seed_key()
+            chunk_part = chunksize if streaming else None
+            with self.metrics.stage('cache_lookup'):
+                fingerprint = self.cache.file_fingerprint(csv_file, content_hasher(csv_file))
+                cache_key = make_key('csv', fingerprint, streaming, chunk_part, seed_part,
+                                     tuple(columns) if columns is not None else None)
+                profiler = self.cache.get(cache_key)
+            if profiler is not None:
+                self.reporter.status("Using cached column profiles...")
+                return profiler, profiler.sample_frame()
         
-        status_text.text(f"Generating data for {len(columns)} columns...")
+        rng = derive_rng(self.seed_seq, self.rng, 'profile')
+        if streaming:
+            # Reading and profiling interleave chunk by chunk, so they are timed together
+            with self.metrics.stage('profile', streaming=True) as run:
+                profiler = StreamingProfiler(chunksize=chunksize, rng=rng)
+                profiler.profile_csv(csv_file, columns)
+                run.rows = profiler.row_count
+            original_df = profiler.sample_frame()
+        else:
+            with self.metrics.stage('read_csv') as run:
+                original_df = read_source(csv_file, columns)
+                run.rows = len(original_df)
+            with self.metrics.stage('profile', rows=len(original_df)):
+                profiler = profile_frame(original_df, rng)
+        with self.metrics.stage('fit_copula'):
+            profiler.fit_copula()
         
+        if cache_key is not None:
+            self.cache.put(cache_key, profiler)
+        return profiler, original_df
+
+    def iter_profile_chunks(self, profiles: Dict[str, object], num_rows: int,
+                            chunk_size: int = DEFAULT_CHUNK_ROWS, seed: SeedLike = None,
+                            copula: GaussianCopula = None,
+                            missingness: MissingnessProfile = None) -> Iterator[pd.DataFrame]:
+        if seed is not None:
+            self.reseed(seed)
+        for start in range(0, num_rows, chunk_size):
+            size = min(chunk_size, num_rows - start)
+            chunk = self.generate_from_profiles(profiles, size, row_offset=start, copula=copula,
+                                                missingness=missingness)
+            chunk.index = pd.RangeIndex(start, start + size)
+            self.reporter.progress(int(100 * (start + size) / num_rows))
+            yield self._apply_relationships(chunk, row_offset=start)
+
+    def iter_column_chunks(self, columns: List[str], num_rows: int,
+                           chunk_size: int = DEFAULT_CHUNK_ROWS, seed: SeedLike = None) -> Iterator[pd.DataFrame]:
+        if seed is not None:
+            self.reseed(seed)
+        for start in range(0, num_rows, chunk_size):
+            size = min(chunk_size, num_rows - start)
+            chunk = self.generate_columns_frame(columns, size, row_offset=start)
+            chunk.index = pd.RangeIndex(start, start + size)
+            self.reporter.progress(int(100 * (start + size) / num_rows))
+            yield self._apply_relationships(chunk, row_offset=start)
+
+    def _parallel(self, workers: int):
+        from .parallel import ParallelGenerator
+        return ParallelGenerator(workers, pool_size=self.engine.pool_size, generator=self)
+
+    def generate_from_profiles(self, profiles: Dict[str, object], num_rows: int,
+                               report_progress: bool = False, row_offset: int = 0,
+                               copula: GaussianCopula = None,
+                               missingness: MissingnessProfile = None) -> pd.DataFrame:
         synthetic = {}
-        total_columns = len(columns)
-        
-        for i, col in enumerate(columns):
-            status_text.text(f"Generating: {col} ({i+1}/{total_columns})")
-            progress_bar.progress(50)
-            synthetic[col] = self._generate_from_column_name(col, num_rows)
+        total_columns = len(profiles)
         
-        synthetic_df = pd.DataFrame(synthetic)
+        # Correlated numeric columns are drawn together, from one stream per row block
+        joint = {}
+        if copula is not None and any(col in profiles for col in copula.columns):
+            with self.metrics.stage('copula', rows=num_rows):
+                joint = copula.sample(num_rows, derive_rng(self.seed_seq, self.rng, 'copula', row_offset))
         
-        status_text.text("Processing relationships between columns...")
-        progress_bar.progress(75)
+        with self.metrics.stage('null_masks', rows=num_rows):
+            null_masks = self._null_masks(profiles, num_rows, row_offset, missingness)
         
-        synthetic_df = self._handle_age_dob_relationship(synthetic_df)
+        for i, (col, profile) in enumerate(profiles.items()):
+            if report_progress:
+                self.reporter.status(f"Generating column: {col} ({i+1}/{total_columns})")
+                self.reporter.progress(25 + int(50 * i / total_columns))
+            
+            rng = self.column_rng(col, row_offset)
+            provider = 'copula' if col in joint else self._profile_provider(col, profile)
+            with self.metrics.stage('generate_column', rows=num_rows, column=col, provider=provider):
+                if col in joint:
+                    synthetic[col] = self._finish_numeric(profile, joint[col])
+                elif profile.kind == 'numeric':
+                    synthetic[col] = self._generate_numeric_data(profile, num_rows, rng)
+                elif profile.kind == 'text':
+                    synthetic[col] = self._generate_text_data(col, profile, num_rows, rng, row_offset)
+                elif profile.kind == 'boolean':
+                    synthetic[col] = rng.random(num_rows) < profile.true_rate
+                else:
+                    synthetic[col] = string_array(np.char.add('Data_', np.arange(row_offset, row_offset + num_rows).astype(str)))
+                if col in null_masks:
+                    synthetic[col] = with_nulls(synthetic[col], null_masks[col])
         
-        progress_bar.progress(100)
+        return pd.DataFrame(synthetic)
+
+    def _null_masks(self, profiles: Dict[str, object], num_rows: int, row_offset: int,
+                    missingness: MissingnessProfile = None) -> Dict[str, np.ndarray]:
+        # Drawn for the whole row block from one stream, so a worker generating a subset of the
+        # columns sees the same patterns as every other worker
+        if missingness is not None:
+            masks = missingness.sample(num_rows, derive_rng(self.seed_seq, self.rng, 'missingness', row_offset))
+            return {col: mask for col, mask in masks.items() if col in profiles}
         
-        status_text.text("Generation complete!")
+        # Without joint patterns each column goes missing independently at its own rate
+        masks = {}
+        for col, profile in profiles.items():
+            total = profile.count + profile.null_count
+            if profile.null_count and total:
+                rng = derive_rng(self.seed_seq, self.rng, 'nulls', col, row_offset)
+                masks[col] = rng.random(num_rows) < profile.null_count / total
+        return masks
+
+    def generate_columns_frame(self, columns: List[str], num_rows: int, row_offset: int = 0) -> pd.DataFrame:
+        return pd.DataFrame({
+            col: self._generate_named_column(col, num_rows, self.column_rng(col, row_offset), row_offset)
+            for col in columns
+        })
+
+    def _generate_named_column(self, column_name: str, num_rows: int, rng: np.random.Generator,
+                               row_offset: int = 0):
+        with self.metrics.stage('generate_column', rows=num_rows, column=column_name,
+                                provider=self.engine.resolve(column_name)):
+            return self._generate_from_column_name(column_name, num_rows, rng, row_offset)
+
+    def generate_from_columns(self, columns: List[str], num_rows: int = 200, workers: int = 1,
+                              seed: SeedLike = None):
+        if seed is not None:
+            self.reseed(seed)
+        reporter = self.reporter
+        reporter.begin()
         
-        with st.expander("Generated Data Preview", expanded=True):
-            st.dataframe(synthetic_df.head(10), use_container_width=True)
+        reporter.status(f"Generating data for {len(columns)} columns...")
         
-        return synthetic_df
-
-    def _handle_age_dob_relationship(self, df: pd.DataFrame) -> pd.DataFrame:
-        columns_lower = [col.lower() for col in df.columns]
+        if workers > 1:
+            synthetic_df = self._parallel(workers).generate_from_columns(columns, num_rows)
+            reporter.status("Generation complete!")
+            reporter.preview("Generated Data Preview", synthetic_df.head(10))
+            return synthetic_df
         
-        has_age = any('age' in col for col in columns_lower)
-        has_dob = any('dob' in col or 'date_of_birth' in col for col in columns_lower)
+        synthetic = {}
+        total_columns = len(columns)
         
-        if has_age and has_dob:
-            age_col = next(col for col in df.columns if 'age' in col.lower())
-            dob_col = next(col for col in df.columns if 'dob' in col.lower() or 'date_of_birth' in col.lower())
-            
-            current_year = datetime.now().year
-            
-            dob_list = []
-            for age in df[age_col]:
-                try:
-                    birth_year = current_year - int(age)
-                    random_month = random.randint(1, 12)
-                    if random_month == 2:
-                        max_day = 28 if birth_year % 4 != 0 else 29
-                    elif random_month in [4, 6, 9, 11]:
-                        max_day = 30
-                    else:
-                        max_day = 31
-                    
-                    random_day = random.randint(1, max_day)
-                    
-                    dob = f"{birth_year}-{random_month:02d}-{random_day:02d}"
-                    dob_list.append(dob)
-                    
-                except (ValueError, TypeError):
-                    random_year = random.randint(current_year - 80, current_year - 18)
-                    random_month = random.randint(1, 12)
-                    random_day = random.randint(1, 28) 
-                    dob_list.append(f"{random_year}-{random_month:02d}-{random_day:02d}")
-            
-            df[dob_col] = dob_list
+        for i, col in enumerate(columns):
+            reporter.status(f"Generating: {col} ({i+1}/{total_columns})")
+            reporter.progress(int(75 * i / total_columns))
+            synthetic[col] = self._generate_named_column(col, num_rows, self.column_rng(col))
         
-        return df
-
-    def _generate_numeric_data(self, column_data: pd.Series, num_rows: int):
-        clean_data = column_data.dropna()
+        synthetic_df = pd.DataFrame(synthetic)
         
-        if len(clean_data) == 0:
-            if pd.api.types.is_integer_dtype(column_data):
-                return np.random.randint(0, 100, num_rows)
-            else:
-                return np.round(np.random.uniform(0, 100, num_rows), 2)
+        reporter.status("Processing relationships between columns...")
+        reporter.progress(75)
         
-        min_val = clean_data.min()
-        max_val = clean_data.max()
-        mean_val = clean_data.mean()
-        std_val = clean_data.std()
+        synthetic_df = self._apply_relationships(synthetic_df)
         
-        if std_val > 0:
-            generated = np.random.normal(mean_val, std_val, num_rows)
-        else:
-            generated = np.random.uniform(min_val, max_val, num_rows)
+        reporter.progress(100)
         
-        generated = np.clip(generated, min_val * 0.8, max_val * 1.2)
+        reporter.status("Generation complete!")
+        reporter.preview("Generated Data Preview", synthetic_df.head(10))
         
-        if pd.api.types.is_integer_dtype(column_data):
-            return generated.astype(int)
-        else:
-            return np.round(generated, 2)
+        return synthetic_df
 
-    def _generate_text_data(self, column_name: str, column_data: pd.Series, num_rows: int):
-        clean_data = column_data.dropna()
+    def _apply_relationships(self, df: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+        def rng_for(rule, matched):
+            return derive_rng(self.seed_seq, self.rng, 'relationship', rule.name, *matched, row_offset)
         
-        if len(clean_data) > 0 and clean_data.nunique() <= 15:
-            return np.random.choice(clean_data.unique(), num_rows)
-        
-        return self._generate_from_column_name(column_name, num_rows)
+        with self.metrics.stage('relationships', rows=len(df)):
+            return apply_relationships(df, self.relationship_rules, rng_for)
 
-    def _generate_from_column_name(self, column_name: str, num_rows: int):
-        col_lower = column_name.lower()
+    def _generate_numeric_data(self, profile: NumericProfile, num_rows: int, rng: np.random.Generator = None):
+        rng = rng if rng is not None else self.rng
+        if profile.count == 0:
+            if profile.is_integer:
+                return rng.integers(0, 100, num_rows)
+            else:
+                return np.round(rng.uniform(0, 100, num_rows), 2)
         
-        faker_methods = {
-            # Personal Information
-            'name': self.fake.name,
-            'first_name': self.fake.first_name,
-            'last_name': self.fake.last_name,
-            'full_name': self.fake.name,
-            'username': self.fake.user_name,
-            'password': self.fake.password,
-            
-            # Contact Information
-            'email': self.fake.email,
-            'phone': lambda: f"{random.randint(6000000000, 9999999999)}",
-            'mobile': lambda: f"{random.randint(6000000000, 9999999999)}",
-            
-            # Location Information
-            'address': lambda: self.fake.address().replace('\n', ', '),
-            'street': self.fake.street_address,
-            'city': self.fake.city,
-            'state': self.fake.state,
-            'country': self.fake.country,
-            'zip': self.fake.zipcode,
-            'postal': self.fake.postcode,
-            'location': self.fake.city,
-            
-            # Company & Professional
-            'company': self.fake.company,
-            'job': self.fake.job,
-            'job_title': self.fake.job,
-            'industry': self.fake.bs,
-            
-            # Financial
-            'credit_card': self.fake.credit_card_number,
-            'iban': self.fake.iban,
-            'currency': self.fake.currency_code,
-            
-            # Internet & Tech
-            'url': self.fake.url,
-            'website': self.fake.url,
-            'domain': self.fake.domain_name,
-            'ip': self.fake.ipv4,
-            'user_agent': self.fake.user_agent,
-            
-            # Dates & Times
-            'date': self.fake.date,
-            'time': self.fake.time,
-            'year': lambda: self.fake.year(),
-            'month': lambda: self.fake.month_name(),
+        generated = profile.quantile_table().sample(rng.random(num_rows))
+        return self._finish_numeric(profile, generated)
 
-            # Date of Birth variations
-            'dob': self.fake.date_of_birth,
-            'date_of_birth': self.fake.date_of_birth,
-            'birth_date': self.fake.date_of_birth,
-            'birthdate': self.fake.date_of_birth,
-            'birthday': self.fake.date_of_birth,
+    def _finish_numeric(self, profile: NumericProfile, generated: np.ndarray):
+        # Nulls are applied afterwards by generate_from_profiles, from the missingness model
+        if profile.is_integer:
+            return downcast_integers(generated.astype(np.int64))
+        return np.round(generated, 2)
 
-            # Products & Commerce
-            'product': self.fake.word,
-            'brand': self.fake.company,
-            'color': self.fake.color_name,
-            
-            # Education
-            'school': self.fake.company,
-            'university': self.fake.company,
-            'grade': lambda: random.choice(['A', 'B', 'C', 'D', 'F']),
-            
-            # Medical
-            'hospital': self.fake.company,
-            'doctor': self.fake.name,
-            'disease': lambda: random.choice(['Flu', 'Cold', 'Headache', 'Fever', 'Allergy']),
-            
-            # Vehicles
-            'car': lambda: f"{self.fake.company()} {self.fake.word()}",
-            'license': self.fake.license_plate,
-            
-            # Identification
-            'id': lambda: f"ID_{self.fake.random_int(1000, 9999)}",
-            'ssn': self.fake.ssn,
-            'passport': self.fake.passport_number,
-            
-            # Numeric types
-            'age': lambda: random.randint(18, 70),
-            'salary': lambda: random.randint(30000, 150000),
-            'price': lambda: round(random.uniform(10, 1000), 2),
-            'quantity': lambda: random.randint(1, 100),
-            'score': lambda: random.randint(0, 100),
-            'rating': lambda: random.randint(1, 5),
-            'serial': lambda: f"SN{self.fake.random_number(digits=8)}",
-            
-            # Boolean types
-            'is_': lambda: random.choice([True, False]),
-            'has_': lambda: random.choice([True, False]),
-            'active': lambda: random.choice([True, False]),
-            'status': lambda: random.choice(['Active', 'Inactive', 'Pending']),
-        }
-        
-        for pattern, faker_method in faker_methods.items():
-            if pattern in col_lower:
-                try:
-                    return [faker_method() for _ in range(num_rows)]
-                except:
-                    continue
-        
-        if any(word in col_lower for word in ['first', 'given']):
-            return [self.fake.first_name() for _ in range(num_rows)]
-        elif any(word in col_lower for word in ['last', 'surname', 'family']):
-            return [self.fake.last_name() for _ in range(num_rows)]
-        elif any(word in col_lower for word in ['street', 'road', 'avenue']):
-            return [self.fake.street_address() for _ in range(num_rows)]
-        elif any(word in col_lower for word in ['state', 'province', 'region']):
-            return [self.fake.state() for _ in range(num_rows)]
-        elif any(word in col_lower for word in ['gender', 'sex']):
-            return [random.choice(['Male', 'Female']) for _ in range(num_rows)]
-        
-        elif any(word in col_lower for word in ['number', 'count', 'total', 'amount']):
-            return [random.randint(1, 1000) for _ in range(num_rows)]
-        elif any(word in col_lower for word in ['percent', 'percentage', 'rate']):
-            return [round(random.uniform(0, 100), 2) for _ in range(num_rows)]
+    def _profile_provider(self, column_name: str, profile) -> str:
+        if profile.kind == 'numeric':
+            return 'quantile_table'
+        elif profile.kind == 'text':
+            return 'categorical' if self._is_categorical(profile) else self.engine.resolve(column_name)
+        elif profile.kind == 'boolean':
+            return 'bernoulli'
+        return 'sequence'
+
+    def _is_categorical(self, profile: TextProfile) -> bool:
+        return profile.count > 0 and not profile.overflowed and profile.distinct_count <= 15
+
+    def _generate_text_data(self, column_name: str, profile: TextProfile, num_rows: int,
+                            rng: np.random.Generator = None, row_offset: int = 0):
+        rng = rng if rng is not None else self.rng
+        if self._is_categorical(profile):
+            values = profile.values()
+            return categorical(rng.integers(0, len(values), num_rows, dtype=code_dtype(len(values))), values)
         
-        else:
-            return [self.fake.word() for _ in range(num_rows)]
\ No newline at end of file
+        return self._generate_from_column_name(column_name, num_rows, rng, row_offset)
+
+    def _generate_from_column_name(self, column_name: str, num_rows: int, rng: np.random.Generator = None,
+                                   row_offset: int = 0, unique: bool = None):
+        # unique=None follows unique_keys; True forces it (e.g. for a UNIQUE database column)
+        provider = self.engine.resolve(column_name)
+        if provider not in self.engine.vectorized and provider not in self.engine.faker_methods:
+            provider = 'word'
+        if unique is None:
+            unique = self.unique_keys and provider in UNIQUE_PROVIDERS
+        # Anything raised past the provider lookup (running out of unique SSNs, say) is the
+        # caller's to see, not a reason to fall back to words
+        if unique:
+            provider = provider if self.engine.supports_unique(provider) else 'word'
+            return self.engine.draw_unique(provider, num_rows, row_offset, column_name)
+        return self.engine.draw(provider, num_rows, rng)
@@ -1,29 +1,33 @@
-import pymysql
+from concurrent.futures import ThreadPoolExecutor
 from pymysql import MySQLError
 import pandas as pd
-from typing import List, Dict, Any
-import streamlit as st
-import random
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
+import numpy as np
+from .bulk_load import DB_ERRORS, DEFAULT_BATCH_ROWS, DEFAULT_COMMIT_ROWS, BulkLoader, quote_identifier
+from .cache import make_key
+from .classifier import DEFAULT_CLASSIFIER, classify_column
+from .connection_pool import ConnectionPool, mysql_connector
+from .dtypes import downcast_integers, int_dtype, integers, string_array, with_nulls
+from .missingness import missingness_of
+from .relational import ForeignKey, SchemaGraph, existing_key_rows, read_foreign_keys
+from .reporting import Reporter
+from .seeding import SeedLike, derive_rng
+from .table_source import DEFAULT_SAMPLE_ROWS, DEFAULT_TOP_K, aggregate_profile, sample_table
+from .unique import unique_indices
 
 
 class DatabaseHandler:
-    def __init__(self, data_generator):
+    def __init__(self, data_generator, reporter: Reporter = None):
         self.generator = data_generator
+        self.reporter = reporter if reporter is not None else data_generator.reporter
     
-    def connect_to_mysql(self, host: str, user: str, password: str, database: str):
+    def connect_to_mysql(self, host: str, user: str, password: str, database: str, local_infile: bool = True):
         try:
-            connection = pymysql.connect(
-                host=host,
-                user=user,
-                password=password,
-                database=database,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            st.success("Successfully connected to MySQL database!")
+            connection = mysql_connector(host, user, password, database, local_infile)()
+            self.reporter.success("Successfully connected to MySQL database!")
             return connection
         except MySQLError as err:
-            st.error(f"Failed to connect to database: {err}")
+            self.reporter.error(f"Failed to connect to database: {err}")
             return None
 
     def get_mysql_tables(self, connection) -> List[str]:
@@ -33,7 +37,7 @@ class DatabaseHandler:
                 tables = [list(table.values())[0] for table in cursor.fetchall()]
                 return tables
         except MySQLError as err:
-            st.error(f"Error fetching tables: {err}")
+            self.reporter.error(f"Error fetching tables: {err}")
             return []
 
     def get_table_schema(self, connection, table_name: str) -> Dict[str, Any]:
@@ -54,60 +58,361 @@ class DatabaseHandler:
                     }
                 return schema_info
         except MySQLError as err:
-            st.error(f"Error fetching schema for {table_name}: {err}")
+            self.reporter.error(f"Error fetching schema for {table_name}: {err}")
             return {}
 
-    def generate_from_mysql_table(self, connection, table_name: str, num_rows: int = 200):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+    def generate_from_mysql_table(self, connection, table_name: str, num_rows: int = 200, seed: SeedLike = None,
+                                  sampling: str = 'first', sample_rows: int = DEFAULT_SAMPLE_ROWS):
+        if seed is not None:
+            self.generator.reseed(seed)
+        reporter = self.reporter
+        reporter.begin()
         
-        status_text.text(f"Generating synthetic data for table: {table_name}")
+        reporter.status(f"Generating synthetic data for table: {table_name}")
         
-        schema = self.get_table_schema(connection, table_name)
+        schema, original_df = self.profile_mysql_table(connection, table_name, sampling, sample_rows)
         if not schema:
             return None, None
         
-        status_text.text(f"Analyzing table schema: {len(schema)} columns")
-        progress_bar.progress(25)
-
-        original_data = self.get_table_data(connection, table_name, limit=1000)
-        original_df = pd.DataFrame(original_data) if original_data else None
+        reporter.status(f"Analyzing table schema: {len(schema)} columns")
+        reporter.progress(25)
         
         synthetic_data = {}
         total_columns = len(schema)
         
+        metrics = self.generator.metrics
         for i, (column_name, column_info) in enumerate(schema.items()):
-            status_text.text(f"Generating: {column_name} ({i+1}/{total_columns})")
-            progress_bar.progress(25 + int(50 * (i / total_columns)))
-            synthetic_data[column_name] = self._generate_from_mysql_column(column_name, column_info, num_rows)
+            reporter.status(f"Generating: {column_name} ({i+1}/{total_columns})")
+            reporter.progress(25 + int(50 * (i / total_columns)))
+            with metrics.stage('generate_column', rows=num_rows, table=table_name, column=column_name,
+                               provider=column_info['type']):
+                if column_info['key'] == 'PRI':
+                    synthetic_data[column_name] = self._key_values(connection, table_name, column_name,
+                                                                   column_info, num_rows)
+                else:
+                    synthetic_data[column_name] = self._generate_from_mysql_column(column_name, column_info,
+                                                                                   num_rows)
+        
+        for column_name, mask in self._null_masks(table_name, schema, original_df, num_rows).items():
+            synthetic_data[column_name] = with_nulls(synthetic_data[column_name], mask)
         
         synthetic_df = pd.DataFrame(synthetic_data)
-        progress_bar.progress(100)
+        reporter.progress(100)
         
-        status_text.text("Generation complete!")
+        reporter.status("Generation complete!")
         
-        with st.expander("Synthetic Data Preview", expanded=True):
-            st.dataframe(synthetic_df.head(10), use_container_width=True)
+        reporter.preview("Synthetic Data Preview", synthetic_df.head(10))
         
         return synthetic_df, original_df
 
-    def insert_to_mysql_table(self, connection, table_name: str, dataframe: pd.DataFrame) -> bool:
+    def _null_masks(self, table_name: str, schema: Dict[str, Any], original_df: Optional[pd.DataFrame],
+                    num_rows: int) -> Dict[str, np.ndarray]:
+        # Nullable columns go missing at the rates, and in the joint patterns, of the sampled
+        # rows; NOT NULL columns never do
+        if original_df is None or original_df.empty:
+            return {}
+        nullable = [col for col, info in schema.items() if info['null'] == 'YES' and col in original_df.columns]
+        if not nullable:
+            return {}
+        rng = derive_rng(self.generator.seed_seq, self.generator.rng, 'missingness', table_name)
+        return missingness_of(original_df[nullable]).sample(num_rows, rng)
+
+    def generate_schema(self, connection, tables: List[str] = None, num_rows: Union[int, Dict[str, int]] = 200,
+                        seed: SeedLike = None) -> Dict[str, pd.DataFrame]:
+        return self._generate_schema(connection, tables, num_rows, seed)[1]
+
+    def _generate_schema(self, connection, tables: List[str], num_rows: Union[int, Dict[str, int]],
+                         seed: SeedLike) -> Tuple[SchemaGraph, Dict[str, pd.DataFrame]]:
+        # Generates related tables in one pass: parents first, then children whose foreign key
+        # columns are drawn from the parents' generated rows, so every reference resolves.
+        if seed is not None:
+            self.generator.reseed(seed)
+        reporter = self.reporter
+        reporter.begin()
+        
+        tables = tables if tables is not None else self.get_mysql_tables(connection)
+        schemas = {table: self.get_table_schema(connection, table) for table in tables}
+        schemas = {table: schema for table, schema in schemas.items() if schema}
+        try:
+            foreign_keys = read_foreign_keys(connection)
+        except MySQLError as err:
+            reporter.warning(f"Could not read foreign keys, tables generated independently: {err}")
+            foreign_keys = []
+        graph = SchemaGraph(schemas, foreign_keys)
+        for table, name in sorted(graph.deferred):
+            reporter.warning(f"Foreign key {name} on {table} is part of a cycle and is left NULL")
+        
+        frames: Dict[str, pd.DataFrame] = {}
+        order = graph.order()
+        for i, table in enumerate(order):
+            rows = num_rows.get(table, 200) if isinstance(num_rows, dict) else num_rows
+            reporter.status(f"Generating: {table} ({i+1}/{len(order)})")
+            reporter.progress(int(100 * i / len(order)))
+            with self.generator.metrics.stage('generate_table', table=table) as run:
+                frames[table] = self._generate_related_table(connection, table, graph, frames, rows)
+                run.rows = len(frames[table])
+        
+        reporter.progress(100)
+        reporter.status("Generation complete!")
+        return graph, frames
+
+    def populate_schema(self, connection, tables: List[str] = None, num_rows: Union[int, Dict[str, int]] = 200,
+                        seed: SeedLike = None, method: str = 'auto',
+                        pool: ConnectionPool = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        # With a pool, the tables of one dependency level are inserted concurrently, one pooled
+        # connection each; a level starts only once every parent table is committed.
+        graph, frames = self._generate_schema(connection, tables, num_rows, seed)
+        results = {}
+        for level in graph.levels():
+            if pool is None:
+                outcomes = [self._insert_table(connection, table, frames[table], method) for table in level]
+            else:
+                with ThreadPoolExecutor(max_workers=min(pool.max_size, len(level))) as executor:
+                    outcomes = list(executor.map(
+                        lambda table: self._insert_pooled(pool, table, frames[table], method), level
+                    ))
+            
+            for table, (stats, err) in zip(level, outcomes):
+                if err is not None:
+                    self.reporter.error(f"Error inserting data into {table}: {err}")
+                    return None
+                self._report_insert(table, stats)
+                results[table] = stats
+        return results
+
+    def _insert_pooled(self, pool: ConnectionPool, table_name: str, data: pd.DataFrame, method: str):
+        try:
+            with pool.connection() as connection:
+                return self._insert_table(connection, table_name, data, method)
+        except DB_ERRORS as err:
+            return None, err
+
+    def _insert_table(self, connection, table_name: str, data: pd.DataFrame, method: str):
+        # Keys are generated collision-free, so a rejected row is an error rather than a skip.
+        # Runs on worker threads, so it returns the outcome instead of reporting it.
+        loader = BulkLoader(connection, Reporter(), ignore=False)
+        try:
+            with self.generator.metrics.stage('db_insert', table=table_name) as run:
+                stats = loader.load(table_name, data, method)
+                run.rows = stats['rows']
+            return stats, None
+        except DB_ERRORS as err:
+            connection.rollback()
+            return None, err
+
+    def _generate_related_table(self, connection, table_name: str, graph: SchemaGraph,
+                                frames: Dict[str, pd.DataFrame], num_rows: int) -> pd.DataFrame:
+        schema = graph.schemas[table_name]
+        foreign_keys = graph.foreign_keys_of(table_name)
+        
+        # Parent rows each foreign key draws from, read once per key
+        parents: Dict[str, pd.DataFrame] = {}
+        for fk in foreign_keys:
+            if graph.is_deferred(fk) or fk.is_self_reference:
+                continue
+            if fk.parent in frames:
+                parents[fk.name] = frames[fk.parent]
+            else:
+                parents[fk.name] = pd.DataFrame(existing_key_rows(connection, fk), columns=list(fk.parent_columns))
+            if self._is_unique_reference(schema, fk):
+                # A unique foreign key (one-to-one) can use each parent row only once
+                num_rows = min(num_rows, len(parents[fk.name]))
+        
+        fk_columns = {col for fk in foreign_keys for col in fk.columns}
+        primary = {col for col, info in schema.items() if info['key'] == 'PRI'}
+        links = [fk for fk in foreign_keys if set(fk.columns) & primary]
+        link_rows = {}
+        if primary and primary <= fk_columns and len(links) > 1 and all(fk.name in parents for fk in links):
+            # A key made only of references (a link table) takes each combination of parents once
+            sizes = [len(parents[fk.name]) for fk in links]
+            available = int(np.prod(sizes, dtype=object))
+            if available < num_rows:
+                self.reporter.warning(f"{table_name} has only {available} distinct key combinations; "
+                                      f"generating {available} of {num_rows} rows")
+                num_rows = available
+            rng = derive_rng(self.generator.seed_seq, self.generator.rng, 'table', table_name, 'links')
+            picks = rng.choice(available, num_rows, replace=False) if num_rows else np.zeros(0, dtype=np.int64)
+            link_rows = dict(zip((fk.name for fk in links), np.unravel_index(picks, sizes)))
+        
+        data = {}
+        for column_name, column_info in schema.items():
+            if column_name in fk_columns:
+                continue
+            rng = derive_rng(self.generator.seed_seq, self.generator.rng, 'table', table_name, column_name)
+            if column_info['key'] == 'PRI':
+                data[column_name] = self._key_values(connection, table_name, column_name, column_info, num_rows)
+            else:
+                data[column_name] = self._generate_from_mysql_column(column_name, column_info, num_rows, rng)
+        
+        for fk in foreign_keys:
+            rng = derive_rng(self.generator.seed_seq, self.generator.rng, 'table', table_name, fk.name)
+            if graph.is_deferred(fk):
+                rows, source = None, None
+            elif fk.name in link_rows:
+                rows, source = link_rows[fk.name], parents[fk.name]
+            elif fk.is_self_reference:
+                rows, source = self._self_reference_rows(rng, num_rows), data
+            else:
+                source = parents[fk.name]
+                if len(source) == 0:
+                    if not graph.is_nullable(fk):
+                        raise ValueError(f"{table_name}.{fk.name} references {fk.parent}, which has no rows")
+                    rows = None
+                elif self._is_unique_reference(schema, fk):
+                    rows = rng.permutation(len(source))[:num_rows]
+                else:
+                    rows = rng.integers(0, len(source), num_rows)
+            
+            for column, parent_column in zip(fk.columns, fk.parent_columns):
+                if rows is None:
+                    data[column] = pd.Series([None] * num_rows, dtype=object)
+                    continue
+                values = np.asarray(source[parent_column])[np.maximum(rows, 0)]
+                if fk.is_self_reference and (rows < 0).any():
+                    values = pd.Series(values).astype(object).where(rows >= 0, None).to_numpy()
+                data[column] = values
+        
+        return pd.DataFrame({column: data[column] for column in schema})
+
+    def _self_reference_rows(self, rng: np.random.Generator, num_rows: int) -> np.ndarray:
+        # Row i points at an earlier row, so rows inserted in order always find their parent;
+        # the first row (the root) has nothing earlier and is left NULL.
+        positions = np.arange(num_rows)
+        return np.where(positions > 0, (rng.random(num_rows) * positions).astype(np.int64), -1)
+
+    def _is_unique_reference(self, schema: Dict[str, Dict], fk: ForeignKey) -> bool:
+        primary = {col for col, info in schema.items() if info['key'] == 'PRI'}
+        if set(fk.columns) == primary:
+            return True
+        return len(fk.columns) == 1 and schema[fk.columns[0]]['key'] == 'UNI'
+
+    def _key_values(self, connection, table_name: str, column_name: str, column_info: Dict[str, Any],
+                    num_rows: int) -> np.ndarray:
+        # Keys continue after the rows already in the table instead of colliding with them
+        is_int = 'int' in column_info['type'].lower()
+        column, table = quote_identifier(column_name), quote_identifier(table_name)
+        if is_int:
+            query = f"SELECT COALESCE(MAX({column}), 0) AS last_key FROM {table}"
+        else:
+            # Only existing PK_<n> keys can collide, so continue after the largest n among them
+            query = (f"SELECT COALESCE(MAX(CAST(SUBSTRING({column}, 4) AS UNSIGNED)), 0) AS last_key "
+                     f"FROM {table} WHERE {column} LIKE 'PK\\_%'")
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query)
+                start = int(cursor.fetchone()['last_key']) + 1
+        except MySQLError:
+            start = 1
+        
+        keys = np.arange(start, start + num_rows)
+        if is_int:
+            return keys.astype(int_dtype(start, start + num_rows))
+        return string_array(np.char.add('PK_', keys.astype(str)))
+
+    def profile_mysql_table(self, connection, table_name: str, sampling: str = 'first',
+                            sample_rows: int = DEFAULT_SAMPLE_ROWS):
+        cache = self.generator.cache
+        cache_key = None
+        if cache is not None:
+            fingerprint = self.table_fingerprint(connection, table_name)
+            if fingerprint is not None:
+                # Random and full-table samples are drawn with the seeded rng, so they depend on it
+                seed_part = self.generator.seed_key() if sampling != 'first' else None
+                cache_key = make_key('mysql', fingerprint, sampling, sample_rows, seed_part)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    self.reporter.status(f"Using cached profile for table: {table_name}")
+                    return cached
+        
+        schema = self.get_table_schema(connection, table_name)
+        if not schema:
+            return {}, None
+        
+        rng = derive_rng(self.generator.seed_seq, self.generator.rng, 'table_sample', table_name)
+        with self.generator.metrics.stage('read_table', table=table_name, sampling=sampling) as run:
+            try:
+                original_df = sample_table(connection, table_name, sample_rows, sampling, rng)
+            except MySQLError as err:
+                self.reporter.error(f"Error fetching data from {table_name}: {err}")
+                original_df = pd.DataFrame()
+            run.rows = len(original_df)
+        original_df = original_df if len(original_df) > 0 else None
+        
+        if cache_key is not None:
+            cache.put(cache_key, (schema, original_df))
+        return schema, original_df
+
+    def aggregate_profile(self, connection, table_name: str, top_k: int = DEFAULT_TOP_K) -> Optional[pd.DataFrame]:
+        schema = self.get_table_schema(connection, table_name)
+        if not schema:
+            return None
+        try:
+            with self.generator.metrics.stage('aggregate_profile', table=table_name):
+                return aggregate_profile(connection, table_name, schema, top_k)
+        except MySQLError as err:
+            self.reporter.error(f"Error profiling {table_name}: {err}")
+            return None
+
+    def table_fingerprint(self, connection, table_name: str, checksum: bool = False, exact_count: bool = False):
+        # Column definitions plus InnoDB's table statistics (estimated rows, data size, create and
+        # update times), all from information_schema. COUNT(*) and CHECKSUM TABLE scan the whole
+        # table, so they are opt-in for when the statistics are too coarse to catch a change.
         try:
             with connection.cursor() as cursor:
-                columns = ', '.join(dataframe.columns)
-                placeholders = ', '.join(['%s'] * len(dataframe.columns))
-                insert_query = f"INSERT IGNORE INTO {table_name} ({columns}) VALUES ({placeholders})"
-                data_tuples = [tuple(row) for row in dataframe.values]
-                cursor.executemany(insert_query, data_tuples)
-                connection.commit()
+                cursor.execute(
+                    "SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA "
+                    "FROM information_schema.COLUMNS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+                    (table_name,)
+                )
+                columns = [tuple(row.values()) for row in cursor.fetchall()]
+                
+                cursor.execute(
+                    "SELECT TABLE_ROWS, DATA_LENGTH, CREATE_TIME, UPDATE_TIME FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                    (table_name,)
+                )
+                statistics = tuple((cursor.fetchone() or {}).values())
                 
-                st.success(f"Successfully inserted {cursor.rowcount} rows into {table_name}")
-                return True
+                row_count = None
+                if exact_count:
+                    cursor.execute(f"SELECT COUNT(*) AS row_count FROM {quote_identifier(table_name)}")
+                    row_count = cursor.fetchone()['row_count']
                 
+                table_checksum = None
+                if checksum:
+                    cursor.execute(f"CHECKSUM TABLE {quote_identifier(table_name)}")
+                    table_checksum = cursor.fetchone()['Checksum']
+                
+                return (connection.db, table_name, tuple(columns), statistics, row_count, table_checksum)
         except MySQLError as err:
-            st.error(f"Error inserting data into {table_name}: {err}")
+            self.reporter.warning(f"Could not fingerprint {table_name}, profile cache skipped: {err}")
+            return None
+
+    def insert_to_mysql_table(self, connection, table_name: str, dataframe: pd.DataFrame) -> bool:
+        return self.bulk_insert(connection, table_name, dataframe) is not None
+
+    def bulk_insert(self, connection, table_name: str, data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                    method: str = 'auto', batch_rows: int = DEFAULT_BATCH_ROWS,
+                    commit_rows: int = DEFAULT_COMMIT_ROWS, ignore: bool = True) -> Optional[Dict[str, Any]]:
+        loader = BulkLoader(connection, self.reporter, batch_rows, commit_rows, ignore)
+        try:
+            with self.generator.metrics.stage('db_insert', table=table_name) as run:
+                stats = loader.load(table_name, data, method)
+                run.rows = stats['rows']
+        except DB_ERRORS as err:
+            self.reporter.error(f"Error inserting data into {table_name}: {err}")
             connection.rollback()
-            return False
+            return None
+        
+        self._report_insert(table_name, stats)
+        return stats
+
+    def _report_insert(self, table_name: str, stats: Dict[str, Any]):
+        self.reporter.success(
+            f"Successfully inserted {stats['inserted']} of {stats['rows']} rows into {table_name} "
+            f"in {stats['seconds']:.2f}s ({stats['rows_per_sec']:,.0f} rows/s, {stats['method']})"
+        )
 
     def get_table_data(self, connection, table_name: str, limit: int = 10):
         try:
@@ -116,43 +421,53 @@ class DatabaseHandler:
                 data = cursor.fetchall()
                 return data
         except MySQLError as err:
-            st.error(f"Error fetching data from {table_name}: {err}")
+            self.reporter.error(f"Error fetching data from {table_name}: {err}")
             return []
 
-    def _generate_from_mysql_column(self, column_name: str, column_info: Dict[str, Any], num_rows: int):
+    def _generate_from_mysql_column(self, column_name: str, column_info: Dict[str, Any], num_rows: int,
+                                    rng: np.random.Generator = None):
         col_type = column_info['type'].lower()
-        col_lower = column_name.lower()
+        provider = classify_column(column_name)
+        tokens = DEFAULT_CLASSIFIER.tokens(column_name)
+        rng = rng if rng is not None else self.generator.column_rng(column_name)
         
         if 'auto_increment' in column_info['extra'].lower():
-            return list(range(1, num_rows + 1))
+            return np.arange(1, num_rows + 1, dtype=int_dtype(1, num_rows))
         
-        if column_info['key'] == 'PRI' and 'auto_increment' not in column_info['extra'].lower():
-            return [f"PK_{i}" for i in range(1, num_rows + 1)]
+        unique = column_info['key'] == 'UNI'
         
         if 'int' in col_type:
-            if any(word in col_lower for word in ['age', 'years']):
-                return [random.randint(18, 80) for _ in range(num_rows)]
-            elif any(word in col_lower for word in ['salary', 'price', 'amount', 'cost']):
-                return [random.randint(1000, 100000) for _ in range(num_rows)]
-            elif any(word in col_lower for word in ['id', 'code', 'number']):
-                return [random.randint(1000, 9999) for _ in range(num_rows)]
+            if provider == 'age' or 'years' in tokens:
+                low, high = 18, 81
+            elif provider in ('salary', 'price') or tokens & {'amount', 'cost'}:
+                low, high = 1000, 100001
+            elif provider == 'id' or tokens & {'code', 'number'}:
+                low, high = 1000, 10000
             else:
-                return [random.randint(1, 1000) for _ in range(num_rows)]
+                low, high = 1, 1001
+            if unique:
+                # A shuffled walk over the range, continuing past it if the table needs more keys
+                key = self.generator.engine.unique_key(column_name)
+                return downcast_integers(low + unique_indices(np.arange(num_rows), high - low, key))
+            return integers(rng, low, high, num_rows)
                 
         elif 'float' in col_type or 'double' in col_type or 'decimal' in col_type:
-            if any(word in col_lower for word in ['price', 'amount', 'rate', 'percentage']):
-                return [round(random.uniform(1, 1000), 2) for _ in range(num_rows)]
+            if provider in ('price', 'percent') or tokens & {'amount', 'rate'}:
+                return np.round(rng.uniform(1, 1000, num_rows), 2)
             else:
-                return [round(random.uniform(0, 100), 2) for _ in range(num_rows)]
+                return np.round(rng.uniform(0, 100, num_rows), 2)
                 
         elif 'date' in col_type or 'time' in col_type:
             if 'date' in col_type:
-                return [self.generator.fake.date_between(start_date='-5y', end_date='today').strftime('%Y-%m-%d') for _ in range(num_rows)]
+                today = np.datetime64('today', 'D')
+                days_back = rng.integers(0, 5 * 365 + 2, num_rows)
+                return (today - days_back).astype('datetime64[s]')
             else:
-                return [self.generator.fake.time(pattern='%H:%M:%S') for _ in range(num_rows)]
+                seconds = pd.to_timedelta(rng.integers(0, 86400, num_rows), unit='s')
+                return string_array((pd.Timestamp(0) + seconds).strftime('%H:%M:%S'))
                 
         elif 'bool' in col_type or 'tinyint(1)' in col_type:
-            return [random.choice([True, False]) for _ in range(num_rows)]
+            return rng.random(num_rows) < 0.5
             
         else: 
-            return self.generator._generate_from_column_name(column_name, num_rows)
\ No newline at end of file
+            return self.generator._generate_from_column_name(column_name, num_rows, rng, unique=unique or None)
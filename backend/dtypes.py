@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    STRING_DTYPE = pd.StringDtype('python')
+
+_INT32 = np.iinfo(np.int32)
+
+
+def string_array(values) -> pd.api.extensions.ExtensionArray:
+    return pd.array(np.asarray(values, dtype=object), dtype=STRING_DTYPE)
+
+
+def categorical(codes: np.ndarray, categories) -> pd.Categorical:
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def int_dtype(low, high) -> np.dtype:
+    return np.dtype(np.int32 if _INT32.min <= low and high <= _INT32.max else np.int64)
+
+
+def integers(rng: np.random.Generator, low: int, high: int, size: int) -> np.ndarray:
+    # Ranges are half-open, like Generator.integers
+    return rng.integers(low, high, size, dtype=int_dtype(low, high - 1))
+
+
+def downcast_integers(values: np.ndarray) -> np.ndarray:
+    if len(values) == 0:
+        return values.astype(np.int32)
+    return values.astype(int_dtype(values.min(), values.max()))
+
+
+def with_nulls(values, mask: np.ndarray):
+    # Nulls in the column's nullable form: NumPy ints and bools become masked arrays instead
+    # of falling back to float or object
+    if not mask.any():
+        return values
+    if isinstance(values, pd.Categorical):
+        codes = values.codes.copy()
+        codes[mask] = -1
+        return pd.Categorical.from_codes(codes, dtype=values.dtype)
+    if isinstance(values, pd.api.extensions.ExtensionArray):
+        values = values.copy()
+        values[mask] = pd.NA
+        return values
+
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return pd.arrays.IntegerArray(values, mask)
+    if values.dtype.kind == 'b':
+        return pd.arrays.BooleanArray(values, mask)
+    values = values.copy()
+    if values.dtype.kind == 'f':
+        values[mask] = np.nan
+    elif values.dtype.kind in 'mM':
+        values[mask] = np.datetime64('NaT')
+    else:
+        values = values.astype(object)
+        values[mask] = None
+    return values
+
+
+def code_dtype(n_categories: int) -> np.dtype:
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class DictionaryPool:
+    # A Faker value pool kept dictionary-encoded: unique categories plus each slot's code
+    def __init__(self, values: np.ndarray, is_date: bool = False):
+        self.size = len(values)
+        self.dates = None
+        self.categories = None
+        self.codes = None
+
+        if is_date:
+            self.dates = pd.to_datetime(pd.Series(values), errors='coerce').to_numpy(dtype='datetime64[s]')
+        else:
+            uniques, inverse = np.unique(values.astype(str), return_inverse=True)
+            self.categories = pd.Index(uniques, dtype=object)
+            self.codes = inverse.astype(code_dtype(len(uniques)))
+
+    def take(self, slots: np.ndarray):
+        if self.dates is not None:
+            return self.dates[slots]
+        return categorical(self.codes[slots], self.categories)
@@ -0,0 +1,380 @@
+import json
+import os
+import socket
+import sqlite3
+import tempfile
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .reporting import Reporter
+
+
+DEFAULT_JOB_DIR = os.path.join(tempfile.gettempdir(), "sdf_jobs")
+DEFAULT_JOB_WORKERS = 2
+JOB_KINDS = ('csv', 'columns', 'mysql')
+FINISHED_STATUSES = ('done', 'failed', 'cancelled')
+# Progress and cancellation are written/checked at most this often from a running job
+PROGRESS_INTERVAL = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    rows INTEGER NOT NULL DEFAULT 0,
+    result_path TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    owner TEXT
+)
+"""
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def process_owner() -> str:
+    # Identifies the server process that submits (and so runs) a job: host and PID
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == 'nt':
+        # os.kill would terminate the process on Windows, so ask for its exit code instead
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _owner_gone(owner: Optional[str]) -> bool:
+    # Jobs from before owners were recorded can't be traced and count as orphaned; owners on
+    # other hosts (a shared job directory) are never touched
+    if owner is None:
+        return True
+    host, _, pid = owner.rpartition(':')
+    return host == socket.gethostname() and not _process_alive(int(pid))
+
+
+class JobStore:
+    # Job state in a local SQLite file, shared by the UI process and the worker processes. Each
+    # call opens its own short-lived connection, so the store is safe to use from any process.
+    def __init__(self, path: str, owner: str = None):
+        self.path = path
+        self.owner = owner
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            columns = {row['name'] for row in connection.execute("PRAGMA table_info(jobs)")}
+            if 'owner' not in columns:
+                connection.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _execute(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+        connection = self._connect()
+        try:
+            with connection:
+                return connection.execute(query, params).fetchall()
+        finally:
+            connection.close()
+
+    def create(self, kind: str, params: Dict[str, Any]) -> str:
+        job_id = uuid.uuid4().hex
+        self._execute(
+            "INSERT INTO jobs (id, kind, params, status, created_at, owner) VALUES (?, ?, ?, 'queued', ?, ?)",
+            (job_id, kind, json.dumps(params), time.time(), self.owner)
+        )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return _job_dict(rows[0]) if rows else None
+
+    def list(self, job_ids: Iterable[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        if job_ids is None:
+            rows = self._execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))
+        else:
+            job_ids = list(job_ids)
+            if not job_ids:
+                return []
+            placeholders = ', '.join('?' * len(job_ids))
+            rows = self._execute(f"SELECT * FROM jobs WHERE id IN ({placeholders}) ORDER BY created_at DESC",
+                                 tuple(job_ids))
+        return [_job_dict(row) for row in rows]
+
+    def start(self, job_id: str) -> bool:
+        # Only a queued job starts; one cancelled while waiting stays cancelled
+        connection = self._connect()
+        try:
+            with connection:
+                cursor = connection.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ? "
+                    "WHERE id = ? AND status = 'queued' AND cancel_requested = 0",
+                    (time.time(), job_id)
+                )
+                return cursor.rowcount == 1
+        finally:
+            connection.close()
+
+    def update(self, job_id: str, progress: int = None, message: str = None, rows: int = None) -> bool:
+        # Returns whether cancellation was requested, so a progress write doubles as the check
+        assignments, params = [], []
+        for column, value in (('progress', progress), ('message', message), ('rows', rows)):
+            if value is not None:
+                assignments.append(f"{column} = ?")
+                params.append(value)
+        connection = self._connect()
+        try:
+            with connection:
+                if assignments:
+                    connection.execute(f"UPDATE jobs SET {', '.join(assignments)} WHERE id = ?",
+                                       tuple(params) + (job_id,))
+                row = connection.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            connection.close()
+        return bool(row and row['cancel_requested'])
+
+    def finish(self, job_id: str, status: str, result_path: str = None, error: str = None, rows: int = None):
+        self._execute(
+            "UPDATE jobs SET status = ?, result_path = ?, error = ?, finished_at = ?, "
+            "progress = CASE WHEN ? = 'done' THEN 100 ELSE progress END, rows = COALESCE(?, rows) WHERE id = ?",
+            (status, result_path, error, time.time(), status, rows, job_id)
+        )
+
+    def cancel(self, job_id: str):
+        self._execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+        # A job no worker has picked up yet is cancelled on the spot
+        self._execute("UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'queued'",
+                      (time.time(), job_id))
+
+    def recover(self):
+        # Jobs left queued or running by a server process that has since exited will never
+        # finish; those of other live processes sharing the store are still being worked on
+        rows = self._execute("SELECT id, owner FROM jobs WHERE status IN ('queued', 'running')")
+        orphaned = [row['id'] for row in rows if _owner_gone(row['owner'])]
+        if orphaned:
+            placeholders = ', '.join('?' * len(orphaned))
+            self._execute(
+                "UPDATE jobs SET status = 'failed', error = 'Interrupted by a server restart', finished_at = ? "
+                f"WHERE id IN ({placeholders}) AND status IN ('queued', 'running')",
+                (time.time(),) + tuple(orphaned)
+            )
+
+
+def _job_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    job['params'] = json.loads(job['params'])
+    job['cancel_requested'] = bool(job['cancel_requested'])
+    return job
+
+
+class JobReporter(Reporter):
+    # Forwards progress to the job store from inside a worker and turns a cancellation request
+    # into JobCancelled at the next progress call; writes are throttled to PROGRESS_INTERVAL.
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self.percent = 0
+        self.message = ''
+        self.rows = None
+        self.last_error = None
+        self._last_write = 0.0
+
+    def progress(self, percent: int):
+        self.percent = int(percent)
+        self._flush()
+
+    def status(self, message: str):
+        self.message = message
+        self._flush()
+
+    def error(self, message: str):
+        # Kept so a failure reported without raising still reaches the job's error
+        self.last_error = message
+
+    def rows_written(self, rows: int, total: int):
+        self.rows = rows
+        self.progress(100 * rows // max(total, 1))
+
+    def _flush(self):
+        now = time.monotonic()
+        if now - self._last_write < PROGRESS_INTERVAL:
+            return
+        self._last_write = now
+        if self.store.update(self.job_id, self.percent, self.message, self.rows):
+            raise JobCancelled()
+
+
+def _track(chunks: Iterable, reporter: JobReporter, total: int) -> Iterator:
+    rows = 0
+    for chunk in chunks:
+        yield chunk
+        rows += len(chunk)
+        reporter.rows_written(rows, total)
+
+
+def run_job(store_path: str, job_id: str, kind: str, params: Dict[str, Any], secrets: Dict[str, Any],
+            result_dir: str) -> None:
+    # Entry point in the worker process. Output streams to the result file chunk by chunk, so
+    # progress is real and memory stays bounded by the chunk size.
+    from .data_generator import UniversalDataGenerator
+    from .writers import write_chunks, write_dataframe
+
+    store = JobStore(store_path)
+    if not store.start(job_id):
+        return
+    reporter = JobReporter(store, job_id)
+    result_path = os.path.join(result_dir, f"{job_id}.{params.get('format', 'csv')}")
+    try:
+        generator = UniversalDataGenerator(reporter=reporter, seed=params.get('seed'))
+        num_rows = params['num_rows']
+        chunksize = params.get('chunksize', 100_000)
+        if kind == 'csv':
+            reporter.status("Profiling source data...")
+            profiler, _ = generator.profile_csv(params['csv_file'], params.get('streaming', False),
+                                                columns=params.get('columns'))
+            chunks = generator.iter_profile_chunks(profiler.profiles, num_rows, chunksize, copula=profiler.copula,
+                                                   missingness=profiler.missingness)
+            rows = write_chunks(_track(chunks, reporter, num_rows), result_path)
+        elif kind == 'columns':
+            chunks = generator.iter_column_chunks(params['columns'], num_rows, chunksize)
+            rows = write_chunks(_track(chunks, reporter, num_rows), result_path)
+        elif kind == 'mysql':
+            from .connection_pool import mysql_connector
+            from .database_handler import DatabaseHandler
+
+            connection = mysql_connector(params['host'], params['user'], secrets.get('password', ''),
+                                         params['database'])()
+            try:
+                synthetic_df, _ = DatabaseHandler(generator).generate_from_mysql_table(
+                    connection, params['table'], num_rows, sampling=params.get('sampling', 'first')
+                )
+            finally:
+                connection.close()
+            if synthetic_df is None:
+                raise ValueError(reporter.last_error or f"Could not generate data for table {params['table']}")
+            rows = write_dataframe(synthetic_df, result_path)
+        else:
+            raise ValueError(f"Unknown job kind: {kind}")
+    except JobCancelled:
+        _remove(result_path)
+        store.finish(job_id, 'cancelled')
+        return
+    except Exception as e:
+        _remove(result_path)
+        store.finish(job_id, 'failed', error=f"{type(e).__name__}: {e}")
+        return
+    store.finish(job_id, 'done', result_path=result_path, rows=rows)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class JobQueue:
+    """Runs generation jobs in a pool of worker processes.
+
+    Jobs are recorded in a JobStore under `directory` together with their result files, so any
+    process (or Streamlit session) holding a job ID can poll its progress, cancel it and
+    download the result. Secrets such as database passwords go to the worker but are never
+    written to the store.
+    """
+
+    def __init__(self, directory: str = DEFAULT_JOB_DIR, workers: int = DEFAULT_JOB_WORKERS):
+        self.directory = directory
+        self.result_dir = os.path.join(directory, 'results')
+        self.upload_dir = os.path.join(directory, 'uploads')
+        os.makedirs(self.result_dir, exist_ok=True)
+        os.makedirs(self.upload_dir, exist_ok=True)
+        self.store = JobStore(os.path.join(directory, 'jobs.sqlite'), owner=process_owner())
+        self.store.recover()
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._futures: Dict[str, Future] = {}
+
+    def submit(self, kind: str, params: Dict[str, Any], secrets: Dict[str, Any] = None) -> str:
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}; expected one of {', '.join(JOB_KINDS)}")
+        job_id = self.store.create(kind, params)
+        self._futures[job_id] = self._executor.submit(
+            run_job, self.store.path, job_id, kind, params, secrets or {}, self.result_dir
+        )
+        self._futures[job_id].add_done_callback(lambda future, job_id=job_id: self._on_done(job_id, future))
+        return job_id
+
+    def stage_upload(self, data: bytes, suffix: str = '.csv') -> str:
+        # Source files get their own path per job, so concurrent users never overwrite each other
+        path = os.path.join(self.upload_dir, f"{uuid.uuid4().hex}{suffix}")
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def jobs(self, job_ids: Iterable[str] = None) -> List[Dict[str, Any]]:
+        return self.store.list(job_ids)
+
+    def cancel(self, job_id: str):
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()
+        self.store.cancel(job_id)
+
+    def wait(self, job_id: str, timeout: float = None) -> Optional[Dict[str, Any]]:
+        future = self._futures.get(job_id)
+        if future is not None:
+            try:
+                future.result(timeout)
+            except Exception:
+                pass
+        return self.status(job_id)
+
+    def shutdown(self, wait: bool = True):
+        # Jobs not yet handed to a worker are dropped; Executor.shutdown(cancel_futures=True)
+        # does the same but needs Python 3.9
+        for future in list(self._futures.values()):
+            future.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _on_done(self, job_id: str, future: Future):
+        self._futures.pop(job_id, None)
+        # A worker that died (or a future cancelled before it ran) never recorded an outcome
+        job = self.store.get(job_id)
+        if job is not None and job['status'] not in FINISHED_STATUSES:
+            if future.cancelled():
+                self.store.finish(job_id, 'cancelled')
+            else:
+                error = future.exception()
+                self.store.finish(job_id, 'failed', error=f"Worker stopped: {error}")
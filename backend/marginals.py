@@ -0,0 +1,49 @@
+import numpy as np
+
+
+DEFAULT_TABLE_SIZE = 1024
+
+
+class QuantileTable:
+    # A column's inverse CDF tabulated at evenly spaced probabilities. Float columns interpolate
+    # between the knots (probabilities i / size); integer columns step through knots taken at
+    # the bin midpoints, so only observed levels come out with their observed frequencies.
+    def __init__(self, knots: np.ndarray, is_integer: bool = False):
+        self.knots = np.asarray(knots, dtype=float)
+        self.is_integer = is_integer
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, is_integer: bool = False,
+                    size: int = DEFAULT_TABLE_SIZE) -> 'QuantileTable':
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if is_integer:
+            knots = np.quantile(values, (np.arange(size) + 0.5) / size, method='inverted_cdf')
+        else:
+            knots = np.quantile(values, np.linspace(0, 1, size + 1))
+        return cls(knots, is_integer)
+
+    @classmethod
+    def from_sketch(cls, sketch, is_integer: bool = False, size: int = DEFAULT_TABLE_SIZE) -> 'QuantileTable':
+        if is_integer:
+            knots = sketch.quantile((np.arange(size) + 0.5) / size)
+        else:
+            knots = sketch.quantile(np.linspace(0, 1, size + 1))
+            knots[0], knots[-1] = sketch.min, sketch.max
+        return cls(knots, is_integer)
+
+    def sample(self, uniforms: np.ndarray) -> np.ndarray:
+        if self.is_integer:
+            slots = np.minimum((uniforms * len(self.knots)).astype(np.int64), len(self.knots) - 1)
+            return self.knots[slots]
+        return interpolate_sorted(self.knots, uniforms * (len(self.knots) - 1))
+
+
+def interpolate_sorted(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    # np.interp over an evenly spaced grid, without its binary search
+    top = len(values) - 1
+    positions = np.clip(positions, 0, top)
+    lower = np.minimum(positions.astype(np.int64), max(top - 1, 0))
+    upper = np.minimum(lower + 1, top)
+    fraction = positions - lower
+    return values[lower] + fraction * (values[upper] - values[lower])
@@ -0,0 +1,149 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:
+    # Unix only; on Windows peak memory is reported as 0
+    resource = None
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+StageKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+
+class StageStats:
+    __slots__ = ('calls', 'seconds', 'rows', 'rss_delta', 'peak_rss')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.rss_delta = 0
+        self.peak_rss = 0
+
+    def merge(self, other: 'StageStats'):
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.rows += other.rows
+        self.rss_delta += other.rss_delta
+        self.peak_rss = max(self.peak_rss, other.peak_rss)
+
+
+class StageRun:
+    # Yielded by Metrics.stage; set rows when the count is only known at the end
+    __slots__ = ('rows',)
+
+    def __init__(self, rows: int = 0):
+        self.rows = rows
+
+
+class Metrics:
+    # Accumulated wall time, row counts and resident memory per pipeline stage. Stages are keyed
+    # by name plus labels (column, provider, table...), so slow columns show up on their own.
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.stages: Dict[StageKey, StageStats] = {}
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0, **labels) -> Iterator['StageRun']:
+        run = StageRun(rows)
+        rss_before = current_rss_bytes() if self.track_memory else 0
+        started = time.perf_counter()
+        try:
+            yield run
+        finally:
+            elapsed = time.perf_counter() - started
+            rss_after = current_rss_bytes() if self.track_memory else 0
+            self.record(name, elapsed, run.rows, rss_after - rss_before, rss_after, **labels)
+
+    def record(self, name: str, seconds: float, rows: int = 0, rss_delta: int = 0, rss: int = 0, **labels):
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        stats = self.stages.get(key)
+        if stats is None:
+            stats = self.stages[key] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.rows += rows
+        stats.rss_delta += rss_delta
+        stats.peak_rss = max(stats.peak_rss, rss)
+
+    def merge(self, other: 'Metrics'):
+        for key, other_stats in other.stages.items():
+            stats = self.stages.get(key)
+            if stats is None:
+                stats = self.stages[key] = StageStats()
+            stats.merge(other_stats)
+
+    def reset(self):
+        self.stages = {}
+
+    def summary(self) -> pd.DataFrame:
+        records = []
+        for (name, labels), stats in self.stages.items():
+            records.append({
+                'stage': name,
+                **dict(labels),
+                'calls': stats.calls,
+                'seconds': stats.seconds,
+                'rows': stats.rows,
+                'rows_per_sec': stats.rows / stats.seconds if stats.rows and stats.seconds > 0 else None,
+                'rss_delta_mb': stats.rss_delta / 2 ** 20,
+                'peak_rss_mb': stats.peak_rss / 2 ** 20,
+            })
+        frame = pd.DataFrame(records)
+        if len(frame) == 0:
+            return frame
+        values = ['calls', 'seconds', 'rows', 'rows_per_sec', 'rss_delta_mb', 'peak_rss_mb']
+        labels = [col for col in frame.columns if col not in values]
+        frame[labels] = frame[labels].fillna('')
+        return frame[labels + values].sort_values('seconds', ascending=False, ignore_index=True)
+
+    def to_openmetrics(self, prefix: str = 'sdf') -> str:
+        families = [
+            ('stage_seconds', 'counter', "Wall time spent in a pipeline stage", lambda s: s.seconds),
+            ('stage_calls', 'counter', "Times a pipeline stage ran", lambda s: s.calls),
+            ('stage_rows', 'counter', "Rows processed by a pipeline stage", lambda s: s.rows),
+            ('stage_rss_bytes', 'gauge', "Resident memory at the end of a pipeline stage (max)", lambda s: s.peak_rss),
+        ]
+        lines = []
+        for family, metric_type, help_text, value in families:
+            name = f"{prefix}_{family}"
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"# HELP {name} {help_text}.")
+            sample = f"{name}_total" if metric_type == 'counter' else name
+            for (stage, labels), stats in self.stages.items():
+                label_text = ','.join(f'{label}="{_escape_label(v)}"' for label, v in (('stage', stage),) + labels)
+                lines.append(f"{sample}{{{label_text}}} {value(stats)}")
+
+        name = f"{prefix}_process_peak_rss_bytes"
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"# HELP {name} Peak resident memory of this process.")
+        lines.append(f"{name} {peak_rss_bytes()}")
+        lines.append("# EOF")
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
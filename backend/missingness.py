@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_MAX_PATTERNS = 256
+
+
+class MissingnessProfile:
+    # Per-column null counts plus the joint null patterns across columns, so columns that go
+    # missing together (a whole address block, say) stay missing together in the output.
+    # Patterns are counted exactly up to max_patterns distinct ones; past that, the columns
+    # are masked independently at their own rates.
+    def __init__(self, max_patterns: int = DEFAULT_MAX_PATTERNS):
+        self.max_patterns = max_patterns
+        self.columns: Optional[List[str]] = None
+        self.row_count = 0
+        self.null_counts = np.zeros(0, dtype=np.int64)
+        # Packed null bitmaps of rows with at least one null -> row count
+        self.pattern_counts: Optional[Dict[bytes, int]] = {}
+        self._patterns: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @property
+    def overflowed(self) -> bool:
+        return self.pattern_counts is None
+
+    @property
+    def null_rates(self) -> Dict[str, float]:
+        if not self.row_count:
+            return {}
+        return {col: count / self.row_count for col, count in zip(self.columns, self.null_counts) if count}
+
+    def update(self, chunk: pd.DataFrame):
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.null_counts = np.zeros(len(self.columns), dtype=np.int64)
+        nulls = chunk.reindex(columns=self.columns).isna().to_numpy()
+        self.null_counts += nulls.sum(axis=0)
+        self.row_count += len(chunk)
+        self._patterns = None
+        if self.overflowed:
+            return
+
+        nulls = nulls[nulls.any(axis=1)]
+        if len(nulls) == 0:
+            return
+        keys, counts = np.unique(np.packbits(nulls, axis=1), axis=0, return_counts=True)
+        for key, count in zip(keys, counts):
+            key = key.tobytes()
+            self.pattern_counts[key] = self.pattern_counts.get(key, 0) + int(count)
+        if len(self.pattern_counts) > self.max_patterns:
+            self.pattern_counts = None
+
+    def patterns(self) -> Tuple[np.ndarray, np.ndarray]:
+        # (patterns x columns) null matrix, the all-present pattern first, and cumulative weights
+        if self._patterns is None:
+            keys = list(self.pattern_counts)
+            matrix = np.zeros((len(keys) + 1, len(self.columns)), dtype=bool)
+            for i, key in enumerate(keys, start=1):
+                matrix[i] = np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=len(self.columns))
+            counts = np.array([self.row_count - sum(self.pattern_counts.values())] +
+                              [self.pattern_counts[key] for key in keys], dtype=float)
+            self._patterns = (matrix, np.cumsum(counts) / self.row_count)
+        return self._patterns
+
+    def sample(self, num_rows: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        # A boolean null mask per column that had nulls; one pattern draw per row
+        active = np.flatnonzero(self.null_counts)
+        if not self.row_count or len(active) == 0:
+            return {}
+        if self.overflowed:
+            rates = self.null_counts[active] / self.row_count
+            masks = rng.random((len(active), num_rows)) < rates[:, None]
+        else:
+            matrix, cumulative = self.patterns()
+            picks = np.minimum(np.searchsorted(cumulative, rng.random(num_rows), side='right'), len(matrix) - 1)
+            masks = matrix[:, active].T[:, picks]
+        return {self.columns[j]: masks[i] for i, j in enumerate(active)}
+
+
+def missingness_of(df: pd.DataFrame, max_patterns: int = DEFAULT_MAX_PATTERNS) -> MissingnessProfile:
+    profile = MissingnessProfile(max_patterns)
+    profile.update(df)
+    return profile
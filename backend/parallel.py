@@ -0,0 +1,109 @@
+import os
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .copula import GaussianCopula
+from .missingness import MissingnessProfile
+from .data_generator import UniversalDataGenerator
+from .metrics import Metrics
+from .providers import DEFAULT_POOL_SIZE
+
+
+DEFAULT_SHARD_ROWS = 250_000
+
+# Per-process state installed by _init_worker
+_worker_state = {}
+
+
+def _init_worker(source, pool_size: int, seed_seq: np.random.SeedSequence, copula: GaussianCopula = None,
+                 missingness: MissingnessProfile = None, unique_keys: bool = True):
+    _worker_state['source'] = source
+    _worker_state['copula'] = copula
+    _worker_state['missingness'] = missingness
+    _worker_state['generator'] = UniversalDataGenerator(pool_size=pool_size, seed=seed_seq, unique_keys=unique_keys)
+
+
+def _generate_block(columns: Tuple[str, ...], start: int, size: int) -> Tuple[Dict[str, object], Metrics]:
+    generator = _worker_state['generator']
+    source = _worker_state['source']
+    generator.metrics.reset()
+
+    # Column streams are derived from (seed, column, row offset), so results don't depend on scheduling
+    if isinstance(source, dict):
+        frame = generator.generate_from_profiles({col: source[col] for col in columns}, size, row_offset=start,
+                                                 copula=_worker_state['copula'],
+                                                 missingness=_worker_state['missingness'])
+    else:
+        frame = generator.generate_columns_frame(list(columns), size, row_offset=start)
+    return {col: frame[col].array for col in columns}, generator.metrics
+
+
+class ParallelGenerator:
+    def __init__(self, workers: Optional[int] = None, seed: Optional[int] = None,
+                 shard_rows: int = DEFAULT_SHARD_ROWS, pool_size: int = DEFAULT_POOL_SIZE,
+                 generator: UniversalDataGenerator = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_rows = shard_rows
+        self.pool_size = pool_size
+        self.generator = generator if generator is not None else UniversalDataGenerator(pool_size=pool_size)
+        if seed is not None or self.generator.seed_seq is None:
+            self.generator.reseed(seed)
+
+    def iter_profile_chunks(self, profiles: Dict[str, object], num_rows: int,
+                            chunk_size: Optional[int] = None, copula: GaussianCopula = None,
+                            missingness: MissingnessProfile = None) -> Iterator[pd.DataFrame]:
+        # Copula columns are one unit of work, since they are sampled jointly
+        joint = tuple(col for col in copula.columns if col in profiles) if copula is not None else ()
+        units = ([joint] if joint else []) + [(col,) for col in profiles if col not in joint]
+        return self._iter_chunks(profiles, units, list(profiles), num_rows, chunk_size or self.shard_rows,
+                                 copula, missingness)
+
+    def iter_column_chunks(self, columns: List[str], num_rows: int,
+                           chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        units = [(col,) for col in columns]
+        return self._iter_chunks(list(columns), units, list(columns), num_rows, chunk_size or self.shard_rows)
+
+    def generate_from_profiles(self, profiles: Dict[str, object], num_rows: int,
+                               copula: GaussianCopula = None, missingness: MissingnessProfile = None) -> pd.DataFrame:
+        return pd.concat(self.iter_profile_chunks(profiles, num_rows, copula=copula, missingness=missingness))
+
+    def generate_from_columns(self, columns: List[str], num_rows: int) -> pd.DataFrame:
+        return pd.concat(self.iter_column_chunks(columns, num_rows))
+
+    def _iter_chunks(self, source, units: List[Tuple[str, ...]], columns: List[str], num_rows: int,
+                     shard_rows: int, copula: GaussianCopula = None,
+                     missingness: MissingnessProfile = None) -> Iterator[pd.DataFrame]:
+        shards = [(start, min(shard_rows, num_rows - start)) for start in range(0, num_rows, shard_rows)]
+        # Keep enough shards in flight to occupy every worker without buffering the whole output
+        lookahead = max(2, -(-2 * self.workers // max(len(units), 1)))
+        reporter = self.generator.reporter
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(source, self.pool_size, self.generator.seed_seq, copula, missingness,
+                                           self.generator.unique_keys)) as executor:
+            pending = deque()
+            next_shard = 0
+
+            for _ in range(len(shards)):
+                while next_shard < len(shards) and len(pending) < lookahead:
+                    start, size = shards[next_shard]
+                    futures = [
+                        executor.submit(_generate_block, unit, start, size)
+                        for unit in units
+                    ]
+                    pending.append((start, size, futures))
+                    next_shard += 1
+
+                start, size, futures = pending.popleft()
+                blocks = {}
+                for future in futures:
+                    arrays, block_metrics = future.result()
+                    blocks.update(arrays)
+                    self.generator.metrics.merge(block_metrics)
+                chunk = pd.DataFrame({col: blocks[col] for col in columns})
+                chunk.index = pd.RangeIndex(start, start + size)
+                reporter.progress(int(100 * (start + size) / num_rows))
+                yield self.generator._apply_relationships(chunk, row_offset=start)
@@ -0,0 +1,265 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+from .copula import GaussianCopula
+from .marginals import QuantileTable
+from .missingness import MissingnessProfile
+from .readers import iter_source_chunks
+from .sketches import DEFAULT_SKETCH_K, QuantileSketch
+
+
+DEFAULT_CHUNKSIZE = 100_000
+DEFAULT_RESERVOIR_SIZE = 10_000
+DEFAULT_MAX_DISTINCT = 64
+
+
+class NumericProfile:
+    kind = 'numeric'
+
+    def __init__(self, name: str, reservoir_size: int = DEFAULT_RESERVOIR_SIZE, sketch_k: int = DEFAULT_SKETCH_K):
+        self.name = name
+        self.count = 0
+        self.null_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.is_integer = True
+        self.reservoir_size = reservoir_size
+        self.reservoir = np.empty(0, dtype=float)
+        self.sketch = QuantileSketch(sketch_k)
+        self._table: Optional[QuantileTable] = None
+
+    @property
+    def std(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return float(np.sqrt(self.m2 / (self.count - 1)))
+
+    @property
+    def null_rate(self) -> float:
+        total = self.count + self.null_count
+        return self.null_count / total if total else 0.0
+
+    def quantile_table(self) -> QuantileTable:
+        # Built once from the whole-stream sketch and reused for every generated block
+        if self._table is None:
+            self._table = QuantileTable.from_sketch(self.sketch, self.is_integer)
+        return self._table
+
+    def update(self, column_data: pd.Series, rng: np.random.Generator):
+        if not pd.api.types.is_numeric_dtype(column_data):
+            column_data = pd.to_numeric(column_data, errors='coerce')
+        self.is_integer = self.is_integer and pd.api.types.is_integer_dtype(column_data)
+
+        values = column_data.to_numpy(dtype=float, na_value=np.nan)
+        nulls = np.isnan(values)
+        self.null_count += int(nulls.sum())
+        values = values[~nulls]
+        if len(values) == 0:
+            return
+
+        # Chan et al. pairwise update of the Welford accumulators
+        n_b = len(values)
+        mean_b = values.mean()
+        m2_b = ((values - mean_b) ** 2).sum()
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.count * n_b / n
+
+        chunk_min, chunk_max = values.min(), values.max()
+        self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+        self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+
+        self._update_reservoir(values, rng)
+        self.sketch.update(values, rng)
+        self._table = None
+        self.count = n
+
+    def _update_reservoir(self, values: np.ndarray, rng: np.random.Generator):
+        self.reservoir = update_reservoir(self.reservoir, values, self.count, self.reservoir_size, rng)
+
+
+def update_reservoir(reservoir: np.ndarray, values: np.ndarray, seen: int, size: int,
+                     rng: np.random.Generator) -> np.ndarray:
+    # Works on the first axis, so a 2-D reservoir samples whole rows
+    free = size - len(reservoir)
+    if free > 0:
+        taken = values[:free]
+        reservoir = np.concatenate([reservoir, taken])
+        values = values[free:]
+        seen += len(taken)
+    if len(values) == 0:
+        return reservoir
+
+    # Algorithm R: the i-th value seen (1-based) replaces slot j ~ U[0, i) when j < k
+    positions = np.arange(seen + 1, seen + len(values) + 1)
+    slots = (rng.random(len(values)) * positions).astype(np.int64)
+    keep = slots < size
+    reservoir[slots[keep]] = values[keep]
+    return reservoir
+
+
+class TextProfile:
+    kind = 'text'
+
+    def __init__(self, name: str, max_distinct: int = DEFAULT_MAX_DISTINCT):
+        self.name = name
+        self.count = 0
+        self.null_count = 0
+        self.max_distinct = max_distinct
+        self.value_counts: Optional[Dict] = {}
+
+    @property
+    def overflowed(self) -> bool:
+        return self.value_counts is None
+
+    @property
+    def distinct_count(self) -> Optional[int]:
+        return None if self.overflowed else len(self.value_counts)
+
+    def update(self, column_data: pd.Series, rng: np.random.Generator = None):
+        clean_data = column_data.dropna()
+        self.null_count += len(column_data) - len(clean_data)
+        self.count += len(clean_data)
+
+        if self.overflowed or len(clean_data) == 0:
+            return
+
+        for value, count in clean_data.value_counts(sort=False).items():
+            self.value_counts[value] = self.value_counts.get(value, 0) + int(count)
+            if len(self.value_counts) > self.max_distinct:
+                self.value_counts = None
+                return
+
+    def values(self) -> np.ndarray:
+        return np.array(list(self.value_counts), dtype=object)
+
+
+class BooleanProfile:
+    # True/False counts; generated columns are bool, or nullable boolean when nulls are drawn
+    kind = 'boolean'
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.null_count = 0
+        self.true_count = 0
+
+    @property
+    def true_rate(self) -> float:
+        return self.true_count / self.count if self.count else 0.5
+
+    def update(self, column_data: pd.Series, rng: np.random.Generator = None):
+        clean_data = column_data.dropna()
+        self.null_count += len(column_data) - len(clean_data)
+        self.count += len(clean_data)
+        self.true_count += int(clean_data.astype(bool).sum())
+
+
+class OtherProfile:
+    kind = 'other'
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.null_count = 0
+
+    def update(self, column_data: pd.Series, rng: np.random.Generator = None):
+        self.null_count += int(column_data.isna().sum())
+        self.count += len(column_data) - int(column_data.isna().sum())
+
+
+class StreamingProfiler:
+    def __init__(self, chunksize: int = DEFAULT_CHUNKSIZE, reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+                 max_distinct: int = DEFAULT_MAX_DISTINCT, rng: np.random.Generator = None):
+        self.chunksize = chunksize
+        self.reservoir_size = reservoir_size
+        self.max_distinct = max_distinct
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.profiles: Dict[str, object] = {}
+        self.row_count = 0
+        self.head: Optional[pd.DataFrame] = None
+        # Row-aligned reservoir over the numeric columns, which keeps their joint structure
+        self.joint_columns: Optional[List[str]] = None
+        self.joint_sample = np.empty((0, 0))
+        self.copula: Optional[GaussianCopula] = None
+        self.missingness = MissingnessProfile()
+
+    def profile_csv(self, csv_file: str, columns: Optional[List[str]] = None) -> Dict[str, object]:
+        # Also reads Parquet and Arrow files; only `columns` are read when given
+        return self.profile_chunks(iter_source_chunks(csv_file, self.chunksize, columns))
+
+    def profile_chunks(self, chunks: Iterable[pd.DataFrame]) -> Dict[str, object]:
+        for chunk in chunks:
+            self.update(chunk)
+        return self.profiles
+
+    def update(self, chunk: pd.DataFrame):
+        if self.head is None:
+            self.head = chunk.head()
+
+        for col in chunk.columns:
+            if col not in self.profiles:
+                self.profiles[col] = self._new_profile(col, chunk[col])
+            self.profiles[col].update(chunk[col], self.rng)
+
+        self._update_joint_sample(chunk)
+        self.missingness.update(chunk)
+        self.row_count += len(chunk)
+
+    def _update_joint_sample(self, chunk: pd.DataFrame):
+        if self.joint_columns is None:
+            self.joint_columns = [name for name, profile in self.profiles.items() if profile.kind == 'numeric']
+            self.joint_sample = np.empty((0, len(self.joint_columns)))
+        if not self.joint_columns:
+            return
+
+        rows = np.column_stack([
+            pd.to_numeric(chunk[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            if col in chunk.columns else np.full(len(chunk), np.nan)
+            for col in self.joint_columns
+        ])
+        self.joint_sample = update_reservoir(self.joint_sample, rows, self.row_count, self.reservoir_size, self.rng)
+
+    def fit_copula(self) -> Optional[GaussianCopula]:
+        if self.joint_columns:
+            integer_columns = [col for col in self.joint_columns if self.profiles[col].is_integer]
+            self.copula = GaussianCopula.fit(self.joint_columns, self.joint_sample, integer_columns)
+        return self.copula
+
+    def _new_profile(self, name: str, column_data: pd.Series):
+        # Checked first: pandas counts bool (and nullable boolean) as numeric
+        if pd.api.types.is_bool_dtype(column_data):
+            return BooleanProfile(name)
+        elif pd.api.types.is_numeric_dtype(column_data):
+            return NumericProfile(name, self.reservoir_size)
+        elif (pd.api.types.is_string_dtype(column_data) or pd.api.types.is_object_dtype(column_data)
+              or pd.api.types.is_datetime64_any_dtype(column_data)):
+            # Typed readers return dates as datetimes; they are modelled like dates read as text
+            return TextProfile(name, self.max_distinct)
+        else:
+            return OtherProfile(name)
+
+    def sample_frame(self) -> pd.DataFrame:
+        samples = {
+            name: pd.Series(profile.reservoir)
+            for name, profile in self.profiles.items()
+            if profile.kind == 'numeric'
+        }
+        return pd.DataFrame(samples)
+
+    def sketches(self) -> Dict[str, QuantileSketch]:
+        return {
+            name: profile.sketch
+            for name, profile in self.profiles.items()
+            if profile.kind == 'numeric'
+        }
+
+
+def profile_frame(df: pd.DataFrame, rng: np.random.Generator = None) -> StreamingProfiler:
+    profiler = StreamingProfiler(reservoir_size=max(len(df), 1), rng=rng)
+    profiler.update(df)
+    return profiler
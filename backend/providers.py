@@ -0,0 +1,225 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from . import dtypes
+from .classifier import DEFAULT_CLASSIFIER, ColumnClassifier
+from .dtypes import DictionaryPool, categorical, code_dtype, string_array
+from .seeding import faker_seed, stable_key
+from .unique import BOUNDED_FORMATS, DEFAULT_SUFFIX, SUFFIXES, UNIQUE_FORMATS, SuffixedPool, unique_indices
+
+
+DEFAULT_POOL_SIZE = 2000
+
+DATE_PROVIDERS = {'date', 'dob', 'date_of_birth', 'birth_date', 'birthdate', 'birthday'}
+
+
+class ValuePoolEngine:
+    def __init__(self, fake, rng: np.random.Generator, pool_size: int = DEFAULT_POOL_SIZE,
+                 seed_seq: Optional[np.random.SeedSequence] = None, classifier: ColumnClassifier = None):
+        self.fake = fake
+        self.rng = rng
+        self.pool_size = pool_size
+        self.seed_seq = seed_seq
+        self.classifier = classifier if classifier is not None else DEFAULT_CLASSIFIER
+        self._pools: Dict[str, np.ndarray] = {}
+        self._encoded: Dict[str, DictionaryPool] = {}
+        self._unique: Dict[str, SuffixedPool] = {}
+        self._unique_salt: Optional[int] = None
+
+        self.vectorized = self._build_vectorized_methods()
+        self.faker_methods = self._build_faker_methods()
+
+    def _build_faker_methods(self) -> Dict[str, Callable]:
+        fake = self.fake
+        return {
+            # Personal Information
+            'name': fake.name,
+            'first_name': fake.first_name,
+            'last_name': fake.last_name,
+            'full_name': fake.name,
+            'username': fake.user_name,
+            'password': fake.password,
+
+            # Contact Information
+            'email': fake.email,
+
+            # Location Information
+            'address': lambda: fake.address().replace('\n', ', '),
+            'street': fake.street_address,
+            'city': fake.city,
+            'state': fake.state,
+            'country': fake.country,
+            'zip': fake.zipcode,
+            'postal': fake.postcode,
+            'location': fake.city,
+
+            # Company & Professional
+            'company': fake.company,
+            'job': fake.job,
+            'job_title': fake.job,
+            'industry': fake.bs,
+
+            # Financial
+            'credit_card': fake.credit_card_number,
+            'iban': fake.iban,
+            'currency': fake.currency_code,
+
+            # Internet & Tech
+            'url': fake.url,
+            'website': fake.url,
+            'domain': fake.domain_name,
+            'ip': fake.ipv4,
+            'user_agent': fake.user_agent,
+
+            # Dates & Times
+            'date': fake.date,
+            'time': fake.time,
+            'month': fake.month_name,
+
+            # Date of Birth variations
+            'dob': fake.date_of_birth,
+            'date_of_birth': fake.date_of_birth,
+            'birth_date': fake.date_of_birth,
+            'birthdate': fake.date_of_birth,
+            'birthday': fake.date_of_birth,
+
+            # Products & Commerce
+            'product': fake.word,
+            'brand': fake.company,
+            'color': fake.color_name,
+
+            # Education
+            'school': fake.company,
+            'university': fake.company,
+
+            # Medical
+            'hospital': fake.company,
+            'doctor': fake.name,
+
+            # Vehicles
+            'car': lambda: f"{fake.company()} {fake.word()}",
+            'license': fake.license_plate,
+
+            # Identification
+            'ssn': fake.ssn,
+            'passport': fake.passport_number,
+
+            # Fallbacks
+            'first': fake.first_name,
+            'last': fake.last_name,
+            'word': fake.word,
+        }
+
+    def _build_vectorized_methods(self) -> Dict[str, Callable[[int, np.random.Generator], object]]:
+        current_year = datetime.now().year
+
+        def choice(options):
+            categories = pd.Index(options, dtype=object)
+            code_type = code_dtype(len(options))
+            return lambda n, rng: categorical(rng.integers(0, len(options), n, dtype=code_type), categories)
+
+        def prefixed(prefix, low, high):
+            return lambda n, rng: string_array(np.char.add(prefix, rng.integers(low, high, n).astype(str)))
+
+        def integers(low, high):
+            return lambda n, rng: dtypes.integers(rng, low, high, n)
+
+        def uniform(low, high):
+            return lambda n, rng: np.round(rng.uniform(low, high, n), 2)
+
+        boolean = lambda n, rng: rng.random(n) < 0.5
+
+        return {
+            'phone': prefixed('', 6000000000, 10000000000),
+            'mobile': prefixed('', 6000000000, 10000000000),
+            'year': integers(1970, current_year + 1),
+            'grade': choice(['A', 'B', 'C', 'D', 'F']),
+            'disease': choice(['Flu', 'Cold', 'Headache', 'Fever', 'Allergy']),
+            'id': prefixed('ID_', 1000, 10000),
+            'age': integers(18, 71),
+            'salary': integers(30000, 150001),
+            'price': uniform(10, 1000),
+            'quantity': integers(1, 101),
+            'score': integers(0, 101),
+            'rating': integers(1, 6),
+            'serial': prefixed('SN', 0, 100000000),
+            'is_': boolean,
+            'has_': boolean,
+            'active': boolean,
+            'status': choice(['Active', 'Inactive', 'Pending']),
+            'gender': choice(['Male', 'Female']),
+            'number': integers(1, 1001),
+            'percent': uniform(0, 100),
+        }
+
+    def resolve(self, column_name: str) -> str:
+        return self.classifier.classify(column_name)
+
+    def generate(self, column_name: str, num_rows: int, rng: np.random.Generator = None):
+        return self.draw(self.resolve(column_name), num_rows, rng)
+
+    def draw(self, provider: str, num_rows: int, rng: np.random.Generator = None):
+        rng = rng if rng is not None else self.rng
+        if provider in self.vectorized:
+            return self.vectorized[provider](num_rows, rng)
+
+        pool = self.encoded_pool(provider)
+        return pool.take(rng.integers(0, pool.size, num_rows))
+
+    def supports_unique(self, provider: str) -> bool:
+        return provider in UNIQUE_FORMATS or (provider in self.faker_methods and provider not in DATE_PROVIDERS)
+
+    def unique_capacity(self, provider: str) -> Optional[int]:
+        # Most unique values go on past their space (longer counters, suffixes); these can't
+        return UNIQUE_FORMATS[provider][0] if provider in BOUNDED_FORMATS else None
+
+    def unique_key(self, key: str) -> int:
+        if self.seed_seq is not None:
+            return faker_seed(self.seed_seq, 'unique', key)
+        if self._unique_salt is None:
+            # Without a seed, unique permutations are still fixed for the engine's lifetime
+            self._unique_salt = int(self.rng.integers(0, 2 ** 63))
+        return self._unique_salt ^ stable_key(key)
+
+    def draw_unique(self, provider: str, num_rows: int, row_offset: int = 0, key: str = None):
+        # Values for rows [row_offset, row_offset + num_rows) that never repeat across chunks
+        # or workers; `key` picks the permutation, so two columns don't share one
+        positions = np.arange(row_offset, row_offset + num_rows, dtype=np.int64)
+        key = self.unique_key(key if key is not None else provider)
+        if provider in UNIQUE_FORMATS:
+            domain, format_values = UNIQUE_FORMATS[provider]
+            return format_values(unique_indices(positions, domain, key))
+
+        pool = self.unique_pool(provider)
+        return pool.take(unique_indices(positions, pool.size, key))
+
+    def unique_pool(self, provider: str) -> SuffixedPool:
+        pool = self._unique.get(provider)
+        if pool is None:
+            pool = SuffixedPool(self.pool(provider), *SUFFIXES.get(provider, DEFAULT_SUFFIX))
+            self._unique[provider] = pool
+        return pool
+
+    def encoded_pool(self, provider: str) -> DictionaryPool:
+        encoded = self._encoded.get(provider)
+        if encoded is None:
+            encoded = DictionaryPool(self.pool(provider), is_date=provider in DATE_PROVIDERS)
+            self._encoded[provider] = encoded
+        return encoded
+
+    def pool(self, provider: str) -> np.ndarray:
+        # Always the full pool_size, built in one go: its contents depend only on the seed and
+        # the provider, never on how many rows earlier calls (or other workers) asked for
+        pool = self._pools.get(provider)
+        if pool is not None:
+            return pool
+
+        method = self.faker_methods[provider]
+        if self.seed_seq is not None:
+            self.fake.seed_instance(faker_seed(self.seed_seq, 'pool', provider))
+        pool = np.empty(self.pool_size, dtype=object)
+        for i in range(self.pool_size):
+            pool[i] = method()
+        self._pools[provider] = pool
+        return pool
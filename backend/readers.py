@@ -0,0 +1,209 @@
+import hashlib
+import os
+import pandas as pd
+from typing import Callable, Iterator, List, Optional
+
+from .cache import file_content_hash
+from .dtypes import STRING_DTYPE
+
+
+DEFAULT_READ_ROWS = 100_000
+# Block size for the Arrow CSV reader; each block becomes (at most) one record batch
+CSV_BLOCK_BYTES = 16 * 1024 * 1024
+
+INPUT_FORMATS = {
+    '.csv': 'csv',
+    '.csv.gz': 'csv',
+    '.csv.bz2': 'csv',
+    '.csv.zst': 'csv',
+    '.csv.lz4': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'ipc',
+    '.arrow': 'ipc',
+    '.ipc': 'ipc',
+}
+
+
+def input_suffix(path: str) -> str:
+    # Anything unrecognised is read as plain CSV, as before other formats were supported
+    lower = path.lower()
+    return next((suffix for suffix in sorted(INPUT_FORMATS, key=len, reverse=True) if lower.endswith(suffix)), '.csv')
+
+
+def infer_input_format(path: str) -> str:
+    return INPUT_FORMATS[input_suffix(path)]
+
+
+def _import_pyarrow(fmt: str):
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(f"Reading {fmt} files requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _types_mapper():
+    # Integers and booleans keep their type when they hold nulls, instead of becoming float/object
+    import pyarrow as pa
+    mapping = {
+        pa.int8(): pd.Int8Dtype(), pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(), pa.uint8(): pd.UInt8Dtype(), pa.uint16(): pd.UInt16Dtype(),
+        pa.uint32(): pd.UInt32Dtype(), pa.uint64(): pd.UInt64Dtype(), pa.bool_(): pd.BooleanDtype(),
+        pa.string(): STRING_DTYPE, pa.large_string(): STRING_DTYPE,
+    }
+    return mapping.get
+
+
+def _arrow_invalid():
+    import pyarrow as pa
+    return pa.ArrowInvalid
+
+
+def _record_batches(path: str, fmt: str, batch_rows: int, columns: Optional[List[str]]):
+    pa = _import_pyarrow(fmt)
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+
+        # Only the projected column chunks are read, from memory-mapped pages
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        yield from parquet_file.iter_batches(batch_size=batch_rows, columns=columns)
+    elif fmt == 'ipc':
+        # Record batches in an uncompressed IPC file are zero-copy views of the mapping
+        source = pa.memory_map(path, 'r')
+        try:
+            try:
+                reader = pa.ipc.open_file(source)
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            except pa.ArrowInvalid:
+                source.seek(0)
+                batches = pa.ipc.open_stream(source)
+            for batch in batches:
+                batch = batch.select(columns) if columns is not None else batch
+                for start in range(0, batch.num_rows, batch_rows):
+                    yield batch.slice(start, batch_rows)
+        finally:
+            source.close()
+    else:
+        import pyarrow.csv as pv
+
+        # Compression is detected from the extension and decompressed as a stream
+        stream = pa.input_stream(path, compression='detect')
+        try:
+            reader = pv.open_csv(
+                stream,
+                read_options=pv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+                convert_options=pv.ConvertOptions(include_columns=columns, strings_can_be_null=True),
+            )
+            for batch in reader:
+                for start in range(0, batch.num_rows, batch_rows):
+                    yield batch.slice(start, batch_rows)
+        finally:
+            stream.close()
+
+
+def _uses_pandas(path: str, fmt: str) -> bool:
+    # Plain CSV stays on pandas, whose per-chunk type inference tolerates columns that change
+    # type deep into the file; Arrow fixes each column's type from the first block
+    return fmt == 'csv' and (input_suffix(path) == '.csv' or not _has_pyarrow())
+
+
+def iter_source_chunks(path: str, chunksize: int = DEFAULT_READ_ROWS,
+                       columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    # CSV (plain or compressed), Parquet or Arrow IPC/Feather as DataFrame chunks. Without
+    # pyarrow, CSV still works through pandas; the columnar formats need it.
+    fmt = infer_input_format(path)
+    if _uses_pandas(path, fmt):
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns)
+        return
+
+    types_mapper = _types_mapper()
+    rows = 0
+    try:
+        for batch in _record_batches(path, fmt, chunksize, columns):
+            yield batch.to_pandas(types_mapper=types_mapper)
+            rows += batch.num_rows
+    except _arrow_invalid():
+        if fmt != 'csv':
+            raise
+        # A value that doesn't fit the type inferred from the first block: pandas takes over
+        # from the first row not yet returned
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, skiprows=range(1, rows + 1))
+
+
+def read_source(path: str, columns: Optional[List[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+    # `limit` stops after the first rows, so only the leading row groups/batches are touched
+    fmt = infer_input_format(path)
+    if _uses_pandas(path, fmt):
+        return pd.read_csv(path, usecols=columns, nrows=limit)
+
+    pa = _import_pyarrow(fmt)
+    if fmt == 'csv':
+        try:
+            return _read_batches(pa, path, fmt, columns, limit)
+        except pa.ArrowInvalid:
+            return pd.read_csv(path, usecols=columns, nrows=limit)
+    if fmt == 'parquet' and limit is None:
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=columns, memory_map=True).to_pandas(types_mapper=_types_mapper())
+    return _read_batches(pa, path, fmt, columns, limit)
+
+
+def _read_batches(pa, path: str, fmt: str, columns: Optional[List[str]], limit: Optional[int]) -> pd.DataFrame:
+    batches = []
+    rows = 0
+    for batch in _record_batches(path, fmt, limit or DEFAULT_READ_ROWS, columns):
+        batches.append(batch)
+        rows += batch.num_rows
+        if limit is not None and rows >= limit:
+            break
+    if not batches:
+        return pd.DataFrame(columns=columns)
+    table = pa.Table.from_batches(batches)
+    if limit is not None:
+        table = table.slice(0, limit)
+    return table.to_pandas(types_mapper=_types_mapper())
+
+
+def source_row_count(path: str) -> Optional[int]:
+    # From metadata where the format keeps it (Parquet footer, IPC file batches); None for CSV,
+    # whose rows can only be counted by reading it all
+    fmt = infer_input_format(path)
+    if fmt == 'parquet' and _has_pyarrow():
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    if fmt == 'ipc' and _has_pyarrow():
+        import pyarrow as pa
+        with pa.memory_map(path, 'r') as source:
+            try:
+                reader = pa.ipc.open_file(source)
+            except pa.ArrowInvalid:
+                return None
+            return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    return None
+
+
+def parquet_footer_hash(path: str) -> str:
+    # The footer holds the schema plus every row group's offsets, sizes and statistics, so it
+    # changes with the data; hashing it avoids reading a large file end to end
+    with open(path, 'rb') as f:
+        f.seek(-8, os.SEEK_END)
+        tail = f.read(8)
+        footer_length = int.from_bytes(tail[:4], 'little')
+        f.seek(-(8 + footer_length), os.SEEK_END)
+        footer = f.read(footer_length)
+    digest = hashlib.blake2b(footer + tail, digest_size=20)
+    digest.update(str(os.path.getsize(path)).encode())
+    return digest.hexdigest()
+
+
+def content_hasher(path: str) -> Callable[[str], str]:
+    return parquet_footer_hash if infer_input_format(path) == 'parquet' else file_content_hash
@@ -0,0 +1,120 @@
+from pymysql import MySQLError
+from typing import Dict, List, Set, Tuple
+
+
+class ForeignKey:
+    def __init__(self, name: str, table: str, columns: Tuple[str, ...], parent: str,
+                 parent_columns: Tuple[str, ...]):
+        self.name = name
+        self.table = table
+        self.columns = tuple(columns)
+        self.parent = parent
+        self.parent_columns = tuple(parent_columns)
+
+    @property
+    def is_self_reference(self) -> bool:
+        return self.parent == self.table
+
+    def __repr__(self):
+        return (f"ForeignKey({self.table}({', '.join(self.columns)}) -> "
+                f"{self.parent}({', '.join(self.parent_columns)}))")
+
+
+def read_foreign_keys(connection) -> List[ForeignKey]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT CONSTRAINT_NAME, TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME "
+            "FROM information_schema.KEY_COLUMN_USAGE "
+            "WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL "
+            "ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION"
+        )
+        rows = cursor.fetchall()
+
+    # Composite keys arrive one row per column, in ordinal order
+    grouped: Dict[Tuple[str, str], Dict] = {}
+    for row in rows:
+        key = (row['TABLE_NAME'], row['CONSTRAINT_NAME'])
+        entry = grouped.setdefault(key, {'parent': row['REFERENCED_TABLE_NAME'], 'columns': [], 'parent_columns': []})
+        entry['columns'].append(row['COLUMN_NAME'])
+        entry['parent_columns'].append(row['REFERENCED_COLUMN_NAME'])
+
+    return [
+        ForeignKey(name, table, entry['columns'], entry['parent'], entry['parent_columns'])
+        for (table, name), entry in grouped.items()
+    ]
+
+
+class SchemaGraph:
+    # Tables ordered so every parent is generated (and inserted) before its children. A cycle is
+    # broken by leaving one of its nullable foreign keys NULL; a cycle with none is an error.
+    def __init__(self, schemas: Dict[str, Dict[str, Dict]], foreign_keys: List[ForeignKey]):
+        self.schemas = schemas
+        self.foreign_keys = [fk for fk in foreign_keys if fk.table in schemas]
+        self.deferred: Set[Tuple[str, str]] = set()
+        self._levels = self._resolve_levels()
+
+    def foreign_keys_of(self, table: str) -> List[ForeignKey]:
+        return [fk for fk in self.foreign_keys if fk.table == table]
+
+    def is_nullable(self, fk: ForeignKey) -> bool:
+        schema = self.schemas[fk.table]
+        return all(schema[col]['null'] == 'YES' for col in fk.columns)
+
+    def is_deferred(self, fk: ForeignKey) -> bool:
+        return (fk.table, fk.name) in self.deferred
+
+    def levels(self) -> List[List[str]]:
+        # Tables within one level do not reference each other and can be generated independently
+        return [list(level) for level in self._levels]
+
+    def order(self) -> List[str]:
+        return [table for level in self._levels for table in level]
+
+    def _resolve_levels(self) -> List[List[str]]:
+        while True:
+            levels, remaining = self._kahn_levels()
+            if not remaining:
+                return levels
+
+            candidates = [
+                fk for fk in self.foreign_keys
+                if fk.table in remaining and fk.parent in remaining
+                and not fk.is_self_reference and not self.is_deferred(fk) and self.is_nullable(fk)
+            ]
+            if not candidates:
+                raise ValueError(f"Foreign keys form a cycle with no nullable column: {', '.join(sorted(remaining))}")
+            fk = candidates[0]
+            self.deferred.add((fk.table, fk.name))
+
+    def _kahn_levels(self) -> Tuple[List[List[str]], Set[str]]:
+        parents: Dict[str, Set[str]] = {table: set() for table in self.schemas}
+        for fk in self.foreign_keys:
+            # Parents outside the selection already exist in the database
+            if fk.is_self_reference or self.is_deferred(fk) or fk.parent not in self.schemas:
+                continue
+            parents[fk.table].add(fk.parent)
+
+        levels = []
+        done: Set[str] = set()
+        remaining = set(self.schemas)
+        while remaining:
+            ready = [table for table in self.schemas if table in remaining and parents[table] <= done]
+            if not ready:
+                break
+            levels.append(ready)
+            done.update(ready)
+            remaining.difference_update(ready)
+        return levels, remaining
+
+
+def existing_key_rows(connection, fk: ForeignKey, limit: int = 100_000) -> List[Dict]:
+    # Parent rows already in the database, for parents outside the generated set
+    from .bulk_load import quote_identifier
+
+    columns = ', '.join(quote_identifier(col) for col in fk.parent_columns)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT DISTINCT {columns} FROM {quote_identifier(fk.parent)} LIMIT {int(limit)}")
+            return list(cursor.fetchall())
+    except MySQLError:
+        return []
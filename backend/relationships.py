@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from .classifier import classify_column
+from .dtypes import with_nulls
+
+
+class RelationshipRule:
+    name = 'rule'
+
+    def match(self, columns: List[str]) -> Optional[Tuple[str, ...]]:
+        raise NotImplementedError
+
+    def apply(self, df: pd.DataFrame, matched: Tuple[str, ...], rng: np.random.Generator,
+              reference_date: np.datetime64) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class AgeDobRule(RelationshipRule):
+    name = 'age_dob'
+
+    def __init__(self, columns: Tuple[str, str] = None):
+        # Explicit (age, date of birth) columns skip name matching
+        self.columns = tuple(columns) if columns is not None else None
+
+    def match(self, columns: List[str]) -> Optional[Tuple[str, ...]]:
+        if self.columns is not None:
+            return self.columns if all(col in columns for col in self.columns) else None
+        age_col = next((col for col in columns if classify_column(col) == 'age'), None)
+        dob_col = next((col for col in columns if classify_column(col) == 'date_of_birth'), None)
+        if age_col is None or dob_col is None:
+            return None
+        return age_col, dob_col
+
+    def apply(self, df: pd.DataFrame, matched: Tuple[str, ...], rng: np.random.Generator,
+              reference_date: np.datetime64) -> pd.DataFrame:
+        # Only moves each date of birth to agree with the age: a DOB the null model left out
+        # stays null, and so does one whose age is unknown
+        age_col, dob_col = matched
+        dob = dates_of_birth(df[age_col], rng, reference_date)
+        df[dob_col] = with_nulls(dob, df[dob_col].isna().to_numpy() | np.isnat(dob))
+        return df
+
+
+def dates_of_birth(ages: pd.Series, rng: np.random.Generator, reference_date: np.datetime64) -> np.ndarray:
+    # NaT where the age is missing or not a number
+    ages = pd.to_numeric(ages, errors='coerce').to_numpy(dtype=float)
+    valid = np.isfinite(ages)
+    fractions = rng.random(len(ages))
+    out = np.full(len(ages), np.datetime64('NaT'), dtype='datetime64[s]')
+    if not valid.any():
+        return out
+
+    # A uniformly random day within the birth year; datetime64 handles leap years, centuries included.
+    # Year starts and lengths are worked out once per year in the (small) span of birth years,
+    # then gathered by offset, which unlike np.unique needs no sort.
+    current_year = reference_date.astype('datetime64[Y]').astype(np.int64) + 1970
+    births = current_year - ages[valid].astype(np.int64) - 1970
+    year_index = births - births.min()
+    birth_years = (births.min() + np.arange(year_index.max() + 1)).astype('datetime64[Y]')
+    year_start = birth_years.astype('datetime64[D]').astype(np.int64)
+    year_length = (birth_years + 1).astype('datetime64[D]').astype(np.int64) - year_start
+    offsets = (fractions[valid] * year_length[year_index]).astype(np.int64)
+    days = year_start[year_index] + offsets
+    out[valid] = (days * 86400).astype('datetime64[s]')
+    return out
+
+
+DEFAULT_RULES: List[RelationshipRule] = [AgeDobRule()]
+
+RULES: Dict[str, Type[RelationshipRule]] = {rule.name: rule for rule in (AgeDobRule,)}
+
+
+def apply_relationships(df: pd.DataFrame, rules: List[RelationshipRule],
+                        rng_for: Callable[[RelationshipRule, Tuple[str, ...]], np.random.Generator],
+                        reference_date: np.datetime64 = None) -> pd.DataFrame:
+    if reference_date is None:
+        reference_date = np.datetime64('today', 'D')
+    columns = list(df.columns)
+    for rule in rules:
+        matched = rule.match(columns)
+        if matched is not None:
+            df = rule.apply(df, matched, rng_for(rule, matched), reference_date)
+    return df
@@ -0,0 +1,57 @@
+import sys
+
+
+class Reporter:
+    def begin(self):
+        pass
+
+    def progress(self, percent: int):
+        pass
+
+    def status(self, message: str):
+        pass
+
+    def preview(self, title: str, dataframe, caption: str = None):
+        pass
+
+    def success(self, message: str):
+        pass
+
+    def info(self, message: str):
+        pass
+
+    def warning(self, message: str):
+        pass
+
+    def error(self, message: str):
+        pass
+
+
+class ConsoleReporter(Reporter):
+    def __init__(self, stream=None, verbose: bool = True):
+        self.stream = stream if stream is not None else sys.stderr
+        self.verbose = verbose
+
+    def _write(self, message: str):
+        print(message, file=self.stream, flush=True)
+
+    def status(self, message: str):
+        if self.verbose:
+            self._write(message)
+
+    def preview(self, title: str, dataframe, caption: str = None):
+        if self.verbose and caption:
+            self._write(f"{title}: {caption}")
+
+    def success(self, message: str):
+        self._write(message)
+
+    def info(self, message: str):
+        if self.verbose:
+            self._write(message)
+
+    def warning(self, message: str):
+        self._write(f"WARNING: {message}")
+
+    def error(self, message: str):
+        self._write(f"ERROR: {message}")
@@ -0,0 +1,36 @@
+import hashlib
+import numpy as np
+from typing import Optional, Union
+
+
+SeedLike = Union[None, int, np.random.SeedSequence]
+
+
+def as_seed_sequence(seed: SeedLike) -> np.random.SeedSequence:
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def stable_key(key: Union[int, str]) -> int:
+    # Python's hash() is salted per process, so string keys are hashed explicitly
+    if isinstance(key, (int, np.integer)) and key >= 0:
+        return int(key)
+    digest = hashlib.blake2b(str(key).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def derive_seed(seed_seq: np.random.SeedSequence, *keys) -> np.random.SeedSequence:
+    spawn_key = tuple(seed_seq.spawn_key) + tuple(stable_key(key) for key in keys)
+    return np.random.SeedSequence(seed_seq.entropy, spawn_key=spawn_key)
+
+
+def derive_rng(seed_seq: Optional[np.random.SeedSequence], fallback: np.random.Generator,
+               *keys) -> np.random.Generator:
+    if seed_seq is None:
+        return fallback
+    return np.random.default_rng(derive_seed(seed_seq, *keys))
+
+
+def faker_seed(seed_seq: np.random.SeedSequence, *keys) -> int:
+    return int(derive_seed(seed_seq, *keys).generate_state(1, np.uint64)[0])
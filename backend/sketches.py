@@ -0,0 +1,141 @@
+import numpy as np
+from scipy.stats import kstwobign
+from typing import List, Tuple
+
+
+DEFAULT_SKETCH_K = 1024
+DEFAULT_CONFIDENCE = 0.99
+
+
+class QuantileSketch:
+    # KLL-style compactor stack: level h holds sorted survivors that each stand for 2**h values.
+    # Compacting a level keeps every other item from a random offset, so rank estimates stay
+    # unbiased and the sketch keeps roughly k * log2(n / k) items however large n grows.
+    def __init__(self, k: int = DEFAULT_SKETCH_K):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=float)]
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        # Per-query rank errors: worst case sum(2**h) and Hoeffding's sum(4**h)
+        self.error_sum = 0.0
+        self.error_square_sum = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float('nan')
+
+    @property
+    def size(self) -> int:
+        return sum(len(level) for level in self.levels)
+
+    def update(self, values, rng: np.random.Generator = None):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self.count += len(values)
+        self.total += float(values.sum())
+        chunk_min, chunk_max = float(values.min()), float(values.max())
+        self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+        self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress(rng)
+
+    def merge(self, other: 'QuantileSketch', rng: np.random.Generator = None) -> 'QuantileSketch':
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        if other.count == 0:
+            return self
+
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.error_sum += other.error_sum
+        self.error_square_sum += other.error_square_sum
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=float))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self._compress(rng)
+        return self
+
+    def _compress(self, rng: np.random.Generator = None):
+        rng = rng if rng is not None else np.random.default_rng()
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.k:
+                level = np.sort(level)
+                # An odd leftover stays behind so the total weight is preserved exactly
+                paired = len(level) - len(level) % 2
+                promoted = level[int(rng.integers(2)):paired:2]
+                self.levels[h] = level[paired:]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=float))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                self.error_sum += 2.0 ** h
+                self.error_square_sum += 4.0 ** h
+            h += 1
+
+    def _weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], np.cumsum(weights[order])
+
+    def cdf(self, points) -> np.ndarray:
+        points = np.asarray(points, dtype=float)
+        if self.count == 0:
+            return np.full(points.shape, np.nan)
+        items, cumulative = self._weighted_items()
+        ranks = np.searchsorted(items, points, side='right')
+        cumulative = np.concatenate([[0.0], cumulative])
+        return cumulative[ranks] / cumulative[-1]
+
+    def quantile(self, q) -> np.ndarray:
+        q = np.asarray(q, dtype=float)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+        items, cumulative = self._weighted_items()
+        ranks = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return items[np.clip(ranks, 0, len(items) - 1)]
+
+    def rank_error(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        # Normalized rank error that holds for a single query with the given probability
+        if self.count == 0:
+            return 0.0
+        hoeffding = np.sqrt(2.0 * self.error_square_sum * np.log(2.0 / (1.0 - confidence)))
+        return float(min(self.error_sum, hoeffding) / self.count)
+
+
+def sketch_values(values, k: int = DEFAULT_SKETCH_K, rng: np.random.Generator = None) -> QuantileSketch:
+    sketch = QuantileSketch(k)
+    sketch.update(values, rng)
+    return sketch
+
+
+def ks_statistic(a: QuantileSketch, b: QuantileSketch) -> float:
+    # The two-sample KS distance is attained at a stored item of one of the sketches
+    points = np.concatenate(a.levels + b.levels)
+    if len(points) == 0:
+        return 0.0
+    return float(np.max(np.abs(a.cdf(points) - b.cdf(points))))
+
+
+def ks_pvalue(statistic: float, n1: int, n2: int) -> float:
+    # Asymptotic Kolmogorov distribution, as ks_2samp uses for large samples
+    effective_n = n1 * n2 / (n1 + n2)
+    return float(kstwobign.sf(statistic * np.sqrt(effective_n)))
+
+
+def dkw_epsilon(n: int, confidence: float = DEFAULT_CONFIDENCE) -> float:
+    # Dvoretzky-Kiefer-Wolfowitz bound on the sup distance between an empirical CDF and its source
+    if n == 0:
+        return 1.0
+    return float(np.sqrt(np.log(2.0 / (1.0 - confidence)) / (2.0 * n)))
@@ -0,0 +1,441 @@
+"""Declarative dataset specs compiled into execution plans.
+
+A spec (YAML or JSON) lists every column with its provider or distribution, dtype, null rate
+and uniqueness, plus explicit relationship rules:
+
+    rows: 1000000
+    seed: 42
+    chunk_size: 250000
+    columns:
+      - {name: customer_id, distribution: {kind: sequence, start: 1}}
+      - {name: full_name, provider: name}
+      - {name: age, dtype: int, distribution: {kind: normal, mean: 41, std: 12, min: 18, max: 90}}
+      - {name: salary, distribution: {kind: lognormal, mean: 10.8, sigma: 0.4}, decimals: 2}
+      - {name: city, distribution: {kind: categorical, values: [Lahore, Karachi], weights: [0.6, 0.4]}}
+      - {name: email, provider: email, null_rate: 0.05}
+      - {name: dob, dtype: date}
+    relationships:
+      - {rule: age_dob, columns: [age, dob]}
+
+Compiling resolves every provider once and fuses columns that share a distribution family
+into a single 2-D draw, so generating a chunk runs no name heuristics at all.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .dtypes import categorical, code_dtype, downcast_integers, integers, string_array, with_nulls
+from .providers import DATE_PROVIDERS
+from .relationships import RULES, RelationshipRule, apply_relationships
+from .seeding import derive_rng
+from .unique import unique_indices
+from .writers import DEFAULT_CHUNK_ROWS
+
+
+DEFAULT_ROWS = 200
+DTYPES = ('int', 'float', 'string', 'category', 'bool', 'date')
+DISTRIBUTIONS = {
+    'normal': ('mean', 'std'),
+    'uniform': ('low', 'high'),
+    'lognormal': ('mean', 'sigma'),
+    'exponential': ('scale',),
+    'poisson': ('lam',),
+    'integer': ('low', 'high'),
+    'categorical': ('values', 'weights'),
+    'sequence': ('start', 'step', 'prefix'),
+    'date': ('start', 'end'),
+    'boolean': ('p',),
+    'constant': ('value',),
+}
+# Distributions a unique column can use; anything else would silently stop following its distribution
+UNIQUE_DISTRIBUTIONS = ('integer', 'sequence')
+# Bounds any numeric distribution may carry; applied after the draw
+CLIP_KEYS = ('min', 'max')
+# Families whose columns are drawn together as one (columns x rows) block
+FUSABLE = ('normal', 'uniform')
+COLUMN_KEYS = ('name', 'provider', 'dtype', 'distribution', 'null_rate', 'unique', 'decimals')
+SPEC_KEYS = ('rows', 'seed', 'chunk_size', 'columns', 'relationships')
+# Kinds of provider output each dtype can be cast from; string and category take anything
+DTYPE_SOURCES = {
+    'int': ('int', 'float', 'bool'),
+    'float': ('int', 'float', 'bool'),
+    'bool': ('bool',),
+    'date': ('date',),
+}
+
+
+class SpecError(ValueError):
+    pass
+
+
+def _import_yaml():
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("YAML specs require PyYAML (pip install pyyaml); JSON specs work without it") from e
+    return yaml
+
+
+def load_spec_file(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+        data = _import_yaml().safe_load(text)
+    else:
+        data = json.loads(text)
+    if not isinstance(data, dict):
+        raise SpecError(f"{path}: a spec must be a mapping with a 'columns' list")
+    return data
+
+
+class ColumnSpec:
+    def __init__(self, name: str, provider: str = None, dtype: str = None, distribution: Dict[str, Any] = None,
+                 null_rate: float = 0.0, unique: bool = False, decimals: int = None):
+        self.name = name
+        self.provider = provider
+        self.dtype = dtype
+        self.distribution = dict(distribution) if distribution else None
+        self.null_rate = float(null_rate)
+        self.unique = bool(unique)
+        self.decimals = decimals
+        self._validate()
+
+    @classmethod
+    def from_dict(cls, entry: Union[str, Dict[str, Any]]) -> 'ColumnSpec':
+        if isinstance(entry, str):
+            return cls(entry)
+        if not isinstance(entry, dict) or 'name' not in entry:
+            raise SpecError(f"Column entries need a 'name': {entry!r}")
+        _check_keys(entry, COLUMN_KEYS, f"column {entry['name']!r}")
+        return cls(**entry)
+
+    @property
+    def kind(self) -> Optional[str]:
+        return self.distribution['kind'] if self.distribution else None
+
+    def _validate(self):
+        where = f"column {self.name!r}"
+        if self.dtype is not None and self.dtype not in DTYPES:
+            raise SpecError(f"{where}: unknown dtype {self.dtype!r}; expected one of {', '.join(DTYPES)}")
+        if not 0.0 <= self.null_rate < 1.0:
+            raise SpecError(f"{where}: null_rate must be in [0, 1)")
+        if self.distribution is None:
+            return
+        kind = self.distribution.get('kind')
+        if kind not in DISTRIBUTIONS:
+            raise SpecError(f"{where}: unknown distribution {kind!r}; expected one of {', '.join(DISTRIBUTIONS)}")
+        _check_keys(self.distribution, ('kind',) + DISTRIBUTIONS[kind] + CLIP_KEYS, where)
+        if kind == 'categorical' and not self.distribution.get('values'):
+            raise SpecError(f"{where}: a categorical distribution needs 'values'")
+        if kind == 'integer' and ('low' not in self.distribution or 'high' not in self.distribution):
+            raise SpecError(f"{where}: an integer distribution needs 'low' and 'high'")
+        if kind == 'date' and 'start' not in self.distribution:
+            raise SpecError(f"{where}: a date distribution needs 'start'")
+        if self.unique and kind not in UNIQUE_DISTRIBUTIONS:
+            raise SpecError(f"{where}: unique values cannot be drawn from a {kind} distribution; "
+                            f"use one of {', '.join(UNIQUE_DISTRIBUTIONS)} or a provider")
+
+
+class DatasetSpec:
+    def __init__(self, columns: List[ColumnSpec], rows: int = DEFAULT_ROWS, seed: int = None,
+                 chunk_size: int = DEFAULT_CHUNK_ROWS, relationships: List[Dict[str, Any]] = None):
+        if not columns:
+            raise SpecError("A spec needs at least one column")
+        names = [col.name for col in columns]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise SpecError(f"Duplicate columns: {', '.join(duplicates)}")
+        self.columns = columns
+        self.rows = int(rows)
+        self.seed = seed
+        self.chunk_size = int(chunk_size)
+        self.relationships = list(relationships or [])
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DatasetSpec':
+        _check_keys(data, SPEC_KEYS, "spec")
+        columns = [ColumnSpec.from_dict(entry) for entry in data.get('columns') or []]
+        return cls(columns, data.get('rows', DEFAULT_ROWS), data.get('seed'),
+                   data.get('chunk_size', DEFAULT_CHUNK_ROWS), data.get('relationships'))
+
+    @classmethod
+    def load(cls, path: str) -> 'DatasetSpec':
+        return cls.from_dict(load_spec_file(path))
+
+
+def _check_keys(entry: Dict[str, Any], allowed: Sequence[str], where: str):
+    unknown = sorted(set(entry) - set(allowed))
+    if unknown:
+        raise SpecError(f"{where}: unknown keys {', '.join(unknown)}")
+
+
+# A kernel draws one or more columns for a block of rows: draw(num_rows, rng, row_offset)
+Draw = Callable[[int, np.random.Generator, int], List[Any]]
+
+
+class Kernel:
+    # `capacity` caps the rows a kernel can draw (distinct values in a unique range), if any
+    def __init__(self, label: str, columns: Sequence[str], draw: Draw, provider: str = None,
+                 capacity: int = None):
+        self.label = label
+        self.columns = tuple(columns)
+        self.draw = draw
+        self.provider = provider
+        self.capacity = capacity
+
+
+class ExecutionPlan:
+    # The compiled form of a spec: kernels in draw order, a finishing step per column (clip,
+    # dtype, rounding, nulls) and explicit relationship rules.
+    def __init__(self, spec: DatasetSpec, kernels: List[Kernel], rules: List[RelationshipRule], generator):
+        self.spec = spec
+        self.kernels = kernels
+        self.rules = rules
+        self.generator = generator
+        self.columns = [col.name for col in spec.columns]
+        self._column_specs = {col.name: col for col in spec.columns}
+
+    def describe(self) -> pd.DataFrame:
+        records = []
+        for kernel in self.kernels:
+            for name in kernel.columns:
+                col = self._column_specs[name]
+                records.append({
+                    'column': name,
+                    'kernel': kernel.label,
+                    'fused_with': len(kernel.columns) - 1,
+                    'provider': kernel.provider or '',
+                    'dtype': col.dtype or '',
+                    'null_rate': col.null_rate,
+                    'unique': col.unique,
+                })
+        return pd.DataFrame(records).set_index('column').loc[self.columns]
+
+    def check_rows(self, num_rows: int):
+        # Checked against the rows actually generated, which the CLI may set above spec.rows
+        for kernel in self.kernels:
+            if kernel.capacity is not None and num_rows > kernel.capacity:
+                raise SpecError(f"column {kernel.columns[0]!r}: {num_rows} unique values requested, "
+                                f"but only {kernel.capacity} exist")
+
+    def generate_chunk(self, num_rows: int, row_offset: int = 0) -> pd.DataFrame:
+        self.check_rows(row_offset + num_rows)
+        generator = self.generator
+        data = {}
+        for kernel in self.kernels:
+            rng = derive_rng(generator.seed_seq, generator.rng, 'spec', kernel.label, *kernel.columns, row_offset)
+            with generator.metrics.stage('spec_kernel', rows=num_rows, kernel=kernel.label,
+                                         columns=','.join(kernel.columns)):
+                for name, values in zip(kernel.columns, kernel.draw(num_rows, rng, row_offset)):
+                    data[name] = self._finish(self._column_specs[name], values, row_offset)
+
+        chunk = pd.DataFrame({name: data[name] for name in self.columns})
+        chunk.index = pd.RangeIndex(row_offset, row_offset + num_rows)
+        if self.rules:
+            def rng_for(rule, matched):
+                return derive_rng(generator.seed_seq, generator.rng, 'relationship', rule.name, *matched, row_offset)
+            with generator.metrics.stage('relationships', rows=num_rows):
+                chunk = apply_relationships(chunk, self.rules, rng_for)
+        return chunk
+
+    def iter_chunks(self, num_rows: int = None, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        num_rows = self.spec.rows if num_rows is None else num_rows
+        chunk_size = chunk_size or self.spec.chunk_size
+        self.check_rows(num_rows)
+        for start in range(0, num_rows, chunk_size):
+            size = min(chunk_size, num_rows - start)
+            yield self.generate_chunk(size, start)
+            self.generator.reporter.progress(int(100 * (start + size) / num_rows))
+
+    def generate(self, num_rows: int = None) -> pd.DataFrame:
+        chunks = list(self.iter_chunks(num_rows))
+        if not chunks:
+            return pd.DataFrame(columns=self.columns)
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks)
+
+    def _finish(self, col: ColumnSpec, values, row_offset: int):
+        distribution = col.distribution or {}
+        if 'min' in distribution or 'max' in distribution:
+            values = np.clip(values, distribution.get('min'), distribution.get('max'))
+        values = _cast(values, col.dtype, col.decimals)
+        if col.null_rate > 0:
+            rng = derive_rng(self.generator.seed_seq, self.generator.rng, 'spec_null', col.name, row_offset)
+            values = with_nulls(values, rng.random(len(values)) < col.null_rate)
+        return values
+
+
+def _cast(values, dtype: Optional[str], decimals: Optional[int]):
+    if dtype == 'int':
+        values = np.asarray(values)
+        if values.dtype.kind == 'f':
+            values = np.rint(values)
+        return downcast_integers(values.astype(np.int64))
+    if dtype == 'float' or (dtype is None and decimals is not None):
+        values = np.asarray(values, dtype=float)
+        return np.round(values, decimals) if decimals is not None else values
+    if dtype == 'string':
+        return string_array(np.asarray(values, dtype=object).astype(str))
+    if dtype == 'category':
+        return values if isinstance(values, pd.Categorical) else pd.Categorical(values)
+    if dtype == 'bool':
+        return np.asarray(values, dtype=bool)
+    if dtype == 'date':
+        return np.asarray(values, dtype='datetime64[s]')
+    return values
+
+
+def _distribution_kernel(col: ColumnSpec) -> Kernel:
+    params = col.distribution
+    kind = params['kind']
+
+    if kind == 'lognormal':
+        mean, sigma = params.get('mean', 0.0), params.get('sigma', 1.0)
+        draw = lambda n, rng, offset: [rng.lognormal(mean, sigma, n)]
+    elif kind == 'exponential':
+        scale = params.get('scale', 1.0)
+        draw = lambda n, rng, offset: [rng.exponential(scale, n)]
+    elif kind == 'poisson':
+        lam = params.get('lam', 1.0)
+        draw = lambda n, rng, offset: [downcast_integers(rng.poisson(lam, n))]
+    elif kind == 'integer':
+        low, high = int(params['low']), int(params['high'])
+        draw = lambda n, rng, offset: [integers(rng, low, high + 1, n)]
+    elif kind == 'categorical':
+        values = pd.Index(params['values'], dtype=object)
+        weights = np.asarray(params.get('weights') or np.ones(len(values)), dtype=float)
+        if len(weights) != len(values) or (weights < 0).any() or weights.sum() <= 0:
+            raise SpecError(f"column {col.name!r}: weights must be non-negative and match values")
+        cumulative = np.cumsum(weights / weights.sum())
+        code_type = code_dtype(len(values))
+
+        def draw(n, rng, offset):
+            codes = np.minimum(np.searchsorted(cumulative, rng.random(n), side='right'), len(values) - 1)
+            return [categorical(codes.astype(code_type), values)]
+    elif kind == 'sequence':
+        start, step, prefix = params.get('start', 1), params.get('step', 1), params.get('prefix')
+
+        def draw(n, rng, offset):
+            values = start + step * np.arange(offset, offset + n, dtype=np.int64)
+            if prefix is not None:
+                return [string_array(np.char.add(str(prefix), values.astype(str)))]
+            return [downcast_integers(values)]
+    elif kind == 'date':
+        start = np.datetime64(str(params['start']), 'D')
+        end = np.datetime64(str(params.get('end', 'today')), 'D')
+        span = int((end - start).astype(np.int64)) + 1
+        if span < 1:
+            raise SpecError(f"column {col.name!r}: date 'end' is before 'start'")
+        draw = lambda n, rng, offset: [(start + rng.integers(0, span, n)).astype('datetime64[s]')]
+    elif kind == 'boolean':
+        p = params.get('p', 0.5)
+        draw = lambda n, rng, offset: [rng.random(n) < p]
+    else:
+        value = params.get('value')
+        draw = lambda n, rng, offset: [np.full(n, value)]
+    return Kernel(kind, [col.name], draw)
+
+
+def _fused_kernel(kind: str, columns: List[ColumnSpec]) -> Kernel:
+    # One (columns x rows) draw for the whole family, then a broadcast affine transform
+    names = [col.name for col in columns]
+    if kind == 'normal':
+        loc = np.array([[col.distribution.get('mean', 0.0)] for col in columns], dtype=float)
+        scale = np.array([[col.distribution.get('std', 1.0)] for col in columns], dtype=float)
+        draw = lambda n, rng, offset: list(loc + scale * rng.standard_normal((len(names), n)))
+    else:
+        loc = np.array([[col.distribution.get('low', 0.0)] for col in columns], dtype=float)
+        scale = np.array([[col.distribution.get('high', 1.0)] for col in columns], dtype=float) - loc
+        draw = lambda n, rng, offset: list(loc + scale * rng.random((len(names), n)))
+    return Kernel(kind, names, draw)
+
+
+def _provider_output(provider: str, engine) -> str:
+    # 'int', 'float', 'bool', 'date' or 'string'; vectorized providers are probed with one row
+    if provider in DATE_PROVIDERS:
+        return 'date'
+    if provider not in engine.vectorized:
+        return 'string'
+    sample = np.asarray(engine.vectorized[provider](1, np.random.default_rng(0)))
+    return {'b': 'bool', 'i': 'int', 'u': 'int', 'f': 'float'}.get(sample.dtype.kind, 'string')
+
+
+def _provider_kernel(col: ColumnSpec, engine) -> Kernel:
+    provider = col.provider or engine.resolve(col.name)
+    if provider not in engine.vectorized and provider not in engine.faker_methods:
+        raise SpecError(f"column {col.name!r}: unknown provider {provider!r}")
+    output = _provider_output(provider, engine)
+    if col.dtype in DTYPE_SOURCES and output not in DTYPE_SOURCES[col.dtype]:
+        how = f"provider {provider!r}" if col.provider else f"provider {provider!r} (resolved from the name)"
+        raise SpecError(f"column {col.name!r}: {how} produces {output} values, which cannot be "
+                        f"cast to dtype {col.dtype!r}; set a matching provider or a distribution")
+    draw = lambda n, rng, offset: [engine.draw(provider, n, rng)]
+    return Kernel('provider', [col.name], draw, provider)
+
+
+def _unique_kernel(col: ColumnSpec, engine) -> Kernel:
+    # Row positions are unique across every chunk, so a permutation of them is collision-free
+    key = engine.unique_key(col.name)
+    if col.kind == 'integer':
+        low, high = int(col.distribution['low']), int(col.distribution['high'])
+        draw = lambda n, rng, offset: [
+            downcast_integers(low + unique_indices(np.arange(offset, offset + n), high - low + 1, key))
+        ]
+        return Kernel('unique', [col.name], draw, capacity=high - low + 1)
+
+    provider = col.provider or engine.resolve(col.name)
+    if col.distribution is None and col.dtype in (None, 'string', 'category') and engine.supports_unique(provider):
+        draw = lambda n, rng, offset: [engine.draw_unique(provider, n, offset, col.name)]
+        return Kernel('unique', [col.name], draw, provider, engine.unique_capacity(provider))
+
+    prefix = None if col.dtype in ('int', None) else f"{col.name}_"
+    return _distribution_kernel(ColumnSpec(col.name, distribution={'kind': 'sequence', 'prefix': prefix}))
+
+
+def _build_rules(relationships: List[Dict[str, Any]]) -> List[RelationshipRule]:
+    rules = []
+    for entry in relationships:
+        entry = dict(entry)
+        name = entry.pop('rule', None)
+        if name not in RULES:
+            raise SpecError(f"Unknown relationship rule {name!r}; expected one of {', '.join(RULES)}")
+        try:
+            rules.append(RULES[name](**entry))
+        except TypeError as e:
+            raise SpecError(f"relationship {name!r}: {e}") from e
+    return rules
+
+
+def compile_spec(spec: Union[DatasetSpec, Dict[str, Any], str], generator=None) -> ExecutionPlan:
+    if isinstance(spec, str):
+        spec = DatasetSpec.load(spec)
+    elif isinstance(spec, dict):
+        spec = DatasetSpec.from_dict(spec)
+
+    if generator is None:
+        from .data_generator import UniversalDataGenerator
+        generator = UniversalDataGenerator(seed=spec.seed)
+    elif spec.seed is not None:
+        generator.reseed(spec.seed)
+
+    kernels: List[Kernel] = []
+    families: Dict[str, List[ColumnSpec]] = {}
+    for col in spec.columns:
+        if col.kind in FUSABLE and not col.unique:
+            if col.kind not in families:
+                families[col.kind] = []
+                # Placeholder keeps the family at the position of its first column
+                kernels.append(Kernel(col.kind, [], None))
+            families[col.kind].append(col)
+        elif col.unique and col.kind != 'sequence':
+            kernels.append(_unique_kernel(col, generator.engine))
+        elif col.distribution is not None:
+            kernels.append(_distribution_kernel(col))
+        else:
+            kernels.append(_provider_kernel(col, generator.engine))
+
+    kernels = [_fused_kernel(kernel.label, families[kernel.label]) if kernel.draw is None else kernel
+               for kernel in kernels]
+    return ExecutionPlan(spec, kernels, _build_rules(spec.relationships), generator)
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import pymysql
+from typing import Any, Dict, Iterator, List
+
+from .bulk_load import quote_identifier
+from .profiling import DEFAULT_CHUNKSIZE, update_reservoir
+
+
+SAMPLING_METHODS = ('first', 'random', 'full')
+DEFAULT_SAMPLE_ROWS = 1000
+DEFAULT_TOP_K = 10
+# Bernoulli sampling overshoots the target a little, so a short draw rarely needs a second pass
+RANDOM_OVERSAMPLE = 1.2
+
+NUMERIC_TYPES = ('int', 'float', 'double', 'decimal', 'numeric', 'real')
+
+
+def is_numeric_type(column_type: str) -> bool:
+    return any(name in column_type.lower() for name in NUMERIC_TYPES)
+
+
+def iter_table_chunks(connection, table_name: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                      where: str = None) -> Iterator[pd.DataFrame]:
+    # An unbuffered cursor streams rows as tuples; only one chunk is held client-side at a time
+    query = f"SELECT * FROM {quote_identifier(table_name)}"
+    if where:
+        query += f" WHERE {where}"
+    with connection.cursor(pymysql.cursors.SSCursor) as cursor:
+        cursor.execute(query)
+        columns = [description[0] for description in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            yield pd.DataFrame.from_records(rows, columns=columns)
+
+
+def estimated_row_count(connection, table_name: str) -> int:
+    # InnoDB's statistics estimate, free compared with COUNT(*) on a large table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            (table_name,)
+        )
+        row = cursor.fetchone()
+    return int(row['TABLE_ROWS'] or 0) if row else 0
+
+
+def sample_table(connection, table_name: str, sample_rows: int = DEFAULT_SAMPLE_ROWS, method: str = 'first',
+                 rng: np.random.Generator = None, chunksize: int = DEFAULT_CHUNKSIZE) -> pd.DataFrame:
+    """Rows of a table for profiling and validation.
+
+    'first' reads the first rows (fast, but biased towards insertion order), 'random' keeps
+    each row with probability ~sample_rows / table size on the server, and 'full' streams the
+    whole table through a row reservoir for an exact uniform sample.
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method {method!r}; expected one of {', '.join(SAMPLING_METHODS)}")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    if method == 'first':
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT * FROM {quote_identifier(table_name)} LIMIT {int(sample_rows)}")
+            return pd.DataFrame(list(cursor.fetchall()))
+
+    if method == 'random':
+        estimate = estimated_row_count(connection, table_name)
+        fraction = min(1.0, RANDOM_OVERSAMPLE * sample_rows / max(estimate, 1))
+        where = f"RAND({int(rng.integers(2 ** 31))}) < {fraction:.12f}" if fraction < 1 else None
+        sample = pd.concat(list(iter_table_chunks(connection, table_name, chunksize, where)) or [pd.DataFrame()],
+                           ignore_index=True)
+        if len(sample) > sample_rows:
+            sample = sample.iloc[np.sort(rng.choice(len(sample), sample_rows, replace=False))]
+        return sample.reset_index(drop=True)
+
+    columns: List[str] = []
+    reservoir = None
+    seen = 0
+    for chunk in iter_table_chunks(connection, table_name, chunksize):
+        if reservoir is None:
+            columns = list(chunk.columns)
+            reservoir = np.empty((0, len(columns)), dtype=object)
+        reservoir = update_reservoir(reservoir, chunk.to_numpy(dtype=object), seen, sample_rows, rng)
+        seen += len(chunk)
+    if reservoir is None:
+        return pd.DataFrame()
+    return pd.DataFrame(reservoir, columns=columns).infer_objects()
+
+
+def aggregate_profile(connection, table_name: str, schema: Dict[str, Dict[str, Any]],
+                      top_k: int = DEFAULT_TOP_K) -> pd.DataFrame:
+    """Per-column summary computed by the server over every row, in two round trips.
+
+    Numeric columns get MIN/MAX/AVG/STDDEV; every column gets its non-null and distinct
+    counts; the others also get their top_k most frequent values.
+    """
+    table = quote_identifier(table_name)
+    numeric = [name for name, info in schema.items() if is_numeric_type(info['type'])]
+    others = [name for name in schema if name not in numeric]
+
+    selects = ["COUNT(*) AS `rows`"]
+    for i, name in enumerate(schema):
+        column = quote_identifier(name)
+        selects += [f"COUNT({column}) AS `c{i}_non_null`", f"COUNT(DISTINCT {column}) AS `c{i}_distinct`"]
+        if name in numeric:
+            selects += [f"MIN({column}) AS `c{i}_min`", f"MAX({column}) AS `c{i}_max`",
+                        f"AVG({column}) AS `c{i}_mean`", f"STDDEV_POP({column}) AS `c{i}_std`"]
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(selects)} FROM {table}")
+        totals = cursor.fetchone()
+
+        top_values: Dict[str, List] = {name: [] for name in others}
+        if others and top_k > 0:
+            # One UNION ALL of per-column GROUP BYs instead of a query per column
+            parts = [
+                f"(SELECT {i} AS column_index, CAST({quote_identifier(name)} AS CHAR) AS value, COUNT(*) AS frequency "
+                f"FROM {table} WHERE {quote_identifier(name)} IS NOT NULL "
+                f"GROUP BY {quote_identifier(name)} ORDER BY frequency DESC LIMIT {int(top_k)})"
+                for i, name in enumerate(others)
+            ]
+            cursor.execute(' UNION ALL '.join(parts))
+            for row in cursor.fetchall():
+                top_values[others[row['column_index']]].append((row['value'], int(row['frequency'])))
+
+    rows = int(totals['rows'])
+    records = []
+    for i, name in enumerate(schema):
+        non_null = int(totals[f"c{i}_non_null"])
+        record = {
+            'column': name,
+            'type': schema[name]['type'],
+            'rows': rows,
+            'non_null': non_null,
+            'null_rate': 1 - non_null / rows if rows else 0.0,
+            'distinct': int(totals[f"c{i}_distinct"]),
+        }
+        if name in numeric:
+            for stat in ('min', 'max', 'mean', 'std'):
+                value = totals[f"c{i}_{stat}"]
+                record[stat] = float(value) if value is not None else np.nan
+        else:
+            record['top_values'] = top_values[name]
+        records.append(record)
+    return pd.DataFrame(records).set_index('column')
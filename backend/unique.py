@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Optional, Tuple
+
+from .dtypes import string_array
+
+
+# Providers that identify a row; the generator draws them without repeats by default
+UNIQUE_PROVIDERS = ('id', 'email', 'username', 'ssn', 'passport', 'serial')
+FEISTEL_ROUNDS = 4
+
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    # SplitMix64 finalizer; uint64 array arithmetic wraps, which is what the hash wants
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MIX1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+class FeistelPermutation:
+    # A keyed bijection on [0, size): a balanced Feistel network over the smallest even bit
+    # width covering size, with cycle-walking to send the spare codes back into range. The
+    # network spans less than 4 * size codes, so a value walks fewer than 4 steps on average.
+    def __init__(self, size: int, key: int, rounds: int = FEISTEL_ROUNDS):
+        if size < 1:
+            raise ValueError(f"Permutation size must be positive, got {size}")
+        self.size = int(size)
+        half_bits = (max(2, (self.size - 1).bit_length()) + 1) // 2
+        self.half_bits = np.uint64(half_bits)
+        self.mask = np.uint64((1 << half_bits) - 1)
+        self.round_keys = np.random.SeedSequence(int(key)).generate_state(rounds, np.uint64)
+
+    def _encrypt(self, x: np.ndarray, tweak: np.ndarray) -> np.ndarray:
+        left, right = x >> self.half_bits, x & self.mask
+        for key in self.round_keys:
+            left, right = right, left ^ (_mix(right ^ tweak ^ key) & self.mask)
+        return (left << self.half_bits) | right
+
+    def __call__(self, values: np.ndarray, tweak: np.ndarray = None) -> np.ndarray:
+        # A different tweak gives an independent permutation, element by element
+        x = np.asarray(values, dtype=np.uint64)
+        tweak = np.zeros_like(x) if tweak is None else _mix(np.asarray(tweak, dtype=np.uint64))
+        out = self._encrypt(x, tweak)
+        outside = np.flatnonzero(out >= self.size)
+        while len(outside):
+            out[outside] = self._encrypt(out[outside], tweak[outside])
+            outside = outside[out[outside] >= self.size]
+        return out.astype(np.int64)
+
+
+def unique_indices(positions: np.ndarray, domain: int, key: int) -> np.ndarray:
+    # Row position p falls in lap p // domain and takes a shuffled slot in that lap, so distinct
+    # positions always get distinct indices, in O(n) and independently of chunking. The first
+    # `domain` rows cover [0, domain) exactly; later laps continue into the next block.
+    laps, slots = np.divmod(np.asarray(positions, dtype=np.int64), domain)
+    return laps * domain + FeistelPermutation(domain, key)(slots, tweak=laps)
+
+
+def _prefixed(prefix: str, start: int = 0) -> Callable[[np.ndarray], object]:
+    return lambda index: string_array(np.char.add(prefix, (start + index).astype(str)))
+
+
+def _digits(values: np.ndarray, width: int) -> np.ndarray:
+    # Zero-padded decimal digits as an (n, width) block of ASCII codes
+    out = np.empty((len(values), width), dtype=np.uint8)
+    for k in range(width - 1, -1, -1):
+        values, digit = np.divmod(values, 10)
+        out[:, k] = digit + ord('0')
+    return out
+
+
+def _join_ascii(blocks) -> np.ndarray:
+    # Fixed-width strings straight from ASCII code blocks, with no per-row Python work
+    block = np.ascontiguousarray(np.concatenate(blocks, axis=1))
+    return block.view(f'S{block.shape[1]}').ravel().astype(str)
+
+
+# Fixed-width formats: past these sizes the values would have to wrap around and repeat
+SSN_SPACE = 898 * 99 * 9999
+PASSPORT_SPACE = 26 * 10 ** 8
+
+
+def _check_space(index: np.ndarray, size: int, what: str):
+    if len(index) and index.max() >= size:
+        raise ValueError(f"Only {size:,} distinct {what} exist; generate fewer rows or turn unique keys off")
+
+
+def _ssn(index: np.ndarray):
+    # Valid-looking SSNs: area 001-899 except 666, group 01-99, serial 0001-9999
+    _check_space(index, SSN_SPACE, 'SSNs')
+    area, rest = np.divmod(index, 99 * 9999)
+    group, serial = np.divmod(rest, 9999)
+    area = area + 1
+    area = area + (area >= 666)
+    dash = np.full((len(index), 1), ord('-'), dtype=np.uint8)
+    return string_array(_join_ascii([_digits(area, 3), dash, _digits(group + 1, 2), dash, _digits(serial + 1, 4)]))
+
+
+def _passport(index: np.ndarray):
+    # One letter and eight digits, as Faker's passport numbers
+    _check_space(index, PASSPORT_SPACE, 'passport numbers')
+    letters, digits = np.divmod(index, 10 ** 8)
+    letters = (letters + ord('A')).astype(np.uint8)[:, None]
+    return string_array(_join_ascii([letters, _digits(digits, 8)]))
+
+
+# Format-preserving providers: (size of the value space, index -> values). The prefixed formats
+# keep counting upwards on laps past the size, so there the space bounds the look of the values,
+# not the row count; SSNs and passport numbers have a fixed width and raise instead.
+UNIQUE_FORMATS: Dict[str, Tuple[int, Callable[[np.ndarray], object]]] = {
+    'id': (9000, _prefixed('ID_', 1000)),
+    'serial': (10 ** 8, _prefixed('SN')),
+    'ssn': (SSN_SPACE, _ssn),
+    'passport': (PASSPORT_SPACE, _passport),
+    'phone': (4 * 10 ** 9, _prefixed('', 6000000000)),
+    'mobile': (4 * 10 ** 9, _prefixed('', 6000000000)),
+}
+
+# (suffix before the counter, part of the value the suffix goes in front of)
+SUFFIXES: Dict[str, Tuple[str, Optional[str]]] = {
+    'email': ('+', '@'),
+    'username': ('_', None),
+}
+DEFAULT_SUFFIX = (' #', None)
+# Formats whose value space caps the number of unique rows
+BOUNDED_FORMATS = ('ssn', 'passport')
+
+
+class SuffixedPool:
+    # Distinct Faker values, reused with a counter suffix once every value has been taken
+    # ("jdoe", ..., "jdoe_1", ...). The suffix's marker character is stripped from the pool
+    # first, so a suffixed value can never equal a plain one or one from another lap.
+    def __init__(self, values: np.ndarray, suffix: str = DEFAULT_SUFFIX[0], before: Optional[str] = None):
+        marker = suffix[-1]
+        values = pd.unique(np.char.replace(np.asarray(values, dtype=str), marker, ''))
+        self.size = len(values)
+        self.values = values.astype(object)
+        self.suffix = suffix
+        if before is not None:
+            parts = np.char.partition(values.astype(str), before)
+            self.heads = parts[:, 0]
+            self.tails = np.char.add(parts[:, 1], parts[:, 2])
+        else:
+            self.heads = values.astype(str)
+            self.tails = None
+
+    def take(self, index: np.ndarray):
+        laps, slots = np.divmod(index, self.size)
+        out = self.values[slots]
+        repeat = np.flatnonzero(laps > 0)
+        if len(repeat):
+            counters = np.char.add(self.suffix, laps[repeat].astype(str))
+            suffixed = np.char.add(self.heads[slots[repeat]], counters)
+            if self.tails is not None:
+                suffixed = np.char.add(suffixed, self.tails[slots[repeat]])
+            out[repeat] = suffixed
+        return string_array(out)
@@ -1,128 +1,231 @@
 import pandas as pd
 import numpy as np
 from scipy.stats import ks_2samp
-import streamlit as st
-import plotly.graph_objects as go
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .metrics import Metrics
+from .sketches import (DEFAULT_CONFIDENCE, DEFAULT_SKETCH_K, QuantileSketch, dkw_epsilon, ks_pvalue,
+                       ks_statistic, sketch_values)
+
+
+VALIDATION_METHODS = ('auto', 'exact', 'sample', 'sketch')
+DEFAULT_EXACT_MAX_ROWS = 200_000
+DEFAULT_SAMPLE_SIZE = 50_000
+DEFAULT_STRATA = 20
 
 
 class DataValidator:
-    def __init__(self):
-        pass
-    
-    def validate_synthetic_data(self, original_df: pd.DataFrame, synthetic_df: pd.DataFrame, alpha: float = 0.05):
-        st.subheader("Validation and Quality Metrics")
-        
-        validation_results = {
-            'columns': [],
-            'ks_statistic': [],
-            'ks_pvalue': [],
-            'ks_significant': [],
-            'mean_original': [],
-            'mean_synthetic': [],
-            'mean_diff': [],
-            'mean_diff_percent': []
-        }
-        
-        common_columns = set(original_df.columns) & set(synthetic_df.columns)
-        
-        for col in common_columns:
-            if not pd.api.types.is_numeric_dtype(original_df[col]) or not pd.api.types.is_numeric_dtype(synthetic_df[col]):
-                continue
-                
-            orig_data = original_df[col].dropna()
-            synth_data = synthetic_df[col].dropna()
-            
-            if len(orig_data) == 0 or len(synth_data) == 0:
-                continue
-            
-            ks_stat, ks_pvalue = ks_2samp(orig_data, synth_data)
-            
-            mean_orig = orig_data.mean()
-            mean_synth = synth_data.mean()
-            mean_diff = abs(mean_orig - mean_synth)
-            mean_diff_percent = (mean_diff / abs(mean_orig)) * 100 if mean_orig != 0 else 0
-            
-            validation_results['columns'].append(col)
-            validation_results['ks_statistic'].append(ks_stat)
-            validation_results['ks_pvalue'].append(ks_pvalue)
-            validation_results['ks_significant'].append(ks_pvalue < alpha)
-            validation_results['mean_original'].append(mean_orig)
-            validation_results['mean_synthetic'].append(mean_synth)
-            validation_results['mean_diff'].append(mean_diff)
-            validation_results['mean_diff_percent'].append(mean_diff_percent)
-        
-        validation_df = pd.DataFrame(validation_results)
-        
-        if len(validation_df) > 0:
-            col1, col2, col3 = st.columns(3)
-            
-            significant_cols = validation_df['ks_significant'].sum()
-            total_cols = len(validation_df)
-            quality_score = self.calculate_quality_score(validation_df)
-            
-            with col1:
-                st.metric("Quality Score", f"{quality_score:.1f}/100")
-            
-            with col2:
-                st.metric("Distribution Match", f"{(total_cols - significant_cols)}/{total_cols}")
-            
-            with col3:
-                st.metric("Avg Mean Difference", f"{validation_df['mean_diff_percent'].mean():.2f}%")
-            
-            if quality_score >= 80:
-                st.success("EXCELLENT: Synthetic data closely matches original distribution")
-            elif quality_score >= 60:
-                st.warning("GOOD: Synthetic data reasonably matches original distribution")
-            elif quality_score >= 40:
-                st.info("FAIR: Some differences detected in synthetic data")
+    def __init__(self, method: str = 'auto', exact_max_rows: int = DEFAULT_EXACT_MAX_ROWS,
+                 sample_size: int = DEFAULT_SAMPLE_SIZE, strata: int = DEFAULT_STRATA,
+                 sketch_k: int = DEFAULT_SKETCH_K, confidence: float = DEFAULT_CONFIDENCE, seed: Optional[int] = None):
+        if method not in VALIDATION_METHODS:
+            raise ValueError(f"Unknown validation method: {method}")
+        self.method = method
+        self.exact_max_rows = exact_max_rows
+        self.sample_size = sample_size
+        self.strata = strata
+        self.sketch_k = sketch_k
+        self.confidence = confidence
+        self.rng = np.random.default_rng(seed)
+
+    def validate_synthetic_data(self, original_df: pd.DataFrame, synthetic_df: pd.DataFrame, alpha: float = 0.05,
+                                method: Optional[str] = None):
+        method = method or self.method
+        if method not in VALIDATION_METHODS:
+            raise ValueError(f"Unknown validation method: {method}")
+
+        rows = []
+        for col in self.numeric_columns(original_df, synthetic_df):
+            orig_data = original_df[col]
+            synth_data = synthetic_df[col]
+
+            col_method = method
+            if col_method == 'auto':
+                # Exact KS sorts both columns, so it is only used while that stays cheap
+                largest = max(len(orig_data), len(synth_data))
+                col_method = 'exact' if largest <= self.exact_max_rows else 'sample'
+
+            if col_method == 'exact':
+                row = self._exact_row(orig_data.dropna(), synth_data.dropna(), alpha)
+            elif col_method == 'sample':
+                row = self._sample_row(orig_data, synth_data, alpha)
             else:
-                st.error("POOR: Significant differences in synthetic data")
-            
-            st.subheader("Detailed Column Analysis")
-            display_df = validation_df.copy()
-            display_df['ks_significant'] = display_df['ks_significant'].map({True: '❌', False: '✅'})
-            display_df = display_df.round(4)
-            st.dataframe(display_df, use_container_width=True)
-            
-            self._plot_distributions(original_df, synthetic_df, common_columns)
-            
+                row = self._sketch_row(self.sketch(orig_data), self.sketch(synth_data), alpha)
+
+            if row is not None:
+                rows.append(dict(columns=col, **row))
+
+        return self._results_frame(rows)
+
+    def validate_sketches(self, original: Dict[str, QuantileSketch], synthetic: Dict[str, QuantileSketch],
+                          alpha: float = 0.05) -> pd.DataFrame:
+        # Works from precomputed sketches, e.g. from a cached profile and a generation run
+        rows = []
+        for col, orig_sketch in original.items():
+            if col not in synthetic:
+                continue
+            row = self._sketch_row(orig_sketch, synthetic[col], alpha)
+            if row is not None:
+                rows.append(dict(columns=col, **row))
+        return self._results_frame(rows)
+
+    def _exact_row(self, orig_data: pd.Series, synth_data: pd.Series, alpha: float) -> Optional[Dict]:
+        if len(orig_data) == 0 or len(synth_data) == 0:
+            return None
+
+        ks_stat, pvalue = ks_2samp(orig_data, synth_data)
+        return self._result(ks_stat, pvalue, ks_stat, ks_stat, orig_data.mean(), synth_data.mean(), alpha, 'exact')
+
+    def _sample_row(self, orig_data: pd.Series, synth_data: pd.Series, alpha: float) -> Optional[Dict]:
+        orig_sample = self.stratified_sample(orig_data)
+        synth_sample = self.stratified_sample(synth_data)
+        if len(orig_sample) == 0 or len(synth_sample) == 0:
+            return None
+
+        ks_stat, pvalue = ks_2samp(orig_sample, synth_sample)
+        epsilon = self._sample_error(orig_data, orig_sample) + self._sample_error(synth_data, synth_sample)
+        return self._result(ks_stat, pvalue, ks_stat - epsilon, ks_stat + epsilon,
+                            orig_sample.mean(), synth_sample.mean(), alpha, 'sample')
+
+    def _sample_error(self, column_data: pd.Series, sample: np.ndarray) -> float:
+        # A subsampled CDF is within its DKW epsilon of the full column's CDF
+        if len(column_data) <= self.sample_size:
+            return 0.0
+        return dkw_epsilon(len(sample), self.confidence)
+
+    def _sketch_row(self, orig_sketch: QuantileSketch, synth_sketch: QuantileSketch, alpha: float) -> Optional[Dict]:
+        if orig_sketch.count == 0 or synth_sketch.count == 0:
+            return None
+
+        ks_stat = ks_statistic(orig_sketch, synth_sketch)
+        pvalue = ks_pvalue(ks_stat, orig_sketch.count, synth_sketch.count)
+        epsilon = orig_sketch.rank_error(self.confidence) + synth_sketch.rank_error(self.confidence)
+        return self._result(ks_stat, pvalue, ks_stat - epsilon, ks_stat + epsilon,
+                            orig_sketch.mean, synth_sketch.mean, alpha, 'sketch')
+
+    def _result(self, ks_stat, pvalue, ks_lower, ks_upper, mean_orig, mean_synth, alpha, method) -> Dict:
+        mean_diff = abs(mean_orig - mean_synth)
+        mean_diff_percent = (mean_diff / abs(mean_orig)) * 100 if mean_orig != 0 else 0
+        return {
+            'ks_statistic': ks_stat,
+            'ks_pvalue': pvalue,
+            'ks_significant': pvalue < alpha,
+            'ks_lower': max(0.0, ks_lower),
+            'ks_upper': min(1.0, ks_upper),
+            'mean_original': mean_orig,
+            'mean_synthetic': mean_synth,
+            'mean_diff': mean_diff,
+            'mean_diff_percent': mean_diff_percent,
+            'method': method,
+        }
+
+    def _results_frame(self, rows: List[Dict]) -> pd.DataFrame:
+        columns = ['columns', 'ks_statistic', 'ks_pvalue', 'ks_significant', 'ks_lower', 'ks_upper',
+                   'mean_original', 'mean_synthetic', 'mean_diff', 'mean_diff_percent', 'method']
+        return pd.DataFrame(rows, columns=columns)
+
+    def sketch(self, column_data: pd.Series) -> QuantileSketch:
+        return sketch_values(column_data.to_numpy(dtype=float, na_value=np.nan), self.sketch_k, self.rng)
+
+    def stratified_sample(self, column_data: pd.Series) -> np.ndarray:
+        # Equal draws from contiguous row strata, so clustered or sorted inputs stay represented
+        n = len(column_data)
+        if n <= self.sample_size:
+            values = column_data.to_numpy(dtype=float, na_value=np.nan)
+            return values[~np.isnan(values)]
+
+        strata = max(1, min(self.strata, self.sample_size))
+        bounds = np.linspace(0, n, strata + 1).astype(np.int64)
+        per_stratum = self.sample_size // strata
+        starts = np.repeat(bounds[:-1], per_stratum)
+        widths = np.repeat(np.diff(bounds), per_stratum)
+        positions = starts + (self.rng.random(len(starts)) * widths).astype(np.int64)
+
+        values = column_data.iloc[positions].to_numpy(dtype=float, na_value=np.nan)
+        return values[~np.isnan(values)]
+
+    def numeric_columns(self, original_df: pd.DataFrame, synthetic_df: pd.DataFrame) -> List[str]:
+        return [
+            col for col in original_df.columns
+            if col in synthetic_df.columns
+            and pd.api.types.is_numeric_dtype(original_df[col])
+            and pd.api.types.is_numeric_dtype(synthetic_df[col])
+        ]
+
+    def quality_rating(self, quality_score: float) -> Tuple[str, str]:
+        if quality_score >= 80:
+            return 'success', "EXCELLENT: Synthetic data closely matches original distribution"
+        elif quality_score >= 60:
+            return 'warning', "GOOD: Synthetic data reasonably matches original distribution"
+        elif quality_score >= 40:
+            return 'info', "FAIR: Some differences detected in synthetic data"
         else:
-            st.warning("No numeric columns available for validation.")
-        
-        return validation_df
-
-    def _plot_distributions(self, original_df: pd.DataFrame, synthetic_df: pd.DataFrame, common_columns: set):
-        st.subheader("Distribution Comparison")
-        for col in common_columns:
-            if pd.api.types.is_numeric_dtype(original_df[col]):
-                fig = go.Figure()
-                fig.add_trace(go.Histogram(
-                    x=original_df[col].dropna(), 
-                    name='Original', 
-                    opacity=0.7, 
-                    nbinsx=20
-                ))
-                fig.add_trace(go.Histogram(
-                    x=synthetic_df[col].dropna(), 
-                    name='Synthetic', 
-                    opacity=0.7, 
-                    nbinsx=20
-                ))
-                fig.update_layout(
-                    title=f'Distribution of {col}',
-                    xaxis_title=col,
-                    yaxis_title='Frequency',
-                    barmode='overlay'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            return 'error', "POOR: Significant differences in synthetic data"
 
     def calculate_quality_score(self, validation_df: pd.DataFrame) -> float:
         if len(validation_df) == 0:
             return 0
-            
+
         ks_penalty = validation_df['ks_significant'].mean() * 40
         mean_diff_penalty = min(30, validation_df['mean_diff_percent'].mean() / 2)
         base_score = 100
         quality_score = base_score - ks_penalty - mean_diff_penalty
-        
-        return max(0, quality_score)
\ No newline at end of file
+
+        return max(0, quality_score)
+
+
+class QualityThresholdError(ValueError):
+    def __init__(self, quality_score: float, threshold: float, rows: int):
+        super().__init__(f"Quality score {quality_score:.1f} fell below {threshold:.1f} after {rows} rows")
+        self.quality_score = quality_score
+        self.threshold = threshold
+        self.rows = rows
+
+
+class StreamingValidator:
+    # Validates generated chunks as they are produced, against sketches of the original columns
+    def __init__(self, original_sketches: Dict[str, QuantileSketch], validator: DataValidator = None,
+                 alpha: float = 0.05, min_quality: Optional[float] = None, min_rows: int = 0,
+                 reporter=None, metrics: Metrics = None):
+        self.original = original_sketches
+        self.validator = validator if validator is not None else DataValidator('sketch')
+        self.alpha = alpha
+        self.min_quality = min_quality
+        self.min_rows = min_rows
+        self.reporter = reporter
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.synthetic: Dict[str, QuantileSketch] = {
+            col: QuantileSketch(sketch.k) for col, sketch in original_sketches.items()
+        }
+        self.rows = 0
+        self.quality_score: Optional[float] = None
+        self.history: List[Tuple[int, float]] = []
+
+    def observe(self, chunk: pd.DataFrame) -> Optional[float]:
+        with self.metrics.stage('validation', rows=len(chunk)):
+            for col, sketch in self.synthetic.items():
+                if col in chunk.columns and pd.api.types.is_numeric_dtype(chunk[col]):
+                    sketch.update(chunk[col].to_numpy(dtype=float, na_value=np.nan), self.validator.rng)
+            self.rows += len(chunk)
+
+            validation_df = self.results()
+        if len(validation_df) == 0:
+            return None
+
+        self.quality_score = self.validator.calculate_quality_score(validation_df)
+        self.history.append((self.rows, self.quality_score))
+        if self.reporter is not None:
+            self.reporter.status(f"Running quality score after {self.rows} rows: {self.quality_score:.1f}/100")
+
+        if self.min_quality is not None and self.rows >= self.min_rows and self.quality_score < self.min_quality:
+            raise QualityThresholdError(self.quality_score, self.min_quality, self.rows)
+        return self.quality_score
+
+    def observe_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        # Each chunk is checked before it is handed on, so a failing run stops before it is written
+        for chunk in chunks:
+            self.observe(chunk)
+            yield chunk
+
+    def results(self) -> pd.DataFrame:
+        return self.validator.validate_sketches(self.original, self.synthetic, self.alpha)
@@ -0,0 +1,83 @@
+import gzip
+import os
+import pandas as pd
+from typing import Iterable, Iterator, Optional
+
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+FORMATS = {
+    '.csv': 'csv',
+    '.csv.gz': 'csv.gz',
+    '.parquet': 'parquet',
+}
+
+
+def infer_format(path: str) -> str:
+    lower = path.lower()
+    for suffix in sorted(FORMATS, key=len, reverse=True):
+        if lower.endswith(suffix):
+            return FORMATS[suffix]
+    raise ValueError(f"Cannot infer output format from '{path}'; expected one of {', '.join(FORMATS)}")
+
+
+def iter_frame_chunks(df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def write_chunks(chunks: Iterable[pd.DataFrame], path: str, fmt: Optional[str] = None) -> int:
+    fmt = fmt or infer_format(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if fmt == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            return _write_csv(chunks, f)
+    elif fmt == 'csv.gz':
+        with gzip.open(path, 'wt', newline='', encoding='utf-8', compresslevel=6) as f:
+            return _write_csv(chunks, f)
+    elif fmt == 'parquet':
+        return _write_parquet(chunks, path)
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+
+def write_dataframe(df: pd.DataFrame, path: str, fmt: Optional[str] = None,
+                    chunk_size: int = DEFAULT_CHUNK_ROWS) -> int:
+    return write_chunks(iter_frame_chunks(df, chunk_size), path, fmt)
+
+
+def _write_csv(chunks: Iterable[pd.DataFrame], f) -> int:
+    rows = 0
+    header = True
+    for chunk in chunks:
+        chunk.to_csv(f, index=False, header=header)
+        header = False
+        rows += len(chunk)
+    return rows
+
+
+def _write_parquet(chunks: Iterable[pd.DataFrame], path: str) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from e
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(path, table.schema)
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
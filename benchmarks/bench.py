@@ -0,0 +1,203 @@
+"""Throughput and peak-memory benchmarks for the generation, validation and insert paths.
+
+Run from the repository root:
+
+    python -m benchmarks.bench                          # default sizes: 10k and 1M rows
+    python -m benchmarks.bench --sizes 1e4,1e6,1e7 --out results.json
+    python -m benchmarks.bench --compare results.json   # rerun and compare against a saved run
+
+Every case runs in a fresh process so its peak RSS is its own.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_SIZES = [10_000, 1_000_000]
+DEFAULT_SEED = 1234
+SOURCE_ROWS = 10_000
+COLUMNS = ['customer_id', 'name', 'email', 'age', 'city', 'salary', 'signup_date', 'is_active']
+
+
+def _source_frame(rows: int = SOURCE_ROWS) -> pd.DataFrame:
+    rng = np.random.default_rng(DEFAULT_SEED)
+    age = rng.integers(18, 80, rows)
+    return pd.DataFrame({
+        'age': age,
+        'salary': np.round(np.exp(rng.normal(10.5, 0.5, rows)) + age * 300, 2),
+        'score': rng.normal(70, 12, rows).round(1),
+        'visits': rng.poisson(4, rows),
+        'city': rng.choice(['Lahore', 'Karachi', 'Islamabad', 'Quetta'], rows),
+        'department': rng.choice(['Sales', 'Ops', 'IT'], rows),
+    })
+
+
+def _generator():
+    from backend.data_generator import UniversalDataGenerator
+    return UniversalDataGenerator(seed=DEFAULT_SEED)
+
+
+def bench_generate_columns(rows: int) -> float:
+    generator = _generator()
+    started = time.perf_counter()
+    generator.generate_from_columns(COLUMNS, rows)
+    return time.perf_counter() - started
+
+
+def bench_extend_csv(rows: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'source.csv')
+        _source_frame().to_csv(path, index=False)
+        generator = _generator()
+        started = time.perf_counter()
+        generator.generate_from_csv(path, rows, validate=False)
+        return time.perf_counter() - started
+
+
+def bench_validate(rows: int) -> float:
+    from backend.validation import DataValidator
+
+    original = _source_frame()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'source.csv')
+        original.to_csv(path, index=False)
+        generator = _generator()
+        synthetic, _ = generator.generate_from_csv(path, rows, validate=False)
+
+    validator = DataValidator(seed=DEFAULT_SEED)
+    started = time.perf_counter()
+    validator.validate_synthetic_data(original, synthetic)
+    return time.perf_counter() - started
+
+
+def bench_insert(rows: int) -> float:
+    # sqlite3 stands in for MySQL; the batched-insert path is the same BulkLoader code
+    from backend.database_handler import DatabaseHandler
+
+    generator = _generator()
+    data = generator.generate_from_columns(COLUMNS, rows)
+    connection = sqlite3.connect(':memory:')
+    connection.execute(f"CREATE TABLE customers ({', '.join(COLUMNS)})")
+    handler = DatabaseHandler(generator)
+
+    started = time.perf_counter()
+    inserted = handler.insert_to_mysql_table(connection, 'customers', data)
+    elapsed = time.perf_counter() - started
+    connection.close()
+    if not inserted:
+        raise RuntimeError("insert_to_mysql_table failed")
+    return elapsed
+
+
+CASES: Dict[str, Callable[[int], float]] = {
+    'generate_columns': bench_generate_columns,
+    'extend_csv': bench_extend_csv,
+    'validate': bench_validate,
+    'insert_sqlite': bench_insert,
+}
+
+
+def _peak_rss_mb() -> float:
+    from backend.metrics import peak_rss_bytes
+
+    return peak_rss_bytes() / (1024 * 1024)
+
+
+def _run_case(name: str, rows: int) -> Dict:
+    seconds = CASES[name](rows)
+    return {
+        'case': name,
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds if seconds > 0 else float('inf'),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_case(name: str, rows: int) -> Dict:
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(_run_case, (name, rows))
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _sizes(value: str) -> List[int]:
+    return [int(float(size)) for size in value.split(',') if size.strip()]
+
+
+def _print_results(results: List[Dict], baseline: Optional[Dict] = None):
+    previous = {}
+    if baseline is not None:
+        previous = {(r['case'], r['rows']): r for r in baseline['results']}
+
+    header = f"{'case':<18}{'rows':>12}{'seconds':>10}{'rows/s':>14}{'peak MB':>10}"
+    if previous:
+        header += f"{'vs base':>10}"
+    print(header)
+    for result in results:
+        line = (f"{result['case']:<18}{result['rows']:>12,}{result['seconds']:>10.3f}"
+                f"{result['rows_per_sec']:>14,.0f}{result['peak_rss_mb']:>10.1f}")
+        base = previous.get((result['case'], result['rows']))
+        if base is not None:
+            line += f"{result['rows_per_sec'] / base['rows_per_sec']:>9.2f}x"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Synthetic Data Factory benchmarks")
+    parser.add_argument('--sizes', type=_sizes, default=DEFAULT_SIZES, help="comma-separated row counts (e.g. 1e4,1e6,1e7)")
+    parser.add_argument('--cases', type=lambda value: value.split(','), default=list(CASES),
+                        help=f"comma-separated cases ({', '.join(CASES)})")
+    parser.add_argument('--out', help="write results as JSON")
+    parser.add_argument('--compare', metavar='JSON', help="report speed relative to a saved run")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    results = []
+    for name in args.cases:
+        for rows in args.sizes:
+            results.append(run_case(name, rows))
+            print(f"{name} @ {rows:,} rows: {results[-1]['rows_per_sec']:,.0f} rows/s", file=sys.stderr)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    _print_results(results, baseline)
+
+    if args.out:
+        report = {
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'results': results,
+        }
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
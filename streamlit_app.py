@@ -1,6 +1,79 @@
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
-from backend import UniversalDataGenerator, DatabaseHandler, DataValidator
+import plotly.graph_objects as go
+from pymysql import MySQLError
+from backend import UniversalDataGenerator, DatabaseHandler, DataValidator, Reporter
+from backend.cache import ProfileCache
+from backend.connection_pool import ConnectionPool
+from backend.jobs import JobQueue
+from backend.readers import input_suffix, read_source, source_row_count
+from backend.writers import infer_format, write_chunks, write_dataframe
+
+
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "sdf_exports")
+# Past this many rows, output is generated straight into the export file chunk by chunk
+# instead of being held in the session as a DataFrame
+STREAM_EXPORT_ROWS = 1_000_000
+PREVIEW_ROWS = 10
+# Only this many rows of an upload are read for the page; profiling reads the file itself
+# (streamed, when asked), so the page never holds the whole source
+SOURCE_PREVIEW_ROWS = 1000
+# Uploads larger than this default to streaming profiling
+STREAMING_UPLOAD_BYTES = 100 * 1024 * 1024
+MIME_TYPES = {'csv': "text/csv", 'csv.gz': "application/gzip", 'parquet': "application/octet-stream"}
+MYSQL_POOL_SIZE = 8
+# Extensions the uploader accepts; compressed CSV is matched on its last suffix (.csv.gz -> gz)
+UPLOAD_TYPES = ['csv', 'gz', 'bz2', 'zst', 'lz4', 'parquet', 'pq', 'feather', 'arrow', 'ipc']
+
+
+class StreamlitReporter(Reporter):
+    def __init__(self):
+        self.progress_bar = None
+        self.status_text = None
+
+    def begin(self):
+        self.progress_bar = st.progress(0)
+        self.status_text = st.empty()
+
+    def progress(self, percent: int):
+        if self.progress_bar is not None:
+            self.progress_bar.progress(min(100, max(0, int(percent))))
+
+    def status(self, message: str):
+        if self.status_text is not None:
+            self.status_text.text(message)
+
+    def preview(self, title: str, dataframe, caption: str = None):
+        with st.expander(title, expanded=True):
+            if caption:
+                st.write(f"**Dataset Info:** {caption}")
+            st.dataframe(dataframe, use_container_width=True)
+
+    def success(self, message: str):
+        st.success(message)
+
+    def info(self, message: str):
+        st.info(message)
+
+    def warning(self, message: str):
+        st.warning(message)
+
+    def error(self, message: str):
+        st.error(message)
+
+
+@st.cache_resource(show_spinner=False)
+def mysql_pool(host: str, user: str, password: str, database: str) -> ConnectionPool:
+    # One bounded pool per database, shared by every session instead of a connection each
+    return ConnectionPool.for_mysql(host, user, password, database, max_size=MYSQL_POOL_SIZE)
+
+
+@st.cache_resource(show_spinner=False)
+def job_queue() -> JobQueue:
+    # Background jobs outlive reruns and sessions; every session submits to the same workers
+    return JobQueue()
 
 
 def main():
@@ -16,13 +89,20 @@ def main():
     
     # Initialize session state
     if 'generator' not in st.session_state:
-        st.session_state.generator = UniversalDataGenerator()
+        st.session_state.generator = UniversalDataGenerator(reporter=StreamlitReporter(), cache=ProfileCache())
     if 'db_handler' not in st.session_state:
         st.session_state.db_handler = DatabaseHandler(st.session_state.generator)
     if 'validator' not in st.session_state:
         st.session_state.validator = DataValidator()
     if 'synthetic_data' not in st.session_state:
-        st.session_state.synthetic_data = None
+        set_synthetic_data(None)
+    if 'export_dir' not in st.session_state:
+        # Each session exports into its own directory, so sessions never overwrite each other
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        st.session_state.export_dir = tempfile.mkdtemp(prefix="session_", dir=EXPORT_DIR)
+        st.session_state.exports = {}
+    if 'job_ids' not in st.session_state:
+        st.session_state.job_ids = []
     
     # Header
     st.markdown('<h1 class="main-header">Synthetic Data Factory</h1>', unsafe_allow_html=True)
@@ -48,6 +128,9 @@ def main():
         mysql_operations_page()
     with tab5:
         about_page()
+    
+    with st.sidebar:
+        render_jobs()
 
 
 def home_page():
@@ -321,19 +404,26 @@ def csv_extension_page():
     </div>
     """, unsafe_allow_html=True)
     
-    uploaded_file = st.file_uploader("Upload CSV File", type=['csv'])
+    uploaded_file = st.file_uploader("Upload CSV, Parquet or Arrow File", type=UPLOAD_TYPES)
     st.markdown(" ")
     
     if uploaded_file is not None:
-        with open("temp_upload.csv", "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        # Saved once per upload, in the session's own directory; the suffix tells the reader the
+        # format (plain or compressed CSV, Parquet, Arrow)
+        upload_path = os.path.join(st.session_state.export_dir, f"upload{input_suffix(uploaded_file.name)}")
+        if st.session_state.get('upload_id') != uploaded_file.file_id or not os.path.exists(upload_path):
+            with open(upload_path, "wb") as f:
+                f.write(uploaded_file.getbuffer())
+            st.session_state.upload_id = uploaded_file.file_id
         
-        original_df = pd.read_csv("temp_upload.csv")
+        original_df = read_source(upload_path, limit=SOURCE_PREVIEW_ROWS)
+        row_count = source_row_count(upload_path)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.metric("Original Rows", len(original_df))
+            st.metric("Original Rows", f"{row_count:,}" if row_count is not None else "—",
+                      help=None if row_count is not None else "CSV rows are counted while profiling")
         with col2:
             st.metric("Columns", len(original_df.columns))
         
@@ -349,31 +439,49 @@ def csv_extension_page():
             output_file = st.text_input("Output Filename", value="synthetic_data.csv")
         
         validate = st.checkbox("Run Validation", value=True)
+        streaming = st.checkbox("Streaming Profiling (large files)", value=uploaded_file.size > STREAMING_UPLOAD_BYTES,
+                                help="Profiles the file chunk by chunk, so memory stays flat whatever its size")
+        background = st.checkbox("Run in Background (large jobs)", value=False, key="csv_background")
         
         if st.button("Generate Synthetic Data", type="primary", use_container_width=True):
-            with st.spinner("Generating synthetic data..."):
-                synthetic_df, original_df_full = st.session_state.generator.generate_from_csv(
-                    "temp_upload.csv", 
-                    num_rows, 
-                    validate=False
-                )
+            if background:
+                csv_file = job_queue().stage_upload(uploaded_file.getbuffer(), input_suffix(uploaded_file.name))
+                submit_job('csv', {'csv_file': csv_file, 'num_rows': int(num_rows), 'streaming': streaming})
+            elif num_rows > STREAM_EXPORT_ROWS:
+                with st.spinner(f"Generating {num_rows:,} rows into {output_file}..."):
+                    generator = st.session_state.generator
+                    generator.metrics.reset()
+                    generator.reporter.begin()
+                    profiler, original_df_full = generator.profile_csv(upload_path, streaming)
+                    chunks = generator.iter_profile_chunks(profiler.profiles, num_rows, copula=profiler.copula,
+                                                           missingness=profiler.missingness)
+                    first_chunk = stream_export(chunks, output_file, "csv_download")
                 
-                if synthetic_df is not None:
-                    st.session_state.synthetic_data = synthetic_df
-                    
                     if validate and original_df_full is not None:
-                        st.session_state.validator.validate_synthetic_data(original_df_full, synthetic_df)
+                        render_validation(original_df_full, first_chunk)
+                
+                    render_metrics(generator.metrics)
+            else:
+                with st.spinner("Generating synthetic data..."):
+                    st.session_state.generator.metrics.reset()
+                    synthetic_df, original_df_full = st.session_state.generator.generate_from_csv(
+                        upload_path, 
+                        num_rows, 
+                        validate=False,
+                        streaming=streaming
+                    )
+                
+                    if synthetic_df is not None:
+                        set_synthetic_data(synthetic_df)
+                    
+                        if validate and original_df_full is not None:
+                            render_validation(original_df_full, synthetic_df)
+                    
+                        render_metrics(st.session_state.generator.metrics)
         
-        if st.session_state.synthetic_data is not None:
+        if has_export("csv_download"):
             st.markdown("### Download Generated Data")
-            csv = st.session_state.synthetic_data.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=output_file,
-                mime="text/csv",
-                use_container_width=True
-            )
+            export_download(output_file, key="csv_download")
 
 
 def dummy_data_creation_page():
@@ -410,6 +518,8 @@ def dummy_data_creation_page():
     with col2:
         output_file = st.text_input("Output Filename", value="dummy_data.csv")
     
+    background = st.checkbox("Run in Background (large jobs)", value=False, key="columns_background")
+    
     if st.button("Generate dummy Data", type="primary", use_container_width=True):
         if columns_input:
             columns = []
@@ -418,21 +528,30 @@ def dummy_data_creation_page():
             else:
                 columns = [col.strip() for col in columns_input.split('\n') if col.strip()]
             
-            if columns:
+            if columns and background:
+                submit_job('columns', {'columns': columns, 'num_rows': int(num_rows)})
+            elif columns and num_rows > STREAM_EXPORT_ROWS:
+                with st.spinner(f"Generating {num_rows:,} rows into {output_file}..."):
+                    generator = st.session_state.generator
+                    generator.metrics.reset()
+                    generator.reporter.begin()
+                    stream_export(generator.iter_column_chunks(columns, num_rows), output_file, "columns_download")
+                
+                render_metrics(generator.metrics)
+                
+                st.markdown("### Download Generated Data")
+                export_download(output_file, key="columns_download")
+            elif columns:
                 with st.spinner(f"Generating {num_rows} rows with {len(columns)} columns..."):
+                    st.session_state.generator.metrics.reset()
                     synthetic_df = st.session_state.generator.generate_from_columns(columns, num_rows)
-                    st.session_state.synthetic_data = synthetic_df
+                    set_synthetic_data(synthetic_df)
                 
-                if st.session_state.synthetic_data is not None:
+                render_metrics(st.session_state.generator.metrics)
+                
+                if has_export("columns_download"):
                     st.markdown("### Download Generated Data")
-                    csv = st.session_state.synthetic_data.to_csv(index=False)
-                    st.download_button(
-                        label="Download CSV",
-                        data=csv,
-                        file_name=output_file,
-                        mime="text/csv",
-                        use_container_width=True
-                    )
+                    export_download(output_file, key="columns_download")
             else:
                 st.error("Please enter at least one column name.")
         else:
@@ -472,72 +591,305 @@ def mysql_operations_page():
     
     if st.button("Connect to Database", use_container_width=True):
         with st.spinner("Connecting to database..."):
-            connection = st.session_state.db_handler.connect_to_mysql(host, user, password, database)
-            if connection:
-                st.session_state.db_connection = connection
-                st.session_state.db_tables = st.session_state.db_handler.get_mysql_tables(connection)
+            pool = mysql_pool(host, user, password, database)
+            try:
+                with pool.connection() as connection:
+                    st.session_state.db_tables = st.session_state.db_handler.get_mysql_tables(connection)
+                st.session_state.db_pool = pool
+                st.success("Successfully connected to MySQL database!")
+            except MySQLError as err:
+                st.error(f"Failed to connect to database: {err}")
     
-    if 'db_connection' in st.session_state and st.session_state.db_connection:
+    if st.session_state.get('db_pool') is not None:
         st.success("Connected to database!")
         
         if st.session_state.db_tables:
-            st.subheader("Available Tables")
-            selected_table = st.selectbox("Select Table", st.session_state.db_tables)
+            # One pooled connection per rerun, returned to the shared pool when the page is drawn
+            with st.session_state.db_pool.connection() as connection:
+                st.subheader("Available Tables")
+                selected_table = st.selectbox("Select Table", st.session_state.db_tables)
             
-            if selected_table:
-                # Show table schema
-                schema = st.session_state.db_handler.get_table_schema(st.session_state.db_connection, selected_table)
+                if selected_table:
+                    # Show table schema
+                    schema = st.session_state.db_handler.get_table_schema(connection, selected_table)
                 
-                st.subheader("Table Schema")
-                schema_df = pd.DataFrame.from_dict(schema, orient='index')
-                st.dataframe(schema_df, use_container_width=True)
+                    st.subheader("Table Schema")
+                    schema_df = pd.DataFrame.from_dict(schema, orient='index')
+                    st.dataframe(schema_df, use_container_width=True)
                 
-                num_rows = st.number_input("Number of Rows", min_value=1, value=100, key="mysql_rows")
-                validate = st.checkbox("Run Validation", value=True, key="mysql_validate")
-                insert_db = st.checkbox("Insert into Database", value=False)
+                    if st.button("Profile Table on Server", use_container_width=True):
+                        with st.spinner(f"Profiling '{selected_table}'..."):
+                            table_profile = st.session_state.db_handler.aggregate_profile(
+                                connection, selected_table
+                            )
+                        if table_profile is not None:
+                            st.dataframe(table_profile.astype(str), use_container_width=True)
                 
-                if st.button("Generate from Table Schema", type="primary", use_container_width=True):
-                    with st.spinner(f"Generating data for table '{selected_table}'..."):
-                        synthetic_df, original_df = st.session_state.db_handler.generate_from_mysql_table(
-                            st.session_state.db_connection,
-                            selected_table,
-                            num_rows
-                        )
-                        st.session_state.synthetic_data = synthetic_df
-                        
-                        if synthetic_df is not None:
-                            if validate and original_df is not None and len(original_df) > 0:
-                                st.info(f"Validating against {len(original_df)} original rows...")
-                                st.session_state.validator.validate_synthetic_data(original_df, synthetic_df)
-                            
-                            if insert_db:
-                                success = st.session_state.db_handler.insert_to_mysql_table(
-                                    st.session_state.db_connection,
+                    num_rows = st.number_input("Number of Rows", min_value=1, value=100, key="mysql_rows")
+                    sampling = st.selectbox(
+                        "Sampling", ['first', 'random', 'full'], key="mysql_sampling",
+                        help="Rows read for validation: the first 1000, a random 1000, or a uniform sample from a full scan"
+                    )
+                    validate = st.checkbox("Run Validation", value=True, key="mysql_validate")
+                    insert_db = st.checkbox("Insert into Database", value=False)
+                    background = st.checkbox("Run in Background (large jobs)", value=False, key="mysql_background")
+                
+                    if st.button("Generate from Table Schema", type="primary", use_container_width=True):
+                        if background:
+                            # The password goes to the worker only; it is not stored with the job
+                            submit_job('mysql', {'host': host, 'user': user, 'database': database,
+                                                 'table': selected_table, 'num_rows': int(num_rows),
+                                                 'sampling': sampling}, {'password': password})
+                        else:
+                            with st.spinner(f"Generating data for table '{selected_table}'..."):
+                                synthetic_df, original_df = st.session_state.db_handler.generate_from_mysql_table(
+                                    connection,
                                     selected_table,
-                                    synthetic_df
+                                    num_rows,
+                                    sampling=sampling
                                 )
-        
+                                set_synthetic_data(synthetic_df)
+                        
+                                if synthetic_df is not None:
+                                    if validate and original_df is not None and len(original_df) > 0:
+                                        st.info(f"Validating against {len(original_df)} original rows...")
+                                        render_validation(original_df, synthetic_df)
+                            
+                                    if insert_db:
+                                        success = st.session_state.db_handler.insert_to_mysql_table(
+                                            connection,
+                                            selected_table,
+                                            synthetic_df
+                                        )
+
+
+                st.subheader("Related Tables")
+                st.caption("Generate several tables together; foreign keys are drawn from the generated parent rows.")
+                related_tables = st.multiselect("Tables", st.session_state.db_tables, key="schema_tables")
+                schema_rows = st.number_input("Rows per Table", min_value=1, value=100, key="schema_rows")
+                schema_insert = st.checkbox("Insert into Database", value=False, key="schema_insert")
+
+                if related_tables and st.button("Generate Related Tables", use_container_width=True):
+                    with st.spinner(f"Generating {len(related_tables)} related tables..."):
+                        db_handler = st.session_state.db_handler
+                        if schema_insert:
+                            db_handler.populate_schema(connection, related_tables, schema_rows,
+                                                       pool=st.session_state.db_pool)
+                        else:
+                            frames = db_handler.generate_schema(connection, related_tables, schema_rows)
+                            for table, frame in frames.items():
+                                st.markdown(f"**{table}** ({len(frame)} rows)")
+                                st.dataframe(frame.head(10), use_container_width=True)
+                                export_frame(frame, f"{table}_synthetic_data.csv", f"schema_download_{table}")
+
         # Close connection button
         if st.button("Close Connection", use_container_width=True):
-            if 'db_connection' in st.session_state:
-                st.session_state.db_connection.close()
-                del st.session_state.db_connection
-                if 'db_tables' in st.session_state:
-                    del st.session_state.db_tables
+            # The pool is shared with other sessions, so this session only lets go of it
+            st.session_state.pop('db_pool', None)
+            st.session_state.pop('db_tables', None)
             st.success("Connection closed.")
 
         # Download button for generated data
-        if st.session_state.synthetic_data is not None:
+        if has_export("mysql_download"):
             st.markdown("### Download Generated Data")
-            csv_data = st.session_state.synthetic_data.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv_data,
-                file_name=f"{selected_table}_synthetic_data.csv",
-                mime="text/csv",
-                use_container_width=True,
-                key="mysql_download"
-            )
+            export_download(f"{selected_table}_synthetic_data.csv", key="mysql_download")
+
+
+def render_validation(original_df: pd.DataFrame, synthetic_df: pd.DataFrame, alpha: float = 0.05):
+    validator = st.session_state.validator
+    st.subheader("Validation and Quality Metrics")
+    
+    with st.session_state.generator.metrics.stage('validation', rows=len(synthetic_df)):
+        validation_df = validator.validate_synthetic_data(original_df, synthetic_df, alpha)
+    
+    if len(validation_df) > 0:
+        col1, col2, col3 = st.columns(3)
+        
+        significant_cols = validation_df['ks_significant'].sum()
+        total_cols = len(validation_df)
+        quality_score = validator.calculate_quality_score(validation_df)
+        
+        with col1:
+            st.metric("Quality Score", f"{quality_score:.1f}/100")
+        
+        with col2:
+            st.metric("Distribution Match", f"{(total_cols - significant_cols)}/{total_cols}")
+        
+        with col3:
+            st.metric("Avg Mean Difference", f"{validation_df['mean_diff_percent'].mean():.2f}%")
+        
+        level, message = validator.quality_rating(quality_score)
+        getattr(st, level)(message)
+        
+        st.subheader("Detailed Column Analysis")
+        display_df = validation_df.copy()
+        display_df['ks_significant'] = display_df['ks_significant'].map({True: '❌', False: '✅'})
+        display_df = display_df.round(4)
+        st.dataframe(display_df, use_container_width=True)
+        
+        plot_distributions(original_df, synthetic_df, validator.numeric_columns(original_df, synthetic_df))
+        
+    else:
+        st.warning("No numeric columns available for validation.")
+    
+    return validation_df
+
+
+def submit_job(kind: str, params: dict, secrets: dict = None):
+    job_id = job_queue().submit(kind, params, secrets)
+    st.session_state.job_ids.append(job_id)
+    st.success(f"Job {job_id[:8]} queued. Follow its progress under Background Jobs in the sidebar.")
+
+
+def render_jobs():
+    if not st.session_state.job_ids:
+        return
+    
+    queue = job_queue()
+    st.subheader("Background Jobs")
+    st.button("Refresh", key="jobs_refresh", use_container_width=True)
+    
+    for job in queue.jobs(st.session_state.job_ids):
+        job_id = job['id']
+        st.markdown(f"**{job['kind']}** · `{job_id[:8]}` · {job['status']}")
+        if job['status'] == 'running':
+            st.progress(min(100, job['progress']), text=job['message'] or f"{job['rows']:,} rows")
+        
+        if job['status'] in ('queued', 'running'):
+            if st.button("Cancel", key=f"cancel_{job_id}", use_container_width=True):
+                queue.cancel(job_id)
+        elif job['status'] == 'done' and job['result_path'] and os.path.exists(job['result_path']):
+            with open(job['result_path'], "rb") as f:
+                st.download_button(
+                    label=f"Download ({job['rows']:,} rows)",
+                    data=f,
+                    file_name=f"synthetic_{job_id[:8]}.csv",
+                    mime="text/csv",
+                    use_container_width=True,
+                    key=f"download_{job_id}"
+                )
+        elif job['status'] == 'failed':
+            st.error(job['error'])
+
+
+def render_metrics(metrics):
+    summary = metrics.summary()
+    if len(summary) == 0:
+        return
+    
+    with st.expander("⏱️ Performance Breakdown"):
+        st.dataframe(summary.round(3), use_container_width=True)
+        st.download_button(
+            label="Download Metrics (OpenMetrics)",
+            data=metrics.to_openmetrics(),
+            file_name="sdf_metrics.txt",
+            mime="text/plain"
+        )
+
+
+def plot_distributions(original_df: pd.DataFrame, synthetic_df: pd.DataFrame, columns: list):
+    st.subheader("Distribution Comparison")
+    for col in columns:
+        fig = go.Figure()
+        fig.add_trace(go.Histogram(
+            x=original_df[col].dropna(), 
+            name='Original', 
+            opacity=0.7, 
+            nbinsx=20
+        ))
+        fig.add_trace(go.Histogram(
+            x=synthetic_df[col].dropna(), 
+            name='Synthetic', 
+            opacity=0.7, 
+            nbinsx=20
+        ))
+        fig.update_layout(
+            title=f'Distribution of {col}',
+            xaxis_title=col,
+            yaxis_title='Frequency',
+            barmode='overlay'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def set_synthetic_data(dataframe: pd.DataFrame):
+    # The version tells export_download when the file on disk is stale. A streamed file is
+    # only ever replaced, so it is removed rather than left taking up disk space.
+    streamed = st.session_state.get('streamed_export')
+    if streamed is not None and os.path.exists(streamed['path']):
+        os.remove(streamed['path'])
+    st.session_state.synthetic_data = dataframe
+    st.session_state.streamed_export = None
+    st.session_state.data_version = st.session_state.get('data_version', 0) + 1
+
+
+def has_export(key: str) -> bool:
+    # Generated frames can be downloaded from any page; a streamed file only where it was made
+    streamed = st.session_state.streamed_export
+    return st.session_state.synthetic_data is not None or (streamed is not None and streamed['key'] == key)
+
+
+def export_target(file_name: str, key: str):
+    # (download name, format, path in this session's export directory)
+    file_name = os.path.basename(file_name)
+    try:
+        fmt = infer_format(file_name)
+    except ValueError:
+        file_name, fmt = f"{file_name}.csv", 'csv'
+    return file_name, fmt, os.path.join(st.session_state.export_dir, f"{key}.{fmt}")
+
+
+def stream_export(chunks, file_name: str, key: str) -> pd.DataFrame:
+    # Writes the output chunk by chunk and keeps only the first chunk, for previews and validation
+    file_name, fmt, export_path = export_target(file_name, key)
+    first = []
+    
+    def keep_first(chunks):
+        for chunk in chunks:
+            if not first:
+                first.append(chunk)
+            yield chunk
+    
+    set_synthetic_data(None)
+    rows = write_chunks(keep_first(chunks), export_path, fmt)
+    st.session_state.streamed_export = {'key': key, 'file_name': file_name, 'fmt': fmt, 'path': export_path}
+    st.session_state.generator.reporter.preview("Synthetic Data Preview", first[0].head(PREVIEW_ROWS),
+                                                f"{rows:,} rows written to {file_name}")
+    return first[0]
+
+
+def export_download(file_name: str, key: str):
+    # The session's generated data, written once per generation and file name
+    streamed = st.session_state.streamed_export
+    if streamed is not None:
+        download_file(streamed['path'], streamed['file_name'], streamed['fmt'], key)
+        return
+    
+    file_name, fmt, export_path = export_target(file_name, key)
+    written = (st.session_state.data_version, file_name)
+    if st.session_state.exports.get(key) != written or not os.path.exists(export_path):
+        write_dataframe(st.session_state.synthetic_data, export_path, fmt)
+        st.session_state.exports[key] = written
+    download_file(export_path, file_name, fmt, key)
+
+
+def export_frame(dataframe: pd.DataFrame, file_name: str, key: str):
+    # A frame generated in this run only, such as one of several related tables
+    file_name, fmt, export_path = export_target(file_name, key)
+    write_dataframe(dataframe, export_path, fmt)
+    download_file(export_path, file_name, fmt, key)
+
+
+def download_file(export_path: str, file_name: str, fmt: str, key: str):
+    with open(export_path, "rb") as f:
+        st.download_button(
+            label=f"Download {fmt.upper()}",
+            data=f,
+            file_name=file_name,
+            mime=MIME_TYPES[fmt],
+            use_container_width=True,
+            key=key
+        )
 
 
 def about_page():
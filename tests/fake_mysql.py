@@ -0,0 +1,63 @@
+"""A stand-in for a pymysql connection, driven by a function from (query, params) to rows."""
+import pymysql
+
+
+class FakeCursor:
+    def __init__(self, connection, tuples: bool):
+        self.connection = connection
+        self.tuples = tuples
+        self.rows = []
+        self.description = None
+        self.rowcount = -1
+        self.fetched = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def execute(self, query, params=None):
+        self.connection.queries.append((query, params))
+        rows = list(self.connection.respond(query, params) or [])
+        self.description = [(name,) for name in rows[0]] if rows else []
+        self.rows = [tuple(row.values()) for row in rows] if self.tuples else rows
+        self.rowcount = len(rows)
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        self.fetched.append(len(rows))
+        return rows
+
+
+class FakeConnection:
+    db = b'test'
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.queries = []
+        self.cursors = []
+
+    def cursor(self, cursor_class=None):
+        cursor = FakeCursor(self, tuples=cursor_class is pymysql.cursors.SSCursor)
+        self.cursors.append(cursor)
+        return cursor
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,45 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from backend.bulk_load import BulkLoader, to_load_data_text
+from backend.dtypes import with_nulls
+
+
+def test_load_data_text_handles_nullable_bool():
+    flags = with_nulls(np.array([True, False, True]), np.array([False, False, True]))
+    frame = pd.DataFrame({'id': [1, 2, 3], 'active': flags, 'name': ['a\tb', None, 'c']})
+
+    assert to_load_data_text(frame) == '1\t1\ta\\tb\n2\t0\t\\N\n3\t\\N\tc\n'
+
+
+class CountingConnection(sqlite3.Connection):
+    commits = 0
+
+    def commit(self):
+        self.commits += 1
+        super().commit()
+
+
+def test_batched_load_commits_across_small_chunks_and_keeps_nulls():
+    connection = sqlite3.connect(':memory:', factory=CountingConnection)
+    connection.execute('CREATE TABLE people (id INTEGER PRIMARY KEY, age INTEGER, name TEXT, active INTEGER)')
+    ages = with_nulls(np.arange(1000) % 90, np.arange(1000) % 7 == 0)
+    flags = with_nulls(np.arange(1000) % 2 == 0, np.arange(1000) % 5 == 0)
+    names = pd.Series([None if i % 3 == 0 else f'n{i}' for i in range(1000)], dtype='string')
+    frame = pd.DataFrame({'id': np.arange(1000), 'age': ages, 'name': names, 'active': flags})
+    # Chunks of 10 rows are far smaller than commit_rows, so only a counter shared across
+    # chunks commits every 100 rows
+    chunks = (frame.iloc[start:start + 10] for start in range(0, len(frame), 10))
+
+    loader = BulkLoader(connection, batch_rows=10, commit_rows=100)
+    stats = loader.load('people', chunks)
+
+    assert stats['rows'] == stats['inserted'] == 1000
+    assert connection.commits == 11
+    stored = pd.read_sql('SELECT * FROM people ORDER BY id', connection)
+    assert stored['age'].isna().sum() == frame['age'].isna().sum()
+    assert stored['name'].isna().sum() == frame['name'].isna().sum()
+    assert stored['active'].isna().sum() == frame['active'].isna().sum()
+    assert stored['name'].fillna('').tolist() == frame['name'].fillna('').tolist()
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.cache import ProfileCache
+from backend.data_generator import UniversalDataGenerator
+
+
+@pytest.fixture
+def source_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 50_000
+    path = tmp_path / 'source.csv'
+    # A single numeric column is drawn from its quantile sketch rather than the copula
+    pd.DataFrame({
+        'amount': rng.lognormal(3, 1, n).round(2),
+        'city': rng.choice(['Lahore', 'Karachi', 'Quetta'], n),
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def _generate(source_csv, seed, cache=None, streaming=False):
+    generator = UniversalDataGenerator(seed=seed, cache=cache)
+    synthetic_df, _ = generator.generate_from_csv(source_csv, 2000, validate=False, streaming=streaming,
+                                                  chunksize=10_000)
+    return synthetic_df
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_warm_cache_does_not_change_seeded_output(source_csv, tmp_path, streaming):
+    expected = _generate(source_csv, 1, streaming=streaming)
+
+    cache = ProfileCache(str(tmp_path / 'cache'))
+    _generate(source_csv, 2, cache, streaming)
+    pd.testing.assert_frame_equal(_generate(source_csv, 1, cache, streaming), expected)
+    # A second seed-1 run is served from the cache and still matches
+    pd.testing.assert_frame_equal(_generate(source_csv, 1, cache, streaming), expected)
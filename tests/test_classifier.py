@@ -0,0 +1,25 @@
+import pytest
+
+from backend.classifier import ColumnClassifier, normalize_column_name
+
+
+@pytest.mark.parametrize('column, provider', [
+    # Words run together, which plain substring matching used to handle
+    ('userid', 'id'), ('customerid', 'id'), ('orderid', 'id'), ('employeeid', 'id'),
+    ('productname', 'product'), ('studentname', 'name'), ('emailaddress', 'email'),
+    ('phoneno', 'phone'), ('createdate', 'date'), ('isactive', 'is_'), ('totalprice', 'price'),
+    # camelCase, acronyms and separators
+    ('CarID', 'id'), ('customerID', 'id'), ('Customer ID', 'id'), ('firstName', 'first_name'),
+    ('company_name', 'company'), ('user_name', 'username'), ('phone_number', 'phone'),
+    # Whole-token matching keeps these apart
+    ('paid', 'word'), ('page', 'word'), ('valid', 'word'), ('island', 'word'),
+    ('date_of_birth', 'date_of_birth'), ('dob', 'date_of_birth'), ('age', 'age'),
+])
+def test_classify(column, provider):
+    assert ColumnClassifier().classify(column) == provider
+
+
+def test_normalize_splits_only_known_compounds():
+    assert normalize_column_name('customerID') == 'customer_id'
+    assert normalize_column_name('userid') == 'user_id'
+    assert normalize_column_name('liquid') == 'liquid'
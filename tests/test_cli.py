@@ -0,0 +1,14 @@
+import pytest
+
+from backend.cli import main
+
+
+@pytest.mark.parametrize('source', [['--columns', 'name,email'], ['--spec', 'dataset.yaml']])
+@pytest.mark.parametrize('flag', [['--validate'], ['--min-quality', '80']])
+def test_validation_needs_a_source_file(tmp_path, capsys, source, flag):
+    with pytest.raises(SystemExit) as exit_info:
+        main(['generate', *source, *flag, '--out', str(tmp_path / 'out.csv')])
+
+    assert exit_info.value.code == 2
+    assert '--validate and --min-quality need --from-csv' in capsys.readouterr().err
+    assert not (tmp_path / 'out.csv').exists()
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+from pymysql import MySQLError, OperationalError
+
+from backend.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class Connection:
+    def __init__(self):
+        self.open = True
+        self.closed = False
+        self.rollbacks = 0
+        self.ping_error = None
+
+    def ping(self, reconnect=False):
+        if self.ping_error is not None:
+            raise self.ping_error
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.open = False
+        self.closed = True
+
+
+def _pool(**kwargs):
+    made = []
+
+    def connect():
+        made.append(Connection())
+        return made[-1]
+    return ConnectionPool(connect, **kwargs), made
+
+
+def test_idle_connections_are_reused_then_evicted():
+    pool, made = _pool(idle_timeout=0.05)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first and first.rollbacks == 1
+    assert (pool.size, pool.idle) == (1, 1)
+
+    time.sleep(0.1)
+    with pool.connection() as third:
+        assert third is not first
+    assert made[0].closed and len(made) == 2 and pool.size == 1
+
+
+def test_a_connection_that_fails_its_ping_is_discarded():
+    pool, made = _pool()
+    with pool.connection():
+        pass
+    made[0].ping_error = OperationalError(2006, "MySQL server has gone away")
+
+    with pytest.raises(OperationalError):
+        pool.acquire()
+    assert made[0].closed and (pool.size, pool.idle) == (0, 0)
+    with pool.connection() as connection:
+        assert connection is made[1]
+
+
+def test_checkout_waits_at_the_size_limit_and_times_out():
+    pool, made = _pool(max_size=2, checkout_timeout=0.05)
+    held = [pool.acquire(), pool.acquire()]
+
+    started = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert time.monotonic() - started >= 0.05
+    assert len(made) == 2 and pool.size == 2
+
+    # A waiting checkout gets the connection as soon as it is released
+    threading.Timer(0.05, pool.release, [held[0]]).start()
+    assert pool.acquire(timeout=5) is held[0]
+
+
+def test_connections_return_to_the_pool_after_an_error():
+    pool, made = _pool(max_size=1)
+
+    with pytest.raises(MySQLError):
+        with pool.connection():
+            raise MySQLError("duplicate key")
+    assert (pool.size, pool.idle) == (1, 1) and not made[0].closed
+
+    # A connection the error left closed is replaced instead of handed out again
+    with pytest.raises(OperationalError):
+        with pool.connection() as connection:
+            connection.close()
+            raise OperationalError(2013, "Lost connection to MySQL server")
+    assert (pool.size, pool.idle) == (0, 0)
+    with pool.connection() as connection:
+        assert connection is made[1]
+
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("not a database error")
+    assert (pool.size, pool.idle) == (1, 1)
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from backend.copula import GaussianCopula
+from backend.data_generator import UniversalDataGenerator
+
+
+def test_generated_columns_keep_the_source_rank_correlation(tmp_path):
+    rng = np.random.default_rng(0)
+    income = rng.lognormal(10, 0.5, 5000)
+    source = pd.DataFrame({'income': income,
+                           'spend': income * rng.uniform(0.2, 0.4, 5000),
+                           'age': rng.integers(18, 80, 5000),
+                           'debt': -np.log(income) + rng.normal(0, 0.3, 5000)})
+    path = str(tmp_path / 'source.csv')
+    source.to_csv(path, index=False)
+
+    synthetic, _ = UniversalDataGenerator(seed=1).generate_from_csv(path, 20000)
+
+    expected = source.corr(method='spearman')
+    actual = synthetic[source.columns].corr(method='spearman')
+    assert np.abs(actual - expected).to_numpy().max() < 0.05
+    assert expected.loc['income', 'spend'] > 0.8 and expected.loc['income', 'debt'] < -0.5
+
+
+def test_copula_is_skipped_with_fewer_than_two_numeric_columns(tmp_path):
+    rng = np.random.default_rng(0)
+    source = pd.DataFrame({'score': rng.normal(50, 10, 500), 'city': rng.choice(['Oslo', 'Lima'], 500)})
+    path = str(tmp_path / 'source.csv')
+    source.to_csv(path, index=False)
+
+    generator = UniversalDataGenerator(seed=1)
+    profiler, _ = generator.profile_csv(path)
+    assert profiler.copula is None
+    assert len(generator.generate_from_profiles(profiler.profiles, 100, copula=profiler.copula)) == 100
+
+    # A column with a single observed value carries no rank information either
+    sample = np.column_stack([rng.normal(size=100), np.r_[1.0, np.full(99, np.nan)]])
+    assert GaussianCopula.fit(['a', 'b'], sample) is None
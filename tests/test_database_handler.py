@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from backend import database_handler
+from backend.cache import ProfileCache
+from backend.data_generator import UniversalDataGenerator
+from backend.database_handler import DatabaseHandler
+from fake_mysql import FakeConnection
+
+
+def _respond(query, params):
+    if query.startswith('DESCRIBE'):
+        return [{'Field': 'score', 'Type': 'int', 'Null': 'YES', 'Key': '', 'Default': None, 'Extra': ''}]
+    if 'information_schema.COLUMNS' in query:
+        return [{'COLUMN_NAME': 'score', 'COLUMN_TYPE': 'int'}]
+    if 'information_schema.TABLES' in query:
+        return [{'TABLE_ROWS': 100000, 'DATA_LENGTH': 4096, 'CREATE_TIME': None, 'UPDATE_TIME': None}]
+    raise AssertionError(f"unexpected query: {query}")
+
+
+def test_fingerprint_reads_statistics_not_the_whole_table():
+    connection = FakeConnection(_respond)
+    handler = DatabaseHandler(UniversalDataGenerator(seed=1))
+
+    assert handler.table_fingerprint(connection, 'scores') is not None
+    assert not any('COUNT(*)' in query for query, _ in connection.queries)
+
+
+def test_random_sample_cache_is_keyed_on_the_seed(tmp_path, monkeypatch):
+    def sample_table(connection, table_name, sample_rows, method, rng):
+        return pd.DataFrame({'score': rng.integers(0, 100, 20)})
+    monkeypatch.setattr(database_handler, 'sample_table', sample_table)
+    cache = ProfileCache(str(tmp_path))
+
+    def profile(seed):
+        handler = DatabaseHandler(UniversalDataGenerator(seed=seed, cache=cache))
+        return handler.profile_mysql_table(FakeConnection(_respond), 'scores', sampling='random')[1]
+
+    cold = profile(1)
+    profile(2)
+    pd.testing.assert_frame_equal(profile(1), cold)
+    assert not np.array_equal(profile(2)['score'], cold['score'])
+
+
+def _column(name, type_, key=''):
+    return {'Field': name, 'Type': type_, 'Null': 'NO', 'Key': key, 'Default': None, 'Extra': ''}
+
+
+SCHEMA = {
+    'students': [_column('student_id', 'int', 'PRI'), _column('name', 'varchar(50)')],
+    'courses': [_column('course_code', 'varchar(20)', 'PRI'), _column('title', 'varchar(50)')],
+    'enrollments': [_column('student_id', 'int', 'PRI'), _column('course_code', 'varchar(20)', 'PRI')],
+}
+LINKS = [('fk_student', 'enrollments', 'student_id', 'students', 'student_id'),
+         ('fk_course', 'enrollments', 'course_code', 'courses', 'course_code')]
+
+
+def _respond_schema(query, params):
+    if query.startswith('SHOW TABLES'):
+        return [{'Tables_in_test': table} for table in SCHEMA]
+    if query.startswith('DESCRIBE'):
+        return SCHEMA[query.split()[1]]
+    if 'KEY_COLUMN_USAGE' in query:
+        return [dict(zip(('CONSTRAINT_NAME', 'TABLE_NAME', 'COLUMN_NAME', 'REFERENCED_TABLE_NAME',
+                          'REFERENCED_COLUMN_NAME'), link)) for link in LINKS]
+    if 'LIKE' in query:
+        return [{'last_key': 41}]
+    if query.startswith('SELECT COALESCE(MAX('):
+        return [{'last_key': 7}]
+    raise AssertionError(f"unexpected query: {query}")
+
+
+def test_link_table_draws_distinct_pairs_and_reports_a_shortfall():
+    generator = UniversalDataGenerator(seed=1)
+    warnings = []
+    generator.reporter.warning = warnings.append
+    frames = DatabaseHandler(generator).generate_schema(
+        FakeConnection(_respond_schema), num_rows={'students': 6, 'courses': 5, 'enrollments': 20})
+
+    enrollments = frames['enrollments']
+    assert len(enrollments) == 20 and not enrollments.duplicated().any()
+    assert enrollments['student_id'].isin(frames['students']['student_id']).all()
+    assert enrollments['course_code'].isin(frames['courses']['course_code']).all()
+
+    frames = DatabaseHandler(generator).generate_schema(
+        FakeConnection(_respond_schema), num_rows={'students': 6, 'courses': 5, 'enrollments': 40})
+    assert len(frames['enrollments']) == 30 and not frames['enrollments'].duplicated().any()
+    assert any('only 30 distinct key combinations' in message for message in warnings)
+
+
+def test_keys_continue_after_the_existing_rows():
+    frames = DatabaseHandler(UniversalDataGenerator(seed=1)).generate_schema(
+        FakeConnection(_respond_schema), tables=['students', 'courses'], num_rows=3)
+
+    assert list(frames['students']['student_id']) == [8, 9, 10]
+    assert list(frames['courses']['course_code']) == ['PK_42', 'PK_43', 'PK_44']
+
+
+def test_single_table_primary_keys_use_the_same_key_values(monkeypatch):
+    monkeypatch.setattr(database_handler, 'sample_table', lambda *args: pd.DataFrame())
+    handler = DatabaseHandler(UniversalDataGenerator(seed=1))
+
+    synthetic, _ = handler.generate_from_mysql_table(FakeConnection(_respond_schema), 'students', num_rows=3)
+
+    assert list(synthetic['student_id']) == [8, 9, 10]
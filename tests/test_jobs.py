@@ -0,0 +1,65 @@
+import socket
+import sqlite3
+import subprocess
+import sys
+
+import pymysql
+
+from backend import connection_pool
+from backend.jobs import JobStore, process_owner, run_job
+from fake_mysql import FakeConnection
+
+
+def test_recover_fails_only_jobs_whose_process_is_gone(tmp_path):
+    path = str(tmp_path / 'jobs.sqlite')
+    finished = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                              capture_output=True, text=True, check=True)
+    dead_owner = f"{socket.gethostname()}:{int(finished.stdout)}"
+
+    live = JobStore(path, owner=process_owner()).create('columns', {})
+    dead = JobStore(path, owner=dead_owner).create('columns', {})
+    remote = JobStore(path, owner='another-host:1').create('columns', {})
+    JobStore(path, owner=dead_owner).start(dead)
+
+    store = JobStore(path, owner=process_owner())
+    store.recover()
+
+    assert store.get(live)['status'] == 'queued'
+    assert store.get(remote)['status'] == 'queued'
+    assert store.get(dead)['status'] == 'failed'
+
+
+def test_store_adds_the_owner_column_to_an_older_database(tmp_path):
+    path = str(tmp_path / 'jobs.sqlite')
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, kind TEXT NOT NULL, params TEXT NOT NULL, "
+                       "status TEXT NOT NULL, progress INTEGER NOT NULL DEFAULT 0, message TEXT NOT NULL DEFAULT '', "
+                       "rows INTEGER NOT NULL DEFAULT 0, result_path TEXT, error TEXT, "
+                       "cancel_requested INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL, "
+                       "started_at REAL, finished_at REAL)")
+    connection.execute("INSERT INTO jobs (id, kind, params, status, created_at) VALUES ('old', 'csv', '{}', 'running', 0)")
+    connection.commit()
+    connection.close()
+
+    store = JobStore(path, owner=process_owner())
+    job_id = store.create('columns', {})
+    store.recover()
+
+    assert store.get('old')['status'] == 'failed'
+    assert store.get(job_id)['status'] == 'queued'
+
+
+def test_mysql_job_fails_with_the_reported_error(tmp_path, monkeypatch):
+    def respond(query, params):
+        raise pymysql.err.ProgrammingError(1146, "Table 'test.missing' doesn't exist")
+    monkeypatch.setattr(connection_pool, 'mysql_connector', lambda *args: lambda: FakeConnection(respond))
+    path = str(tmp_path / 'jobs.sqlite')
+    store = JobStore(path)
+    job_id = store.create('mysql', {})
+
+    params = {'host': 'localhost', 'user': 'test', 'database': 'test', 'table': 'missing', 'num_rows': 10}
+    run_job(path, job_id, 'mysql', params, {}, str(tmp_path))
+
+    job = store.get(job_id)
+    assert job['status'] == 'failed'
+    assert "Error fetching schema for missing" in job['error'] and "doesn't exist" in job['error']
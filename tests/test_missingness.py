@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from backend.data_generator import UniversalDataGenerator
+from backend.missingness import MissingnessProfile
+
+
+def _source(rng, rows=10_000):
+    # The address block goes missing as a unit; phone goes missing on its own
+    source = pd.DataFrame({'street': rng.choice(['Main St', 'High St'], rows),
+                           'city': rng.choice(['Oslo', 'Lima'], rows),
+                           'zip': rng.integers(10_000, 99_999, rows).astype(float),
+                           'phone': rng.choice(['555-0100', '555-0199'], rows), 'score': rng.normal(50, 10, rows)})
+    source.loc[rng.random(rows) < 0.2, ['street', 'city', 'zip']] = None
+    source.loc[rng.random(rows) < 0.1, 'phone'] = None
+    return source
+
+
+def test_columns_missing_together_stay_missing_together():
+    rng = np.random.default_rng(0)
+    source = _source(rng)
+    profile = MissingnessProfile()
+    for start in range(0, len(source), 2_500):
+        profile.update(source.iloc[start:start + 2_500])
+
+    masks = profile.sample(50_000, rng)
+
+    assert set(masks) == {'street', 'city', 'zip', 'phone'}
+    assert (masks['street'] == masks['city']).all() and (masks['city'] == masks['zip']).all()
+    for col, rate in source.isna().mean().items():
+        if rate:
+            assert abs(masks[col].mean() - rate) < 0.01
+    both = (source['street'].isna() & source['phone'].isna()).mean()
+    assert abs((masks['street'] & masks['phone']).mean() - both) < 0.01
+
+
+def test_null_rates_survive_once_patterns_overflow():
+    rng = np.random.default_rng(0)
+    source = pd.DataFrame(rng.random((5_000, 12)), columns=[f"c{i}" for i in range(12)])
+    source = source.mask(rng.random(source.shape) < np.linspace(0.05, 0.6, 12))
+    profile = MissingnessProfile(max_patterns=16)
+    profile.update(source)
+
+    masks = profile.sample(50_000, rng)
+
+    assert profile.overflowed
+    for col, rate in source.isna().mean().items():
+        assert abs(masks[col].mean() - rate) < 0.01
+
+
+def test_generated_output_keeps_the_joint_null_pattern(tmp_path):
+    source = _source(np.random.default_rng(0))
+    path = str(tmp_path / 'source.csv')
+    source.to_csv(path, index=False)
+
+    synthetic, _ = UniversalDataGenerator(seed=1).generate_from_csv(path, 20_000)
+
+    nulls = synthetic[source.columns].isna()
+    assert (nulls['street'] == nulls['city']).all() and (nulls['city'] == nulls['zip']).all()
+    assert abs(nulls['street'].mean() - 0.2) < 0.015 and abs(nulls['phone'].mean() - 0.1) < 0.015
+    assert not nulls['score'].any()
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.data_generator import UniversalDataGenerator
+from backend.profiling import BooleanProfile, profile_frame
+
+
+def test_bool_columns_get_their_own_profile():
+    frame = pd.DataFrame({'flag': [True, False, True, True],
+                          'maybe': pd.array([True, None, False, True], dtype='boolean'),
+                          'score': [1.0, 2.0, 3.0, 4.0]})
+    profiles = profile_frame(frame, np.random.default_rng(0)).profiles
+
+    assert isinstance(profiles['flag'], BooleanProfile) and profiles['flag'].true_rate == 0.75
+    assert isinstance(profiles['maybe'], BooleanProfile) and profiles['maybe'].null_count == 1
+
+
+def test_generated_bools_keep_a_bool_dtype(tmp_path):
+    pytest.importorskip('pyarrow')
+    rng = np.random.default_rng(0)
+    flags = pd.array(rng.random(2000) < 0.3, dtype='boolean')
+    flags[rng.random(2000) < 0.1] = pd.NA
+    source = pd.DataFrame({'active': rng.random(2000) < 0.8, 'verified': flags, 'score': rng.normal(size=2000)})
+    path = str(tmp_path / 'source.parquet')
+    source.to_parquet(path)
+
+    synthetic, _ = UniversalDataGenerator(seed=1).generate_from_csv(path, 5000)
+
+    assert synthetic['active'].dtype == bool
+    assert synthetic['verified'].dtype == 'boolean'
+    assert abs(synthetic['active'].mean() - 0.8) < 0.03
+    assert abs(synthetic['verified'].isna().mean() - 0.1) < 0.03
+    assert abs(synthetic['verified'].mean() - 0.3) < 0.03
@@ -0,0 +1,62 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+from backend import readers
+from backend.readers import iter_source_chunks, read_source
+
+
+pytest.importorskip('pyarrow')
+
+
+def _write_type_change(path, rows: int, compress: bool):
+    # An integer column that holds a string well past the first block
+    lines = ['id,amount,city'] + [f'{i},{i * 3},Lahore' for i in range(rows)] + ['abc,1,Karachi']
+    text = '\n'.join(lines) + '\n'
+    if compress:
+        with gzip.open(path, 'wt') as f:
+            f.write(text)
+    else:
+        path.write_text(text)
+
+
+@pytest.mark.parametrize('name', ['late_string.csv', 'late_string.csv.gz'])
+def test_csv_with_late_type_change_is_read(tmp_path, monkeypatch, name):
+    monkeypatch.setattr(readers, 'CSV_BLOCK_BYTES', 4096)
+    path = tmp_path / name
+    _write_type_change(path, 5000, name.endswith('.gz'))
+
+    chunks = list(iter_source_chunks(str(path), 1000))
+    streamed = pd.concat(chunks, ignore_index=True)
+    assert len(streamed) == 5001
+    assert streamed['amount'].astype('int64').tolist() == [i * 3 for i in range(5000)] + [1]
+    assert str(streamed['id'].iloc[-1]) == 'abc'
+
+    full = read_source(str(path))
+    assert len(full) == 5001
+    assert str(full['id'].iloc[-1]) == 'abc'
+
+
+def test_parquet_projection_and_limit(tmp_path):
+    path = tmp_path / 'source.parquet'
+    df = pd.DataFrame({'age': pd.array([20, None, 40] * 100, dtype='Int64'), 'city': ['A', 'B', 'C'] * 100,
+                       'salary': [1.5, 2.5, 3.5] * 100})
+    df.to_parquet(path, row_group_size=50)
+
+    head = read_source(str(path), columns=['age', 'city'], limit=120)
+    assert list(head.columns) == ['age', 'city']
+    assert len(head) == 120
+    assert str(head['age'].dtype) == 'Int64'
+    assert int(head['age'].isna().sum()) == 40
+
+
+def test_source_row_count_comes_from_metadata(tmp_path):
+    frame = pd.DataFrame({'id': range(2500), 'city': ['Lahore'] * 2500})
+    frame.to_parquet(tmp_path / 'source.parquet', row_group_size=1000)
+    frame.to_feather(tmp_path / 'source.feather')
+    frame.to_csv(tmp_path / 'source.csv', index=False)
+
+    assert readers.source_row_count(str(tmp_path / 'source.parquet')) == 2500
+    assert readers.source_row_count(str(tmp_path / 'source.feather')) == 2500
+    assert readers.source_row_count(str(tmp_path / 'source.csv')) is None
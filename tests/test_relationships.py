@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from backend.data_generator import UniversalDataGenerator
+from backend.relationships import dates_of_birth
+
+
+def test_dates_of_birth_fall_in_the_birth_year():
+    ages = pd.Series([0, 1, 4, 26, 126, None, 30] * 2000)
+    dob = dates_of_birth(ages, np.random.default_rng(3), np.datetime64('2024-06-01', 'D'))
+
+    years = dob.astype('datetime64[Y]').astype(int) + 1970
+    known = ages.notna().to_numpy()
+    assert (years[known] == 2024 - ages[known].to_numpy(dtype=int)).all()
+    # An unknown age gives an unknown date of birth, not a made-up one
+    assert np.isnat(dob[~known]).all()
+    # Leap years reach Dec 31 as day 366
+    leap = dob[ages.to_numpy() == 4]
+    assert (leap.astype('datetime64[D]') == np.datetime64('2020-12-31')).any()
+    assert len(dates_of_birth(pd.Series([], dtype=float), np.random.default_rng(0), np.datetime64('2024-06-01'))) == 0
+
+
+def test_age_dob_rule_keeps_the_null_masks(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 5000
+    ages = pd.Series(rng.integers(18, 80, n), dtype='Int64')
+    dob = pd.Series(pd.Timestamp('2024-06-01') - pd.to_timedelta(ages.astype(float) * 365.25, unit='D'))
+    source = pd.DataFrame({'age': ages, 'dob': dob.dt.date})
+    source.loc[rng.random(n) < 0.2, 'dob'] = None
+    source.loc[rng.random(n) < 0.1, 'age'] = pd.NA
+    path = str(tmp_path / 'people.csv')
+    source.to_csv(path, index=False)
+
+    synthetic, _ = UniversalDataGenerator(seed=1).generate_from_csv(path, 20_000)
+
+    # The DOB null rate holds, plus the rows whose age is null
+    expected = (source['dob'].isna() | source['age'].isna()).mean()
+    assert abs(synthetic['dob'].isna().mean() - expected) < 0.03
+    assert synthetic.loc[synthetic['age'].isna(), 'dob'].isna().all()
+    known = synthetic['age'].notna() & synthetic['dob'].notna()
+    years = pd.to_datetime(synthetic.loc[known, 'dob']).dt.year
+    assert (years == pd.Timestamp.today().year - synthetic.loc[known, 'age'].astype(int)).all()
@@ -0,0 +1,33 @@
+import pytest
+
+from backend.spec import SpecError, compile_spec
+
+
+def test_dtype_must_fit_the_provider():
+    with pytest.raises(SpecError, match="cannot be cast to dtype 'date'"):
+        compile_spec({'columns': [{'name': 'signup', 'dtype': 'date'}]})
+    with pytest.raises(SpecError, match="cannot be cast to dtype 'int'"):
+        compile_spec({'columns': [{'name': 'contact', 'provider': 'email', 'dtype': 'int'}]})
+
+    plan = compile_spec({'seed': 1, 'columns': [{'name': 'dob', 'dtype': 'date'}, {'name': 'age', 'dtype': 'float'}]})
+    assert plan.generate(10)['dob'].dtype.kind == 'M'
+
+
+def test_unique_integer_range_is_checked_against_the_rows_generated():
+    spec = {'rows': 100, 'seed': 1, 'chunk_size': 300,
+            'columns': [{'name': 'code', 'unique': True, 'distribution': {'kind': 'integer', 'low': 1, 'high': 1000}}]}
+    plan = compile_spec(spec)
+
+    codes = plan.generate(1000)['code']
+    assert codes.is_unique and codes.between(1, 1000).all()
+    # A row count above spec.rows, as the CLI's --rows gives, must not run past the range
+    with pytest.raises(SpecError, match="only 1000 exist"):
+        next(plan.iter_chunks(1001))
+
+
+@pytest.mark.parametrize('distribution', [{'kind': 'normal', 'mean': 0, 'std': 1},
+                                          {'kind': 'uniform', 'low': 0, 'high': 1},
+                                          {'kind': 'categorical', 'values': ['a', 'b']}])
+def test_unique_is_rejected_for_distributions_it_cannot_follow(distribution):
+    with pytest.raises(SpecError, match='unique values cannot be drawn'):
+        compile_spec({'columns': [{'name': 'score', 'unique': True, 'distribution': distribution}]})
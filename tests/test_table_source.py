@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+import numpy as np
+
+from backend.table_source import aggregate_profile, iter_table_chunks, sample_table
+from fake_mysql import FakeConnection
+
+
+SCHEMA = {'price': {'type': 'decimal(10,2)'}, 'city': {'type': 'varchar(40)'}}
+
+
+def _respond_aggregate(query, params):
+    if 'UNION ALL' not in query and query.startswith('SELECT COUNT(*)'):
+        return [{'rows': 4, 'c0_non_null': 3, 'c0_distinct': 3, 'c0_min': Decimal('1.50'),
+                 'c0_max': Decimal('9.00'), 'c0_mean': Decimal('5.0'), 'c0_std': None,
+                 'c1_non_null': 4, 'c1_distinct': 2}]
+    if query.startswith('(SELECT 0 AS column_index'):
+        return [{'column_index': 0, 'value': 'Oslo', 'frequency': 3},
+                {'column_index': 0, 'value': 'Lima', 'frequency': 1}]
+    raise AssertionError(f"unexpected query: {query}")
+
+
+def test_aggregate_profile_runs_two_queries_and_parses_them():
+    connection = FakeConnection(_respond_aggregate)
+
+    profile = aggregate_profile(connection, 'sales', SCHEMA, top_k=5)
+
+    (totals, _), (top, _) = connection.queries
+    assert totals == ("SELECT COUNT(*) AS `rows`, COUNT(`price`) AS `c0_non_null`, "
+                      "COUNT(DISTINCT `price`) AS `c0_distinct`, MIN(`price`) AS `c0_min`, MAX(`price`) AS `c0_max`, "
+                      "AVG(`price`) AS `c0_mean`, STDDEV_POP(`price`) AS `c0_std`, COUNT(`city`) AS `c1_non_null`, "
+                      "COUNT(DISTINCT `city`) AS `c1_distinct` FROM `sales`")
+    assert 'GROUP BY `city` ORDER BY frequency DESC LIMIT 5' in top and '`price`' not in top
+
+    assert profile.loc['price', 'null_rate'] == 0.25 and profile.loc['price', 'distinct'] == 3
+    assert profile.loc['price', 'min'] == 1.5 and profile.loc['price', 'mean'] == 5.0
+    assert np.isnan(profile.loc['price', 'std'])
+    assert profile.loc['city', 'null_rate'] == 0.0
+    assert profile.loc['city', 'top_values'] == [('Oslo', 3), ('Lima', 1)]
+
+
+def test_aggregate_profile_skips_the_top_values_query_for_numeric_tables():
+    connection = FakeConnection(_respond_aggregate)
+
+    profile = aggregate_profile(connection, 'sales', {'price': SCHEMA['price']})
+
+    assert len(connection.queries) == 1 and 'top_values' not in profile.columns
+
+
+def _respond_rows(query, params):
+    if query.startswith('SELECT TABLE_ROWS'):
+        return [{'TABLE_ROWS': 25}]
+    if query.startswith('SELECT * FROM `events`'):
+        return [{'id': i, 'kind': 'click' if i % 3 else 'view'} for i in range(25)]
+    raise AssertionError(f"unexpected query: {query}")
+
+
+def test_table_chunks_stream_from_an_unbuffered_cursor():
+    connection = FakeConnection(_respond_rows)
+
+    chunks = list(iter_table_chunks(connection, 'events', chunksize=10))
+
+    cursor, = connection.cursors
+    assert cursor.tuples and cursor.fetched == [10, 10, 5, 0]
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert list(chunks[0].columns) == ['id', 'kind'] and chunks[2]['id'].tolist() == [20, 21, 22, 23, 24]
+
+
+def test_full_sampling_keeps_a_uniform_reservoir_across_chunks():
+    connection = FakeConnection(_respond_rows)
+
+    sample = sample_table(connection, 'events', sample_rows=8, method='full', rng=np.random.default_rng(0),
+                          chunksize=10)
+
+    assert len(sample) == 8 and sample['id'].is_unique and sample['id'].between(0, 24).all()
+    assert sample['id'].dtype.kind == 'i'
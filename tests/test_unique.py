@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.data_generator import UniversalDataGenerator
+from backend.parallel import ParallelGenerator
+from backend.spec import SpecError, compile_spec
+from backend.unique import SSN_SPACE, UNIQUE_FORMATS, unique_indices
+
+
+@pytest.mark.parametrize('provider', ['ssn', 'passport'])
+def test_fixed_width_formats_are_distinct_up_to_their_space_then_raise(provider):
+    domain, format_values = UNIQUE_FORMATS[provider]
+    # The last rows of the space, where a wrapping format would start repeating the first ones
+    positions = np.concatenate([np.arange(20_000), np.arange(domain - 20_000, domain)])
+    values = format_values(unique_indices(positions, domain, key=5))
+    assert len(set(values)) == len(positions)
+    assert len({len(value) for value in values}) == 1
+
+    with pytest.raises(ValueError, match="distinct"):
+        format_values(unique_indices(np.array([domain]), domain, key=5))
+
+
+def test_spec_rejects_more_unique_rows_than_the_format_holds():
+    plan = compile_spec({'seed': 1, 'columns': [{'name': 'ssn', 'unique': True},
+                                                {'name': 'passport', 'unique': True}]})
+    plan.check_rows(SSN_SPACE)
+    with pytest.raises(SpecError, match="'ssn'"):
+        plan.check_rows(SSN_SPACE + 1)
+
+
+def test_unique_columns_never_repeat_across_chunks_or_workers():
+    # 1200 rows from a 500-value pool: emails and usernames go round the pool twice with suffixes
+    columns = ['id', 'email', 'username', 'ssn', 'passport', 'serial']
+    serial = pd.concat(UniversalDataGenerator(pool_size=500, seed=4).iter_column_chunks(columns, 1200, 250))
+    parallel = pd.concat(ParallelGenerator(3, pool_size=500, generator=UniversalDataGenerator(pool_size=500, seed=4))
+                         .iter_column_chunks(columns, 1200, 250))
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    for column in columns:
+        assert serial[column].is_unique, column
+    assert serial['email'].str.contains('+', regex=False).any()
+
+
+def test_running_out_of_ssns_reaches_the_caller():
+    generator = UniversalDataGenerator(seed=1)
+    with pytest.raises(ValueError, match="distinct SSNs"):
+        generator.generate_columns_frame(['ssn'], 3, row_offset=SSN_SPACE - 1)
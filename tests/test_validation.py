@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import ks_2samp
+
+from backend.sketches import QuantileSketch, ks_statistic, sketch_values
+from backend.validation import DataValidator, QualityThresholdError, StreamingValidator
+
+
+def test_sketch_ks_is_within_its_error_bound_of_the_exact_statistic():
+    rng = np.random.default_rng(0)
+    original, synthetic = rng.normal(0, 1, 200_000), rng.normal(0.05, 1.1, 150_000)
+    exact = ks_2samp(original, synthetic).statistic
+
+    result = DataValidator('sketch', sketch_k=256, seed=1).validate_synthetic_data(
+        pd.DataFrame({'x': original}), pd.DataFrame({'x': synthetic})).iloc[0]
+
+    assert result['method'] == 'sketch'
+    assert result['ks_lower'] <= exact <= result['ks_upper']
+    assert result['ks_upper'] - result['ks_lower'] < 0.1
+
+
+def test_merged_sketches_match_a_single_pass():
+    rng = np.random.default_rng(0)
+    values = rng.exponential(2.0, 100_000)
+    merged = QuantileSketch(256)
+    for chunk in np.array_split(values, 10):
+        merged.merge(sketch_values(chunk, 256, rng), rng)
+    whole = sketch_values(values, 256, rng)
+
+    assert merged.count == whole.count == len(values)
+    assert ks_statistic(merged, whole) <= merged.rank_error() + whole.rank_error()
+
+
+def test_auto_uses_exact_ks_for_small_inputs_and_sampling_for_large_ones():
+    rng = np.random.default_rng(0)
+    validator = DataValidator('auto', exact_max_rows=5_000, sample_size=1_000, seed=1)
+    small = pd.DataFrame({'x': rng.normal(size=2_000)})
+    large = pd.DataFrame({'x': rng.normal(size=20_000)})
+
+    exact = validator.validate_synthetic_data(small, small.sample(frac=1, random_state=0)).iloc[0]
+    assert exact['method'] == 'exact' and exact['ks_lower'] == exact['ks_upper']
+
+    sampled = validator.validate_synthetic_data(large, large.sample(frac=1, random_state=0)).iloc[0]
+    assert sampled['method'] == 'sample' and sampled['ks_lower'] < sampled['ks_upper']
+
+
+def _chunks(rng, count, shift=0.0, rows=5_000):
+    for _ in range(count):
+        yield pd.DataFrame({'x': rng.normal(10 + shift, 1, rows), 'y': rng.exponential(1.0, rows)})
+
+
+def test_streaming_validator_scores_every_chunk():
+    rng = np.random.default_rng(0)
+    source = next(_chunks(rng, 1, rows=50_000))
+    monitor = StreamingValidator({col: sketch_values(source[col], rng=rng) for col in source})
+
+    written = list(monitor.observe_chunks(_chunks(rng, 4)))
+
+    assert len(written) == 4
+    assert [rows for rows, _ in monitor.history] == [5_000, 10_000, 15_000, 20_000]
+    assert monitor.quality_score == monitor.history[-1][1] and monitor.quality_score >= 80
+    assert set(monitor.results()['columns']) == {'x', 'y'}
+
+
+def test_streaming_validator_stops_once_quality_drops_below_the_threshold():
+    rng = np.random.default_rng(0)
+    source = next(_chunks(rng, 1, rows=50_000))
+    monitor = StreamingValidator({col: sketch_values(source[col], rng=rng) for col in source},
+                                 min_quality=80, min_rows=10_000)
+    drifting = (chunk for good in (True, True, False, False, False)
+                for chunk in _chunks(rng, 1, shift=0.0 if good else 3.0))
+
+    written = []
+    with pytest.raises(QualityThresholdError) as error:
+        for chunk in monitor.observe_chunks(drifting):
+            written.append(chunk)
+
+    # The failing chunk is scored before it is handed on, so it is never written
+    assert error.value.rows == 15_000 and error.value.quality_score < 80
+    assert len(written) == 2